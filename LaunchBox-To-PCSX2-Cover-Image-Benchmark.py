@@ -0,0 +1,413 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+LaunchBox To PCSX2 Cover Image - Benchmark
+  by JDHatten
+
+    Description:
+        Measures how long "LaunchBox-To-PCSX2-Cover-Image.py" takes to start up and to run each
+        stage of its work using a synthetic LaunchBox and PCSX2 install created in a temporary
+        directory. Your real LaunchBox, PCSX2 and script settings are never touched.
+
+    To Use:
+        python "LaunchBox-To-PCSX2-Cover-Image-Benchmark.py" [game counts] [runs] [options]
+
+        [game counts]   One or more library sizes separated by commas (100,1000,20000).
+        [runs]          How many times to run each benchmark.
+        --images=N      Number of LaunchBox images per game (extras are saved in region sub-folders).
+        --size=WxH      Resolution of each synthetic LaunchBox image (600x900).
+        --startup-only  Only run the startup benchmarks.
+        --stages-only   Only run the stage benchmarks.
+
+    Benchmarks:
+        Time To First Prompt    Launch the script and wait for the "--->" input prompt.
+        Time To First Cover     Drop a disc path onto the script and wait for its cover image.
+                                (Cold = no catalog snapshot saved yet, Warm = snapshot reused)
+        Catalog Load            Read all LaunchBox and PCSX2 game lists and paths (Cold/Warm).
+        Search                  One title search through the LaunchBox or full PCSX2 game list.
+        Image Index Build       Find and index every image in the chosen LaunchBox image category.
+        Image Lookup            Find all LaunchBox images for one game title.
+        Resize Cover Image      Resize one LaunchBox image and save it as a PCSX2 cover image.
+        Settings Save/Load      Write or read the settings file once.
+        Saved Choice Update     Save one menu selection to the settings file.
+        All Games               Create cover images for every game disc (the "all" command).
+                                (Cached Renditions = again, reusing the resized images cached the first time)
+
+'''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from contextlib import redirect_stdout as RedirectOutput
+import importlib.util as ImportUtil
+from io import BytesIO
+from os import devnull as DEV_NULL, read as ReadPipe
+from pathlib import Path
+import random as Random
+from shutil import copy2 as CopyFile, rmtree as RemoveTree
+from subprocess import Popen as Open, PIPE
+import statistics as Stats
+import sys as SYS
+from tempfile import mkdtemp as MakeTempDirectory
+import threading as Thread
+import time as Time
+import xml.etree.ElementTree as ET
+
+
+ROOT = Path(__file__).parent
+SCRIPT_FILE = ROOT / 'LaunchBox-To-PCSX2-Cover-Image.py'
+PLATFORM = 'Sony Playstation 2'
+
+# Defaults
+game_counts = [100]
+runs = 5
+image_size = (600, 900)  # ( Width, Height ) of each synthetic LaunchBox image.
+images_per_game = 1      # Extra images are saved in region sub-folders like LaunchBox does.
+multi_disc_every = 10    # Every Nth game has a second disc (LaunchBox "AdditionalApplication").
+sample_count = 25        # Number of titles/images used by each search, lookup and resize benchmark.
+timeout = 120            # Seconds to wait on the script before giving up.
+
+title_words = [
+    'Shadow', 'Dragon', 'Racing', 'Legend', 'Soccer', 'Street', 'Knight', 'Galaxy', 'Hunter', 'Ninja',
+    'Crystal', 'Thunder', 'Zombie', 'Kingdom', 'Rally', 'Tactics', 'Fighter', 'Pirate', 'Quest', 'Storm',
+]
+regions = ['North America', 'Europe', 'Japan', 'World']
+media_types = ['Box - Front', 'Box - Back', 'Box - 3D', 'Disc'] # Only "Box - Front" is filled with images.
+
+# Benchmark Names
+STARTUP_BENCHMARKS = ['Time To First Prompt', 'Time To First Cover (Cold)', 'Time To First Cover (Warm)']
+STAGE_BENCHMARKS = [
+    'Catalog Load (Cold)', 'Catalog Load (Warm)', 'Search (LaunchBox Titles)', 'Search (PCSX2 Titles)',
+    'Image Index Build', 'Image Lookup', 'Resize Cover Image', 'Settings Save', 'Settings Load',
+    'Saved Choice Update', 'All Games', 'All Games (Cached Renditions)',
+]
+
+
+### Create a synthetic LaunchBox and PCSX2 install along with a copy of the script (and its own settings file).
+###     (bench_dir) The directory to build everything in.
+###     (number_of_games) How many PS2 games to create.
+###     (image_dimensions) The ( Width, Height ) of each LaunchBox image.
+###     (number_of_images) How many LaunchBox images to create for each game.
+###     --> Returns a [dict] of useful fixture paths and the lists of games and disc paths.
+def createFixtures(bench_dir: Path, number_of_games: int, image_dimensions: (int, int) = image_size,
+                   number_of_images: int = images_per_game) -> dict:
+    from PIL import Image
+
+    launchbox_root = bench_dir / 'LaunchBox'
+    pcsx2_root = bench_dir / 'PCSX2'
+    image_root = launchbox_root / 'Images' / PLATFORM
+    image_folder = image_root / media_types[0]
+    cover_folder = pcsx2_root / 'covers'
+    disc_folder = bench_dir / 'PS2'
+    app_folder = bench_dir / 'Script'
+    for folder in [launchbox_root / 'Data' / 'Platforms', pcsx2_root / 'resources', pcsx2_root / 'cache',
+                   pcsx2_root / 'inis', cover_folder, disc_folder, app_folder] + [image_folder / region for region in regions]:
+        folder.mkdir(parents=True, exist_ok=True)
+    (launchbox_root / 'LaunchBox.exe').touch()
+    (pcsx2_root / 'pcsx2.exe').touch()
+
+    # [ ( ID, Title, [ ( Serial, PCSX2 Title, Disc Path ),...] ),...]
+    # Note: PCSX2's "gamelist.cache" only keeps disc paths that exist, so an empty disc file is created for each.
+    games = []
+    for n in range(number_of_games):
+        title = f'{title_words[n % len(title_words)]} {title_words[(n // len(title_words)) % len(title_words)]} {n:05d}'
+        discs = [(f'SLUS-{n:05d}', title, str(disc_folder / f'{title}.iso'))]
+        if multi_disc_every and n % multi_disc_every == multi_disc_every - 1:
+            discs.append((f'SLES-{n:05d}', f'{title} (Disc 2)', str(disc_folder / f'{title} (Disc 2).iso')))
+        games.append((f'{n:08d}-0000-0000-0000-000000000000', title, discs))
+        for serial, pcsx2_title, disc_path in discs:
+            Path(disc_path).touch()
+
+    # LaunchBox Data
+    root = ET.Element('LaunchBox')
+    for game_id, title, discs in games:
+        element_game = ET.SubElement(root, 'Game')
+        ET.SubElement(element_game, 'ID').text = game_id
+        ET.SubElement(element_game, 'Title').text = title
+        ET.SubElement(element_game, 'ApplicationPath').text = discs[0][2]
+    for game_id, title, discs in games:
+        for serial, pcsx2_title, disc_path in discs[1:]:
+            element_app = ET.SubElement(root, 'AdditionalApplication')
+            ET.SubElement(element_app, 'GameID').text = game_id
+            ET.SubElement(element_app, 'ApplicationPath').text = disc_path
+            ET.SubElement(element_app, 'EmulatorId').text = 'PCSX2'
+    ET.ElementTree(root).write(launchbox_root / 'Data' / 'Platforms' / f'{PLATFORM}.xml', encoding='utf-8', xml_declaration=True)
+
+    root = ET.Element('LaunchBox')
+    for media_type in media_types:
+        element_folder = ET.SubElement(root, 'PlatformFolder')
+        ET.SubElement(element_folder, 'MediaType').text = media_type
+        ET.SubElement(element_folder, 'FolderPath').text = str(image_root / media_type)
+        ET.SubElement(element_folder, 'Platform').text = PLATFORM
+    ET.ElementTree(root).write(launchbox_root / 'Data' / 'Platforms.xml', encoding='utf-8', xml_declaration=True)
+
+    # Every image looks the same, so only encode it once. A unique tail (ignored by JPEG decoders) is added to
+    # each file so every image still has its own content hash like real LaunchBox images do.
+    image_data = BytesIO()
+    Image.new('RGB', image_dimensions, (40, 80, 120)).save(image_data, 'JPEG', quality=90)
+    image_data = image_data.getvalue()
+    for game_id, title, discs in games:
+        for i in range(number_of_images):
+            folder = image_folder if i == 0 else image_folder / regions[(i - 1) % len(regions)]
+            (folder / f'{title}-{i + 1:02d}.jpg').write_bytes(image_data + f'{title}-{i}'.encode())
+
+    # PCSX2 Data
+    with open(pcsx2_root / 'resources' / 'GameIndex.yaml', 'w', encoding='utf-8') as file:
+        for game_id, title, discs in games:
+            for serial, pcsx2_title, disc_path in discs:
+                file.write(f'{serial}:\n  name: "{pcsx2_title}"\n  region: "NTSC-U"\n')
+    with open(pcsx2_root / 'cache' / 'gamelist.cache', 'w', encoding='ISO-8859-1') as file:
+        for game_id, title, discs in games:
+            for serial, pcsx2_title, disc_path in discs:
+                file.write(f'{disc_path}\n{serial}\n{pcsx2_title}\n')
+    with open(pcsx2_root / 'inis' / 'PCSX2.ini', 'w', encoding='utf-8') as file:
+        file.write(f'[Folders]\nCache = {pcsx2_root / "cache"}\nCovers = {cover_folder}\n')
+    (pcsx2_root / 'inis' / 'custom_properties.ini').touch()
+
+    # Script and its settings file
+    script = app_folder / SCRIPT_FILE.name
+    CopyFile(SCRIPT_FILE, script)
+    root = ET.Element('Data')
+    element_settings = ET.SubElement(root, 'Settings')
+    element_launchbox = ET.SubElement(element_settings, 'LaunchBox')
+    ET.SubElement(element_launchbox, 'Root').text = str(launchbox_root)
+    ET.SubElement(element_launchbox, 'MediaType').text = media_types[0]
+    element_pcsx2 = ET.SubElement(element_settings, 'PCSX2')
+    ET.SubElement(element_pcsx2, 'Root').text = str(pcsx2_root)
+    ET.SubElement(element_pcsx2, 'ImageSize').text = '720'
+    ET.SubElement(element_pcsx2, 'Overwrite').text = 'True'
+    ET.ElementTree(root).write(app_folder / f'{script.stem}-Settings.xml', encoding='utf-8', xml_declaration=True)
+
+    return {
+        'script' : script,
+        'cover_folder' : cover_folder,
+        'image_folder' : image_folder,
+        'number_of_images' : number_of_images,
+        'games' : [(title, [disc[2] for disc in discs]) for game_id, title, discs in games],
+        'disc_paths' : [disc[2] for game_id, title, discs in games for disc in discs],
+        'serials' : {disc[2] : disc[0] for game_id, title, discs in games for disc in discs},
+    }
+
+
+### Check the script reads the fixtures as intended (every disc path of PCSX2's game list found with its serial),
+### so disc path matching is what gets timed and not the title search fallback.
+###     (fixtures) The fixture dictionary from createFixtures().
+def checkFixtures(fixtures: dict):
+    script = loadScript(fixtures['script'])
+    user_games = {game[script.DISC_PATH][0] : game[script.ID] for game in script.pcsx2_user_game_list}
+    if user_games != fixtures['serials'] or len(script.pcsx2_user_game_list) != len(fixtures['serials']):
+        raise RuntimeError(f'PCSX2 game list read wrong: {len(script.pcsx2_user_game_list)} game(s) read, '
+                           f'{len(fixtures["serials"])} expected.')
+    for disc_path in fixtures['disc_paths']:
+        if not script.getPCSX2GameTitleFrom(disc_path, script.DISC_PATH):
+            raise RuntimeError(f'No PCSX2 title matched by disc path: {disc_path}')
+    script.catalog_snapshot_file.unlink(missing_ok=True) # Keep the first startup benchmark cold.
+
+
+### Run the script and time how long it takes until some text is seen in its output.
+###     (script) The script to run.
+###     (arguments) Command line arguments (dropped disc paths).
+###     (wait_for_text) Stop the clock once this text is printed.
+###     (user_input) Any input to send the script right away (menu selections).
+###     --> Returns a [float] Seconds
+def timeScriptUntil(script: Path, arguments: list, wait_for_text: str, user_input: str = '') -> float:
+    output = bytearray()
+    found = Thread.Event()
+    wait_for_bytes = wait_for_text.encode()
+
+    start = Time.perf_counter()
+    process = Open([SYS.executable, '-u', str(script), *arguments], stdin=PIPE, stdout=PIPE, stderr=PIPE, cwd=script.parent)
+    if user_input:
+        process.stdin.write(user_input.encode())
+        process.stdin.flush()
+
+    # The "--->" prompt has no new line, so read raw chunks instead of lines.
+    def readOutput():
+        while True:
+            chunk = ReadPipe(process.stdout.fileno(), 4096)
+            if not chunk:
+                break
+            output.extend(chunk)
+            if wait_for_bytes in output:
+                found.set()
+        found.set()
+
+    reader = Thread.Thread(target=readOutput, daemon=True)
+    reader.start()
+    found.wait(timeout)
+    elapsed = Time.perf_counter() - start
+
+    try:
+        process.communicate(b'\n', timeout=timeout) # A blank input closes the script.
+    except Exception:
+        process.kill()
+
+    if wait_for_bytes not in output:
+        print(output.decode(errors='replace')[-2000:])
+        raise RuntimeError(f'The script never printed "{wait_for_text}".')
+    return elapsed
+
+
+### Time startup of the script to its first input prompt and to its first cover image.
+###     (fixtures) The fixture dictionary from createFixtures().
+###     (number_of_runs) How many times to run each benchmark.
+###     --> Returns a [dict] Benchmark Name: List of Seconds
+def benchmarkStartup(fixtures: dict, number_of_runs: int) -> dict:
+    results = {benchmark : [] for benchmark in STARTUP_BENCHMARKS}
+    snapshot_file = fixtures['script'].parent / f'{fixtures["script"].stem}-Catalogs.cache'
+    image_selection = '1\n' if fixtures['number_of_images'] > 1 else '' # Pick the first image when asked.
+    for run in range(number_of_runs):
+        results['Time To First Prompt'].append(timeScriptUntil(fixtures['script'], [], '--->'))
+
+        disc_path = fixtures['disc_paths'][run % len(fixtures['disc_paths'])]
+        for benchmark in ['Time To First Cover (Cold)', 'Time To First Cover (Warm)']:
+            if 'Cold' in benchmark:
+                snapshot_file.unlink(missing_ok=True)
+            for cover in fixtures['cover_folder'].glob('*'):
+                cover.unlink()
+            results[benchmark].append(
+                timeScriptUntil(fixtures['script'], [disc_path], 'Successfully To The PCSX2 Folder', image_selection)
+            )
+    return results
+
+
+### Import a copy of the script so its functions can be timed directly, then load its settings and catalogs.
+###     (script) The copy of the script created by createFixtures().
+###     --> Returns the script [module]
+def loadScript(script: Path):
+    spec = ImportUtil.spec_from_file_location('launchbox_to_pcsx2_cover_image', script)
+    module = ImportUtil.module_from_spec(spec)
+    SYS.modules[spec.name] = module # Needed to pickle its GameRecords into the catalog snapshot.
+    spec.loader.exec_module(module)
+    with open(DEV_NULL, 'w') as quiet, RedirectOutput(quiet):
+        module.loadSettings()
+        module.waitForCatalogs()
+    return module
+
+
+### Time a function once for every item in a list.
+###     (function) The function to time, called with each item.
+###     (items) List of items (or tuples of arguments).
+###     --> Returns a [list] of Seconds
+def timeEach(function, items: list) -> list:
+    times = []
+    for item in items:
+        arguments = item if isinstance(item, tuple) else (item,)
+        start = Time.perf_counter()
+        function(*arguments)
+        times.append(Time.perf_counter() - start)
+    return times
+
+
+### Time each stage of the script's work by calling its functions directly (in this process).
+###     (fixtures) The fixture dictionary from createFixtures().
+###     (number_of_runs) How many times to run each benchmark.
+###     --> Returns a [dict] Benchmark Name: List of Seconds
+def benchmarkStages(fixtures: dict, number_of_runs: int) -> dict:
+    results = {benchmark : [] for benchmark in STAGE_BENCHMARKS}
+    script = loadScript(fixtures['script'])
+    snapshot_file = script.catalog_snapshot_file
+    samples = Random.Random(0).sample(fixtures['games'], min(sample_count, len(fixtures['games'])))
+    sample_titles = [title for title, disc_paths in samples]
+    resize_folder = fixtures['script'].parent / 'Resized'
+    resize_folder.mkdir(exist_ok=True)
+
+    # Reading the catalogs into empty lists, just like a fresh start.
+    def loadCatalogs(cold: bool):
+        for game_list in [script.launchbox_game_list, script.launchbox_media_type_list,
+                          script.pcsx2_full_game_list, script.pcsx2_user_game_list]:
+            game_list.clear()
+        if cold:
+            snapshot_file.unlink(missing_ok=True)
+        script.catalog_snapshot.data = None
+        start = Time.perf_counter()
+        script.updatePathsUsing(script.LAUNCHBOX_ROOT)
+        script.updatePathsUsing(script.PCSX2_ROOT)
+        return Time.perf_counter() - start
+
+    with open(DEV_NULL, 'w') as quiet, RedirectOutput(quiet):
+        for run in range(number_of_runs):
+            results['Catalog Load (Cold)'].append(loadCatalogs(True))
+            results['Catalog Load (Warm)'].append(loadCatalogs(False))
+
+            results['Search (LaunchBox Titles)'] += timeEach(
+                lambda title: script.searchFor(title, script.launchbox_game_list, script.TITLE), sample_titles
+            )
+            results['Search (PCSX2 Titles)'] += timeEach(
+                lambda title: script.searchFor(title, script.pcsx2_full_game_list), sample_titles
+            )
+
+            results['Image Index Build'] += timeEach(script.buildImageIndex, [script.getImageFolders()])
+            results['Image Lookup'] += timeEach(script.findImagesFor, sample_titles)
+
+            sample_images = [script.findImagesFor(title)[0] for title in sample_titles]
+            results['Resize Cover Image'] += timeEach(
+                lambda image: script.resizeCoverImage(image, script.resize_cover_image, resize_folder / image.name),
+                sample_images
+            )
+
+            results['Settings Save'] += timeEach(lambda: script.saveSettings(False), [()])
+            results['Settings Load'] += timeEach(script.loadSettings, [()])
+            script.waitForCatalogs() # Only reloads catalogs (in the background) if a root path changed.
+            results['Saved Choice Update'] += timeEach(
+                lambda title, disc_path: script.updateSavedChoice(title, disc_path, 'Image', run + 1),
+                [(title, disc_paths[0]) for title, disc_paths in samples]
+            )
+
+            RemoveTree(script.rendition_cache_folder, ignore_errors=True)
+            script.rendition_cache_bytes = None
+            for benchmark in ['All Games', 'All Games (Cached Renditions)']:
+                for cover in fixtures['cover_folder'].glob('*'):
+                    cover.unlink()
+                start = Time.perf_counter()
+                script.processGameDiscs(script.iterateGameDiscs(script.launchbox_game_list), False, True)
+                results[benchmark].append(Time.perf_counter() - start)
+
+    script.waitForCatalogs()
+    return results
+
+
+### Print benchmark results in a table.
+###     (results) Benchmark Name: List of Seconds
+###     (title) Shown above the table.
+def printResults(results: dict, title: str = ''):
+    if title:
+        print(f'\n{title}')
+    print(f'\n{"Benchmark":<32}{"Min":>10}{"Median":>10}{"Max":>10}')
+    for name, times in results.items():
+        if times:
+            print(f'{name:<32}{min(times):>9.3f}s{Stats.median(times):>9.3f}s{max(times):>9.3f}s')
+
+
+### Script Starts Here
+if __name__ == '__main__':
+    run_startup = True
+    run_stages = True
+    arguments = [argument for argument in SYS.argv[1:] if not argument.startswith('--')]
+    for option in [argument.lower() for argument in SYS.argv[1:] if argument.startswith('--')]:
+        if option.startswith('--images='):
+            images_per_game = max(1, int(option.split('=')[1]))
+        elif option.startswith('--size='):
+            image_size = tuple(int(number) for number in option.split('=')[1].split('x'))
+        elif option == '--startup-only':
+            run_stages = False
+        elif option == '--stages-only':
+            run_startup = False
+    if len(arguments) > 0:
+        game_counts = [int(game_count) for game_count in arguments[0].split(',')]
+    if len(arguments) > 1:
+        runs = int(arguments[1])
+
+    for game_count in game_counts:
+        bench_dir = Path(MakeTempDirectory(prefix='lb2pcsx2-bench-'))
+        try:
+            print(f'\nCreating fixtures for {game_count} games in "{bench_dir}"...')
+            fixtures = createFixtures(bench_dir, game_count, image_size, images_per_game)
+            checkFixtures(fixtures)
+            results = {}
+            if run_startup:
+                results.update(benchmarkStartup(fixtures, runs))
+            if run_stages:
+                results.update(benchmarkStages(fixtures, runs))
+            printResults(results, f'{game_count} Games, {len(fixtures["disc_paths"])} Discs, '
+                                  f'{images_per_game} Image(s) Per Game ({image_size[0]}x{image_size[1]})')
+        finally:
+            RemoveTree(bench_dir, ignore_errors=True)
@@ -43,23 +43,58 @@ uppercase_roman_numerals_only = True
 
 
 
+import atexit as AtExit
+from concurrent.futures import Future, ThreadPoolExecutor, wait as WaitForFutures, FIRST_COMPLETED
+from contextlib import contextmanager as ContextManager
 import configparser as CP
+from functools import wraps as Wraps
+import hashlib as HashLib
+import json as JSON
+from io import BytesIO, StringIO
 import math as Math
+import pickle as Pickle
 from pathlib import Path
-try:
-    from PIL import Image, UnidentifiedImageError
-    pillow_installed = True
-except ModuleNotFoundError:
-    pillow_installed = False
-from os import environ as ENV, get_terminal_size as TSize
+from queue import Queue, Empty as QueueEmpty
+from urllib.parse import parse_qs as ParseQuery, urlsplit as SplitURL
+from itertools import count as Counter
+from os import environ as ENV, get_terminal_size as TSize, getpid as PID, replace as ReplaceFile
+from os import link as HardLink, symlink as SymbolicLink, urandom as RandomBytes, scandir as ScanDirectory, stat as StatPath
+from os import open as OpenFileDescriptor, O_CREAT, O_EXCL, O_WRONLY, kill as SignalProcess
+from os.path import samefile as SameFile, splitext as SplitExtension
 import re as RE
-from shutil import copy2 as CopyFile
+import socket as Socket
+from shutil import copy2 as CopyFile, copystat as CopyFileStats, SameFileError
 from subprocess import Popen as Open
 import sys as SYS
-import tkinter as TK
-from tkinter import filedialog as FileDialog
+import threading as Thread
+try:
+    from fcntl import ioctl as IOControl # Only used for reflinks (Linux).
+    from fcntl import lockf as LockFileRange, LOCK_EX, LOCK_UN
+except ModuleNotFoundError:
+    IOControl = None
+    LockFileRange = None
+try:
+    import msvcrt as MSVCRT # Only used for file locking (Windows).
+except ModuleNotFoundError:
+    MSVCRT = None
+import time as Time
 import xml.etree.ElementTree as ET
 
+# Heavy modules only needed for resizing images or opening dialog windows, imported on first use.
+# See: importPillow() and importTkinter()
+Image = None
+UnidentifiedImageError = None
+pillow_installed = None  # Unknown until Pillow is first needed.
+TK = None
+FileDialog = None
+WatchdogObserver = None         # Optional, see: importWatchdog()
+WatchdogEventHandler = None
+CProfile = None                 # Only used with "--profile" and "--trace-memory", see: startProfiling()
+PStats = None
+TraceMalloc = None
+HTTPServer = None               # Only used with "--api", see: runAPIServer()
+HTTPRequestHandler = None
+
 
 # Note: Many of these variables below are defaults and any changes made while this script
 #       is running will overwrite these defaults and save them to file.
@@ -77,6 +112,37 @@ pcsx2_root     = rf'{ENV.get("ProgramFiles")}\PCSX2'
 #       "Screenshot - Game Title", "Screenshot - Gameplay", "Cart - Front",...
 launchbox_media_type = 'Box - Front'
 
+# When the image category above is set to "Choose From Any Category (All)", try these categories in order and use
+# the first one with any images for the game, instead of offering images from every category at once.
+# Note: Categories are only searched (and indexed) when a game needs them. Leave empty ([]) to use every category.
+media_type_fallback = ['Box - Front', 'Box - Front - Reconstructed', 'Box - 3D']
+
+# How to pick a LaunchBox image when several are found for a game disc during unattended runs (shards, daemon,
+# API,...) and no image was chosen for it before. Each rule only breaks ties left by the rules before it.
+# The picked image is saved like any other choice. Leave empty ([]) to skip these discs until chosen by hand.
+# Note: Normal "all" runs still ask, unless "auto_image_choice_in_all" below is set.
+#   "Region"      In the first region folder found in "preferred_image_regions" below.
+#   "Aspect"      Closest to the shape of a PS2 box cover.
+#   "Resolution"  Most pixels (read from the image file header only).
+#   "Newest"      Most recently changed image file.
+auto_image_choice = ['Region', 'Aspect', 'Resolution', 'Newest']
+
+# LaunchBox image region folders to prefer when picking an image, best first. Images not in any of these
+# region folders come after them.
+preferred_image_regions = ['North America', 'United States', 'World']
+
+# Also pick images by the "auto_image_choice" rules above (and save the pick) during normal "all" runs, instead of
+# asking which image to use for every game disc with several images. PCSX2 titles are still asked for.
+auto_image_choice_in_all = False
+
+# Treat LaunchBox images that look the same (the same picture saved under other names, sizes or categories) as one
+# image, only offering/using the largest of them. Compares a small perceptual hash (dHash) of each image, saved so
+# unchanged images are only read once. Needs the Pillow module.
+collapse_similar_images = False
+
+# How many of the 64 bits of two perceptual hashes can differ for their images to still look the same (0 = identical).
+similar_image_distance = 4
+
 # It's recommended you resize any large images to 720p or smaller.
 # Enter 0 if you do not want the image file resized.
 # Note: If the LaunchBox image is smaller than the resize, it will not be modified at all.
@@ -85,21 +151,67 @@ resize_cover_image = 720
 # If your always changeing PCSX2 cover images, save time setting this to True.
 always_overwrite = False
 
+# How to output a cover image when no resizing is needed (resize set to 0 or image already small enough).
+#   "Copy"          Copy the LaunchBox image (always works).
+#   "Hard Link"     Link to the LaunchBox image without using any extra disk space (same drive only).
+#   "Symbolic Link" Point to the LaunchBox image (may need admin rights or developer mode on Windows).
+#   "Reflink"       Copy-on-write clone of the LaunchBox image (Btrfs/XFS/etc. on Linux only).
+# Note: If linking fails (different drives, unsupported file system,...) the image will just be copied.
+cover_output_mode = 'Copy'
+
 # Auto-search for both Arabic and Roman numerals ("2" will also search for "II" and vice-versa).
 # Note: Only works for numbers between 1-20 or I-XX.
 search_both_number_systems = True
 
+# Save a JSON run report (timings and counts) to this file after every "all" or multi-disc run.
+# Each report is added as a new line so runs can be compared over time. Leave blank to only print it.
+# Note: Can also be set when starting this script with "--report-json=<file path>".
+run_report_file = ''
+
+# Set to True (or start this script with "--dry-run") to only show what an "all" run, title search or dropped discs
+# would do: how many covers would be created, overwritten, resized or skipped, bytes read/written and an estimated time.
+# Nothing is written to the PCSX2 cover folder or saved as a choice and no image menus are shown.
+# Note: Can't be used with "--watch", "--api" or "--daemon", which only exist to write cover images.
+dry_run = False
+
+# Keep resized copies ("renditions") of LaunchBox images so changing "resize_cover_image" back and forth, or
+# creating the same covers again, reuses them instead of resizing the full-size images all over again.
+# Renditions are found by image content, resize height, filter and format. Once the cache grows past this size
+# (in megabytes) the least recently used renditions are removed. Set to 0 to not cache any renditions.
+rendition_cache_size_mb = 512
+
+# Number of cover images resized/copied at the same time (worker threads) during "all" or multi-disc runs.
+cover_workers = 2
+
+# Most cover images allowed "in flight" (waiting for or being resized/copied) at once. Matching more game discs
+# waits until one finishes, keeping memory use flat for any size library. Each in flight image may be fully
+# decoded in memory while resizing, so keep this low when using very large LaunchBox images.
+max_images_in_flight = 4
+
+# Number of folders listed at the same time while finding LaunchBox images (worker threads). Each image category
+# and region has its own folder, so listing many at once is much faster when LaunchBox is on a network drive.
+folder_scan_workers = 8
+
+# Local port used by the HTTP/JSON API (start this script with "--api" or "--api=<port>").
+# Note: Only connections from this computer are accepted, and every request must send the secret token saved in the
+#       "<script name>-API.json" file (readable only by you) as an "X-API-Token" header.
+api_port = 8642
+
+# How often (in seconds) to check for LaunchBox image changes while in "watch" mode.
+# Note: Only used if the "watchdog" Python module is not installed, otherwise changes are seen instantly.
+watch_poll_interval = 5
+
 # Path to LaunchBox's Sony PlayStation 2 XML file. (Shouldn't need changing)
-launchbox_ps2_xml = rf'{launchbox_root}\Data\Platforms\Sony Playstation 2.xml'
+launchbox_ps2_xml = str(Path(launchbox_root, 'Data', 'Platforms', 'Sony Playstation 2.xml'))
 
 # Path to LaunchBox's Platform XML file. (Shouldn't need changing)
-launchbox_platform_xml = rf'{launchbox_root}\Data\Platforms.xml'
+launchbox_platform_xml = str(Path(launchbox_root, 'Data', 'Platforms.xml'))
 
 # File with database scraped list of all PS2 game titles usable in PCSX2.
-pcsx2_game_database = rf'{pcsx2_root}\resources\GameIndex.yaml'
+pcsx2_game_database = str(Path(pcsx2_root, 'resources', 'GameIndex.yaml'))
 
 # File with all user's PS2 games scanned and recognized by PCSX2.
-pcsx2_game_list_file = rf'{pcsx2_root}\cache\gamelist.cache'
+pcsx2_game_list_file = str(Path(pcsx2_root, 'cache', 'gamelist.cache'))
 
 # Used to get any custom game titles and update the "pcsx2_user_game_list".
 # Note: PCSX2 stores file paths in config (ini file) section headings. This is bad for file names
@@ -108,16 +220,16 @@ pcsx2_game_list_file = rf'{pcsx2_root}\cache\gamelist.cache'
 #       custom name, it won’t show anyways. So it will just name the image whatever wrong name
 #       PCSX2 has chosen so it will at least show up in PCSX2. Hopefully the PCSX2 devs fix
 #       this soon, maybe use a YAML or XML file instead of an ini file.
-pcsx2_custom_game_title_file = rf'{pcsx2_root}\inis\custom_properties.ini'
+pcsx2_custom_game_title_file = str(Path(pcsx2_root, 'inis', 'custom_properties.ini'))
 
 # Used to get the current PCSX2 cover image folder.
-pcsx2_settings_file = rf'{pcsx2_root}\inis\PCSX2.ini'
+pcsx2_settings_file = str(Path(pcsx2_root, 'inis', 'PCSX2.ini'))
 
 # PCSX2's default cover image directory. Only used as a fallback.
-pcsx2_image_folder = rf'{pcsx2_root}\PCSX2\covers'
+pcsx2_image_folder = str(Path(pcsx2_root, 'PCSX2', 'covers'))
 
 # LaunchBox's default PS2 image directory. Only used as a fallback.
-launchbox_image_folder = rf'{launchbox_root}\Images\Sony Playstation 2\{launchbox_media_type}'
+launchbox_image_folder = str(Path(launchbox_root, 'Images', 'Sony Playstation 2', launchbox_media_type))
 
 ROOT = Path(__file__).parent
 pcsx2_game_database = Path(pcsx2_game_database)
@@ -125,12 +237,71 @@ pcsx2_custom_game_title_file = Path(pcsx2_custom_game_title_file)
 pcsx2_settings_file = Path(pcsx2_settings_file)
 full_pcsx2_game_list_file = ROOT / 'full_pcsx2_game_list.txt'
 settings_file = ROOT / f'{Path(__file__).stem}-Settings.xml'
+catalog_snapshot_file = ROOT / f'{Path(__file__).stem}-Catalogs.cache'
+batch_journal_file = ROOT / f'{Path(__file__).stem}-Journal.jsonl' # Each shard uses its own, see: getShardJournalFile()
+rendition_cache_folder = ROOT / f'{Path(__file__).stem}-Renditions'
+daemon_file = ROOT / f'{Path(__file__).stem}-Daemon.json' # Port and secret token of the running daemon.
+api_file = ROOT / f'{Path(__file__).stem}-API.json' # Port and secret token of the running API.
+resolved_matches_file = ROOT / f'{Path(__file__).stem}-Matches.json'
+source_hashes_file = rendition_cache_folder / 'Source-Hashes.cache'
+settings_lock_file = ROOT / f'{Path(__file__).stem}-Settings.lock'
+image_hashes_file = ROOT / f'{Path(__file__).stem}-Image-Hashes.cache'
 last_ps2_directory = ROOT
 pcsx2_full_game_list = []
-pcsx2_user_game_list = []       # [ [ ID, TITLE, DISC_PATH ],...]
-launchbox_game_list = []        # [ [ ID, TITLE, DISC_PATH ],...]
+pcsx2_full_game_titles = set()  # Same titles as "pcsx2_full_game_list" for quick lookups.
+pcsx2_user_game_list = []       # [ GameRecord( ID, TITLE, DISC_PATH ),...]
+launchbox_game_list = []        # [ GameRecord( ID, TITLE, DISC_PATH ),...]
+pcsx2_games_by_id = {}          # { ID : GameRecord } Lookup indexes into the game lists above.
+pcsx2_games_by_disc_path = {}   # { Disc Path : GameRecord }
+launchbox_games_by_id = {}      # { ID : GameRecord }
+launchbox_games_by_disc_path = {} # { Disc Path : [ GameRecord,...] }
+launchbox_games_by_image_key = {} # { Image Key : [ GameRecord,...] }
+image_index = {}                # { Image Folder : { Image Key : [ Image Path,...] } } LaunchBox images in each folder indexed so far.
+image_index_directories = {}    # { Image Folder : { Directory Path : Modified Time } } Used to notice added/removed images.
+image_index_checked = 0         # Last time "image_index_directories" were checked for changes.
+image_index_lock = Thread.RLock()
 launchbox_media_type_list = []  # [ [ TYPE, PATH ],...]
+catalog_loaders = {}            # { LAUNCHBOX_ROOT or PCSX2_ROOT : ThreadPoolExecutor } One background thread per app.
+catalog_futures = {}            # { LAUNCHBOX_ROOT or PCSX2_ROOT : [ Future,...] } Tasks submitted per app not waited for yet.
+folder_scanner = None           # ThreadPoolExecutor listing folders for scanFolderTree(), started on first use.
+folder_scanner_lock = Thread.Lock()
+catalog_roots = {}              # { LAUNCHBOX_ROOT or PCSX2_ROOT : Root Path } Root path each catalog was loaded (or is loading) from.
+settings_batch_depth = 0        # Inside settingsBatch(), file saves and catalog loads wait until the batch ends.
+settings_batch_catalogs = {}    # { LAUNCHBOX_ROOT or PCSX2_ROOT : Reload } Catalogs to load once the batch ends.
+settings_batch_save = False     # A save was asked for during the batch.
+settings_unsaved = False        # Settings changed since last loaded/saved.
+run_report_timings = {}         # { Stage : [ Calls, Seconds ] } Time spent in each stage since the last run report.
+run_report_counters = {}        # { Counter : Count }
+run_report_started = Time.time()
+run_report_lock = Thread.Lock()
+batch_journal = None            # Open journal file while an "all" run is recording each completed disc.
+batch_journal_lock = Thread.Lock()
+loaded_catalog_signatures = {}  # { LAUNCHBOX_ROOT or PCSX2_ROOT : File Signatures } Catalog files as last loaded by the daemon/API.
+api_jobs = {}                   # { Job ID : { 'id', 'status', 'games', 'discs', 'covers_created',... } } Sync jobs sent to the API.
+api_jobs_lock = Thread.Lock()   # Held while reading or changing "api_jobs" (and any job in it).
+api_job_queue = Queue()         # Job IDs waiting to be run.
+api_job_ids = Counter(1)
+api_resolve_queue = Queue()     # ( [ LaunchBox ID,...], Future ) "/resolve" requests waiting to be resolved.
+api_catalog_lock = Thread.Lock() # Held while the API reads catalogs or they're being reloaded.
+rendition_cache_bytes = None    # Total size of all cached renditions, counted on first use.
+rendition_cache_lock = Thread.Lock()
+resolved_matches = None         # { LaunchBox ID : { Disc Path : { 'title' : PCSX2 Title, 'images' : { Media Type : Image Path } } } }
+resolved_matches_changed = set() # LaunchBox IDs with matches not saved to file yet.
+resolved_matches_lock = Thread.Lock()
+lock_files = {}                 # { Lock File Path : Open File } Kept open, closing any handle drops all of a process's locks.
+slot_locks = {}                 # { ( Lock File Path, Slot ) : Lock } Lock files only keep other processes out, not threads.
+lock_files_lock = Thread.Lock()
+batch_shard = None              # ( Shard Number, Shard Count ) Only this slice of all games is processed, see: "--shard=i/n".
+batch_journal_failures = 0      # Discs that failed (not recorded as completed) in the current journaled run.
+planning_covers = False         # While planning a dry run, matches found aren't saved as choices.
+cpu_profiler = None             # cProfile.Profile while profiling with "--profile".
+cpu_profile_file = None         # Path the CPU profile stats (pstats) are saved to.
 supported_images = ['.jpg','.jpeg', '.jpe', '.png', '.webp']
+temp_cover_counter = Counter()  # Keeps temp cover file names unique within this process.
+case_sensitive_folders = {}     # { Folder Path : bool } Whether file names in a folder are case sensitive.
+cover_index = {}                # { Cover Folder : { Cover Name (casefolded, no extension) : { Image Path,...} } } Listed once per run.
+cover_index_lock = Thread.Lock()
+image_details = {}              # { Image Path : ( Size, Modified Time, Width, Height ) } Used to pick images, see: chooseBestImage().
 roman_numerals_list = ['0','I','II','III','IV','V','VI','VII','VIII','IX','X','XI','XII','XIII','XIV','XV','XVI','XVII','XVIII','XIX','XX']
 arabic_numerals_list = ['0','1','2','3','4','5','6','7','8','9','10','11','12','13','14','15','16','17','18','19','20']
 re_roman_numerals = RE.compile(r'\b(xx|xix|xviii|xvii|xvi|xiv|xiii|xii|xi|ix|viii|vii|vi|iv|xv|x|v|iii|ii|i)\b')
@@ -142,11 +313,33 @@ SCRIPT_TITLE   = 'LaunchBox To PCSX2 Cover Image'
 SCRIPT_VERSION = 'v1.0'
 SCRIPT_CREATOR = 'by JDHatten'
 MEDIA_TYPE_ALL = 'Choose From Any Category (All)'
+CATALOG_SNAPSHOT_VERSION = 3    # Increase whenever the layout of any saved catalog data changes.
+TEMP_COVER_TAG = '.lbtmp'       # New covers are written to "<name>.<pid>-<n>-<host>.lbtmp.<ext>" before replacing.
+HOST_TAG = HashLib.sha1(Socket.gethostname().encode('utf-8')).hexdigest()[:6] # Computers sharing a cover folder use different temp names.
+IMAGE_INDEX_RECHECK_TIME = 2.0  # Seconds before image folders are checked again for added/removed images.
+COVER_ASPECT_RATIO = 0.7        # Width / height of a PS2 box cover.
+COVER_ASPECT_RATIO_STEP = 0.05  # Aspect ratios this close are treated as the same shape when picking an image.
+PERCEPTUAL_HASH_SIZE = 8        # Width and height of the brightness grid compared for a perceptual hash (8 = 64 bits).
+RE_IMAGE_NUMBER = RE.compile(r'-\d{2,}$') # LaunchBox numbers images of the same game: "Title-01", "Title-02",...
+WATCH_SETTLE_TIME = 1.0         # Seconds without new file events before processing changes in "watch" mode.
+RE_TEMP_COVER_TAG = RE.compile(r'\.(\d+)-\d+-([0-9a-f]{6})' + RE.escape(TEMP_COVER_TAG) + r'\.[^.]+$') # Finds (pid, host) in a temp cover name.
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000 # Windows access right used to check if a process is still running.
+STILL_ACTIVE = 259              # Windows exit code of a process that hasn't ended.
+STALE_TEMP_COVER_AGE = 6 * 3600 # Seconds before a temp cover is removed whatever computer or process made it.
+FICLONE = 0x40049409            # Linux ioctl request code to clone (reflink) a file.
+DAEMON_CONNECT_TIMEOUT = 0.5    # Seconds to wait for a running daemon before starting normally.
+API_JOB_EXPIRE_TIME = 3600      # Seconds a finished API sync job can still be looked up.
+API_FINISHED_JOBS_KEPT = 200    # Most finished API sync jobs kept (oldest removed first).
+RENDITION_CACHE_TRIM = 0.9      # When the rendition cache is full, remove renditions until it's this full.
+COVER_LOCK_FILE = '.lbcovers.lock' # Lock file in the PCSX2 cover folder shared by all instances (and computers) writing covers.
+COVER_LOCK_SLOTS = 64           # Cover images are locked by name using this many lock slots (byte ranges).
+FILE_ATTRIBUTE_HIDDEN = 0x2     # Windows file attribute, the leading dot only hides a file on Linux/macOS.
+PROFILE_TOP_COUNT = 20          # Number of functions/lines shown when profiling ends.
 
 # Game List Data Indexes
 ID = 0          # -> String
 TITLE = 1       # -> String
-DISC_PATH = 2   # -> String or List
+DISC_PATH = 2   # -> DiscPaths (Tuple of Strings)
 
 # Media Type Indexes
 TYPE = 0        # -> String
@@ -168,6 +361,13 @@ MODIFY_BY_PERCENT = 3  # Percent of current size (50% = current size * 0.5).
 UPSCALE = 4            # Only increase to specific size (keep as is if current size is larger).
 DOWNSCALE = 5          # Only decrease to specific size (keep as is if current size is smaller).
 
+# Cover Output Modes
+OUTPUT_COPY = 'Copy'
+OUTPUT_HARD_LINK = 'Hard Link'
+OUTPUT_SYMBOLIC_LINK = 'Symbolic Link'
+OUTPUT_REFLINK = 'Reflink'
+COVER_OUTPUT_MODES = [OUTPUT_COPY, OUTPUT_HARD_LINK, OUTPUT_SYMBOLIC_LINK, OUTPUT_REFLINK]
+
 # Resampling Filters
 NEAREST = 0   # Default
 BILINEAR = 1  # 
@@ -180,12 +380,196 @@ LAUNCHBOX_MEDIA_TYPE = 2
 RESIZE_COVER_IMAGE = 3
 ALWAYS_OVERWRITE = 4
 SEARCH_BOTH_NUMBER_SYSTEMS = 5
-DEFAULT_SETTINGS = 6
+COVER_OUTPUT_MODE = 6
+MEDIA_TYPE_FALLBACK = 7
+DEFAULT_SETTINGS = 8
 LAST_PS2_DIRECTORY = 99
 
+# Settings File Elements (saved by saveSettings)
+SETTINGS_ELEMENTS = (
+    'LaunchBox/Root', 'LaunchBox/MediaType', 'LaunchBox/SearchBothNS', 'LaunchBox/LastPS2Directory',
+    'LaunchBox/MediaTypeFallback', 'PCSX2/Root', 'PCSX2/ImageSize', 'PCSX2/Overwrite', 'PCSX2/OutputMode',
+)
+
+
+### One or more disc paths belonging to a game (multi-disc, alt versions/regions, hacks/mods, etc).
+class DiscPaths(tuple):
+    __slots__ = ()
+    
+    def __new__(cls, disc_paths = ()):
+        if disc_paths is None:
+            disc_paths = ()
+        elif isinstance(disc_paths, (str, Path)):
+            disc_paths = (disc_paths,)
+        return super().__new__(cls, (SYS.intern(str(disc_path)) for disc_path in disc_paths))
+    
+    ### Add another disc path (if not already added).
+    ###     (disc_path) A path to a game disc.
+    ###     --> Returns a [DiscPaths]
+    def add(self, disc_path):
+        if str(disc_path) in self:
+            return self
+        return DiscPaths(self + (str(disc_path),))
+
+
+### A LaunchBox or PCSX2 game. Can still be used like a [ ID, TITLE, DISC_PATH ] list (game[TITLE]).
+### Note: IDs and titles are interned since the same strings are repeated across game lists and searches.
+class GameRecord:
+    __slots__ = ('id', 'title', 'disc_paths')
+    
+    def __init__(self, game_id: str = '', title: str = '', disc_paths = ()):
+        self.id = SYS.intern(game_id) if game_id else ''
+        self.title = SYS.intern(title) if title else ''
+        self.disc_paths = DiscPaths(disc_paths)
+    
+    def __getitem__(self, index: int):
+        return getattr(self, GameRecord.__slots__[index])
+    
+    def __setitem__(self, index: int, value):
+        if index == DISC_PATH:
+            value = DiscPaths(value)
+        elif value:
+            value = SYS.intern(value)
+        setattr(self, GameRecord.__slots__[index], value)
+    
+    def __repr__(self) -> str:
+        return f'GameRecord({self.id!r}, {self.title!r}, {tuple(self.disc_paths)!r})'
+    
+    def __getstate__(self):
+        return (self.id, self.title, tuple(self.disc_paths))
+    
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+### Stands in for the console output (sys.stdout) so a thread can hold back what it prints (cover images written in
+### the background while the user is asked something). Threads not holding their output print right away.
+class HeldOutput:
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.threads = Thread.local()
+    
+    ### Hold back everything the current thread prints from now on.
+    def hold(self):
+        self.threads.buffer = StringIO()
+    
+    ### Stop holding back what the current thread prints.
+    ###     --> Returns a [str] Everything held back
+    def release(self) -> str:
+        buffer = getattr(self.threads, 'buffer', None)
+        self.threads.buffer = None
+        return buffer.getvalue() if buffer else ''
+    
+    def write(self, text: str) -> int:
+        return (getattr(self.threads, 'buffer', None) or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)
+
+
+### A dictionary kept in a pickle file, read the first time it's used. The file is saved by replacing it in one step
+### (never seen half written), either right away or once when the script closes.
+class PickleCache:
+    
+    def __init__(self, file: Path, lock, description: str, version: int = None):
+        self.file = file
+        self.lock = lock                # Held while reading or changing the data.
+        self.description = description  # Shown in warnings.
+        self.version = version          # If set, data saved by any other version is thrown out.
+        self.data = None
+        self.changed = False
+    
+    ### Get the data, reading it from file the first time. Call while holding the lock.
+    ###     --> Returns a [dict]
+    def get(self) -> dict:
+        if self.data is None:
+            self.data = {}
+            try:
+                with open(self.file, 'rb') as file:
+                    data = Pickle.load(file)
+                if self.version is None:
+                    self.data = data
+                elif data.get('version') == self.version:
+                    self.data = data['data']
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f'WARNING: Ignoring unreadable {self.description} "{self.file.name}": {e}')
+        return self.data
+    
+    ### Mark the data as changed and save it once the script closes. Call while holding the lock.
+    def saveAtExit(self):
+        if not self.changed:
+            AtExit.register(self.save)
+        self.changed = True
+    
+    ### Save the data if changed.
+    ###     --> Returns a [bool] Success or Failure
+    def save(self) -> bool:
+        with self.lock:
+            if not self.changed:
+                return True
+            temp_file = self.file.with_name(f'{self.file.name}.{PID()}-{HOST_TAG}.tmp')
+            try:
+                self.file.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_file, 'wb') as file:
+                    data = self.data if self.version is None else {'version' : self.version, 'data' : self.data}
+                    Pickle.dump(data, file, protocol=Pickle.HIGHEST_PROTOCOL)
+                ReplaceFile(temp_file, self.file)
+                self.changed = False
+                return True
+            except Exception as e:
+                print(f'WARNING: Failed to save {self.description} "{self.file.name}": {e}')
+                temp_file.unlink(missing_ok=True)
+                return False
+
+
+catalog_snapshot = PickleCache(catalog_snapshot_file, Thread.Lock(), 'catalog snapshot', CATALOG_SNAPSHOT_VERSION) # { LAUNCHBOX_ROOT or PCSX2_ROOT : { 'sources', 'options', 'data' } }
+source_hashes = PickleCache(source_hashes_file, rendition_cache_lock, 'image hashes') # { Image Path : ( Size, Modified Time, SHA-256 ) }
+image_hashes = PickleCache(image_hashes_file, image_index_lock, 'image hashes') # { Image Path : ( Size, Modified Time, dHash ) } Perceptual hashes.
+
+
+### Add time spent in a stage to the run report.
+###     (stage) Name of the stage.
+###     (seconds) Time spent.
+def addStageTime(stage: str, seconds: float):
+    with run_report_lock:
+        timing = run_report_timings.setdefault(stage, [0, 0.0])
+        timing[0] += 1
+        timing[1] += seconds
+
+
+### Add to a counter in the run report.
+###     (counter) Name of the counter.
+###     (amount) How much to add.
+def countInReport(counter: str, amount: int = 1):
+    with run_report_lock:
+        run_report_counters[counter] = run_report_counters.get(counter, 0) + amount
+
+
+### Decorator that times every call to a function as a stage in the run report.
+### Note: Stages can be nested (a catalog load includes building the PCSX2 game list), so times can overlap.
+###     (stage) Name of the stage.
+def timedStage(stage: str):
+    def decorator(function):
+        @Wraps(function)
+        def timedFunction(*args, **kwargs):
+            start = Time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                addStageTime(stage, Time.perf_counter() - start)
+        return timedFunction
+    return decorator
+
 
 ### Update all paths related to a change in LaunchBox or PCSX2 root paths.
 ###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+@timedStage('Catalog Load')
 def updatePathsUsing(app_root: int):
     global launchbox_ps2_xml
     global launchbox_platform_xml
@@ -199,11 +583,23 @@ def updatePathsUsing(app_root: int):
     if app_root == PCSX2_ROOT:
         
         # Defaults
-        pcsx2_game_database = rf'{pcsx2_root}\resources\GameIndex.yaml'
-        pcsx2_game_list_file = rf'{pcsx2_root}\cache\gamelist.cache'
-        pcsx2_custom_game_title_file = rf'{pcsx2_root}\inis\custom_properties.ini'
-        pcsx2_settings_file = rf'{pcsx2_root}\inis\PCSX2.ini'
-        pcsx2_image_folder = rf'{pcsx2_root}\PCSX2\covers'
+        pcsx2_game_database = str(Path(pcsx2_root, 'resources', 'GameIndex.yaml'))
+        pcsx2_game_list_file = str(Path(pcsx2_root, 'cache', 'gamelist.cache'))
+        pcsx2_custom_game_title_file = str(Path(pcsx2_root, 'inis', 'custom_properties.ini'))
+        pcsx2_settings_file = str(Path(pcsx2_root, 'inis', 'PCSX2.ini'))
+        pcsx2_image_folder = str(Path(pcsx2_root, 'PCSX2', 'covers'))
+        snapshot_sources = [pcsx2_game_database, pcsx2_game_list_file, pcsx2_custom_game_title_file, pcsx2_settings_file]
+        snapshot_options = (pcsx2_root, only_english_characters_in_game_list)
+        
+        # Skip all parsing if nothing has changed since the last time these files were read.
+        snapshot_data = loadCatalogSnapshot(PCSX2_ROOT, snapshot_sources, snapshot_options)
+        if snapshot_data:
+            pcsx2_full_game_list[:] = snapshot_data['pcsx2_full_game_list']
+            pcsx2_user_game_list[:] = snapshot_data['pcsx2_user_game_list']
+            indexGameList(PCSX2_ROOT)
+            pcsx2_game_list_file = snapshot_data['pcsx2_game_list_file']
+            pcsx2_image_folder = snapshot_data['pcsx2_image_folder']
+            return
         
         # Build list of PCSX2 game titles
         # Note: This is a must to properly match naming conventions between LaunchBox and PCSX2.
@@ -216,8 +612,14 @@ def updatePathsUsing(app_root: int):
                     pcsx2_settings.read(pcsx2_settings_file)
                     pcsx2_game_list_file = pcsx2_settings['Folders']['Cache']
                     pcsx2_image_folder = pcsx2_settings['Folders']['Covers']
-                    pcsx2_game_list_file = resolvePath(pcsx2_game_list_file, pcsx2_root)
+                    pcsx2_game_list_file = resolvePath(pcsx2_game_list_file, pcsx2_root) / 'gamelist.cache'
                     pcsx2_image_folder = resolvePath(pcsx2_image_folder, pcsx2_root)
+                    saveCatalogSnapshot(PCSX2_ROOT, snapshot_sources, snapshot_options, {
+                        'pcsx2_full_game_list' : pcsx2_full_game_list,
+                        'pcsx2_user_game_list' : pcsx2_user_game_list,
+                        'pcsx2_game_list_file' : pcsx2_game_list_file,
+                        'pcsx2_image_folder' : pcsx2_image_folder,
+                    })
                     return
                 except CP.Error as e:
                     print(f'ERROR: Failed reading PCSX2 settings file: {e}')
@@ -232,9 +634,22 @@ def updatePathsUsing(app_root: int):
     if app_root == LAUNCHBOX_ROOT:
         
         # Defaults
-        launchbox_ps2_xml = rf'{launchbox_root}\Data\Platforms\Sony Playstation 2.xml'
-        launchbox_platform_xml = rf'{launchbox_root}\Data\Platforms.xml'
-        launchbox_image_folder = rf'{launchbox_root}\Images\Sony Playstation 2\{launchbox_media_type}'
+        launchbox_ps2_xml = str(Path(launchbox_root, 'Data', 'Platforms', 'Sony Playstation 2.xml'))
+        launchbox_platform_xml = str(Path(launchbox_root, 'Data', 'Platforms.xml'))
+        launchbox_image_folder = str(Path(launchbox_root, 'Images', 'Sony Playstation 2', launchbox_media_type))
+        snapshot_sources = [launchbox_ps2_xml, launchbox_platform_xml]
+        snapshot_options = (launchbox_root,)
+        
+        # Skip all parsing if nothing has changed since the last time these files were read.
+        snapshot_data = loadCatalogSnapshot(LAUNCHBOX_ROOT, snapshot_sources, snapshot_options)
+        if snapshot_data:
+            launchbox_game_list[:] = snapshot_data['launchbox_game_list']
+            launchbox_media_type_list[:] = snapshot_data['launchbox_media_type_list']
+            indexGameList(LAUNCHBOX_ROOT)
+            for media_type, folder_path in launchbox_media_type_list:
+                if media_type == launchbox_media_type: # Get user chosen image category path
+                    launchbox_image_folder = folder_path
+            return
         
         try:
             launchbox_ps2_xml_root = ET.parse(launchbox_ps2_xml).getroot()
@@ -242,23 +657,26 @@ def updatePathsUsing(app_root: int):
             
             # Build list of LaunchBox game titles and their disc paths
             if len(launchbox_game_list) == 0:
+                games_by_id = {}
                 for lb_game in launchbox_ps2_xml_root.findall('Game'):
                     lb_game_id = lb_game.find('ID').text
                     lb_game_title = lb_game.find('Title').text
                     lb_game_path = lb_game.find('ApplicationPath').text
-                    launchbox_game_list.append([ lb_game_id, lb_game_title, [lb_game_path] ])
+                    game = GameRecord(lb_game_id, lb_game_title, lb_game_path)
+                    launchbox_game_list.append(game)
+                    games_by_id.setdefault(game[ID], game)
                     
                 for lb_game in launchbox_ps2_xml_root.findall('AdditionalApplication'):
                     lb_emu_id = lb_game.find('EmulatorId').text
                     lb_game_id = lb_game.find('GameID').text
                     lb_game_path = lb_game.find('ApplicationPath').text
-                    if lb_emu_id: # Check if this is a game disc connected to an emulator.
-                        for game in launchbox_game_list:
+                    if lb_emu_id and lb_game_path: # Check if this is a game disc connected to an emulator.
+                        game = games_by_id.get(lb_game_id)
+                        if game:
                             # Update the game with another disc path.
                             # (Multi-disc game: additional content, alt version/region, hacked/modded, etc)
-                            if game[ID] == lb_game_id:
-                                if lb_game_path not in game[DISC_PATH]:
-                                    game[DISC_PATH].append(lb_game_path)
+                            game[DISC_PATH] = game[DISC_PATH].add(lb_game_path)
+            indexGameList(LAUNCHBOX_ROOT)
             
             # Get paths to LaunchBox's PS2 image folders.
             launchbox_media_type_list.clear()
@@ -271,6 +689,11 @@ def updatePathsUsing(app_root: int):
                     if media_type == launchbox_media_type: # Get user chosen image category path
                         launchbox_image_folder = folder_path
             launchbox_media_type_list.append([MEDIA_TYPE_ALL,'.ALL']) # If selected, will loop all types/paths
+            
+            saveCatalogSnapshot(LAUNCHBOX_ROOT, snapshot_sources, snapshot_options, {
+                'launchbox_game_list' : launchbox_game_list,
+                'launchbox_media_type_list' : launchbox_media_type_list,
+            })
         
         except IOError as e:
             print(f"ERROR: Failed reading XML file: {e}")
@@ -280,18 +703,190 @@ def updatePathsUsing(app_root: int):
             print(f'ERROR: {e}')
 
 
+### Rebuild the ID and disc path lookup indexes for a game list.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+def indexGameList(app_root: int):
+    if app_root == LAUNCHBOX_ROOT:
+        launchbox_games_by_id.clear()
+        launchbox_games_by_disc_path.clear()
+        launchbox_games_by_image_key.clear()
+        for game in launchbox_game_list:
+            launchbox_games_by_id.setdefault(game[ID], game)
+            launchbox_games_by_image_key.setdefault(getImageKey(game[TITLE]), []).append(game)
+            for disc_path in game[DISC_PATH]:
+                launchbox_games_by_disc_path.setdefault(disc_path, []).append(game)
+    
+    elif app_root == PCSX2_ROOT:
+        pcsx2_games_by_id.clear()
+        pcsx2_games_by_disc_path.clear()
+        pcsx2_full_game_titles.clear()
+        pcsx2_full_game_titles.update(pcsx2_full_game_list)
+        for game in pcsx2_user_game_list:
+            pcsx2_games_by_id.setdefault(game[ID], game)
+            for disc_path in game[DISC_PATH]:
+                pcsx2_games_by_disc_path.setdefault(disc_path, game)
+
+
+### Get the size and last modified time of each file, used to tell if a file has changed.
+###     (file_paths) A list of file paths.
+###     --> Returns a [list] of [ Path, Size, Modified Time ] (Size and time are None if file doesn't exist)
+def getFileSignatures(file_paths: list) -> list:
+    signatures = []
+    for file_path in file_paths:
+        try:
+            stats = Path(file_path).stat()
+            signatures.append([ str(file_path), stats.st_size, stats.st_mtime_ns ])
+        except OSError:
+            signatures.append([ str(file_path), None, None ])
+    return signatures
+
+
+### Load previously parsed catalog data from the snapshot file, but only if none of its source files have changed.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+###     (source_files) The files the catalog data was parsed from.
+###     (options) Any settings that change how the catalog data is parsed.
+###     --> Returns a [dict] of catalog data or None if missing/out of date
+def loadCatalogSnapshot(app_root: int, source_files: list, options: tuple) -> dict:
+    with catalog_snapshot.lock:
+        catalog = catalog_snapshot.get().get(app_root)
+    
+    if (catalog and catalog['options'] == options and
+        catalog['sources'] == getFileSignatures(source_files) and
+        None not in catalog['sources'][0]): # The main source file must exist.
+        return catalog['data']
+    return None
+
+
+### Save parsed catalog data to the snapshot file (all catalogs are saved together in a single file).
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+###     (source_files) The files the catalog data was parsed from.
+###     (options) Any settings that change how the catalog data is parsed.
+###     (data) The catalog data to save.
+###     --> Returns a [bool] Success or Failure
+def saveCatalogSnapshot(app_root: int, source_files: list, options: tuple, data: dict) -> bool:
+    with catalog_snapshot.lock:
+        catalog_snapshot.get()[app_root] = {
+            'sources' : getFileSignatures(source_files),
+            'options' : options,
+            'data' : {key: list(value) if isinstance(value, list) else value for key, value in data.items()},
+        }
+        catalog_snapshot.changed = True
+    return catalog_snapshot.save()
+
+
+### Import the Pillow (PIL) module the first time it's needed so startup isn't slowed down by it.
+###     --> Returns a [bool] True if Pillow is installed
+def importPillow() -> bool:
+    global Image
+    global UnidentifiedImageError
+    global pillow_installed
+    
+    if pillow_installed is None:
+        try:
+            from PIL import Image, UnidentifiedImageError
+            pillow_installed = True
+        except ModuleNotFoundError:
+            pillow_installed = False
+    return pillow_installed
+
+
+### Import the Tkinter module the first time a dialog window is needed.
+def importTkinter():
+    global TK
+    global FileDialog
+    
+    if TK is None:
+        import tkinter as TK
+        from tkinter import filedialog as FileDialog
+
+
+### Run a catalog related task in a background thread. Tasks for the same app run one after another in the
+### order submitted, while LaunchBox and PCSX2 tasks run at the same time.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+###     (function) The task to run.
+###     (*args) Arguments passed to the function.
+def submitCatalogTask(app_root: int, function, *args):
+    # cProfile only sees the thread it was started in, so run tasks right away while profiling.
+    if cpu_profiler:
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+        catalog_futures.setdefault(app_root, []).append(future)
+        return
+    if app_root not in catalog_loaders:
+        catalog_loaders[app_root] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'CatalogLoader{app_root}')
+    catalog_futures.setdefault(app_root, []).append(catalog_loaders[app_root].submit(function, *args))
+
+
+### Load (or reload) all paths and game lists for LaunchBox or PCSX2 in the background.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+def loadCatalogInBackground(app_root: int):
+    submitCatalogTask(app_root, updatePathsUsing, app_root)
+
+
+### Throw out a LaunchBox or PCSX2 catalog (game lists, media types) and load it again.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+def reloadCatalog(app_root: int):
+    if app_root == LAUNCHBOX_ROOT:
+        launchbox_game_list.clear()
+        launchbox_media_type_list.clear()
+    else:
+        pcsx2_user_game_list.clear()
+        pcsx2_full_game_list.clear()
+    updatePathsUsing(app_root)
+
+
+### Load a LaunchBox or PCSX2 catalog in the background, but only if it isn't already loaded (or loading) from the
+### current root path. A catalog loaded from a different root path is thrown out and loaded again.
+### Inside settingsBatch() the load waits until the batch ends, so changing many settings only loads it once.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+###     --> Returns a [bool] True if a (re)load is needed
+def loadCatalogFor(app_root: int) -> bool:
+    app_root_path = launchbox_root if app_root == LAUNCHBOX_ROOT else pcsx2_root
+    if catalog_roots.get(app_root) == app_root_path:
+        return False
+    reload = app_root in catalog_roots
+    catalog_roots[app_root] = app_root_path
+    if settings_batch_depth:
+        settings_batch_catalogs.setdefault(app_root, reload)
+    elif reload:
+        submitCatalogTask(app_root, reloadCatalog, app_root)
+    else:
+        loadCatalogInBackground(app_root)
+    return True
+
+
+### Wait for any catalogs still loading in the background. Should be called before using any game lists or paths.
+###     (*app_roots) LAUNCHBOX_ROOT and/or PCSX2_ROOT. If none given, wait for all.
+def waitForCatalogs(*app_roots):
+    for app_root in app_roots or list(catalog_futures):
+        futures = catalog_futures.pop(app_root, [])
+        still_loading = not all(future.done() for future in futures)
+        if still_loading:
+            print('[Loading...]', end='\r', flush=True)
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f'ERROR: Failed loading {"LaunchBox" if app_root == LAUNCHBOX_ROOT else "PCSX2"} data: {e}')
+        if still_loading:
+            print('            ', end='\r', flush=True)
+
+
 ### Check if root paths are correct and if not ask user to update settings.
 ###     --> Returns a [bool] Pass or Fail
 def rootPathCheck():
     launchbox_not_found = False
     pcsx2_not_found = False
     
-    if not Path(launchbox_root + r'\LaunchBox.exe').exists():
+    if not Path(launchbox_root, 'LaunchBox.exe').exists():
         launchbox_not_found = True
     
-    if not (Path(pcsx2_root + r'\pcsx2.exe').exists() or
-            Path(pcsx2_root + r'\pcsx2-qtx64-avx2.exe').exists() or
-            Path(pcsx2_root + r'\pcsx2x64-avx2.exe').exists()):
+    if not (Path(pcsx2_root, 'pcsx2.exe').exists() or
+            Path(pcsx2_root, 'pcsx2-qtx64-avx2.exe').exists() or
+            Path(pcsx2_root, 'pcsx2x64-avx2.exe').exists()):
         pcsx2_not_found = True
     
     if launchbox_not_found and pcsx2_not_found:
@@ -328,8 +923,9 @@ def resolvePath(path: str, root: str) -> Path:
 ###     (new_height) The new height to resize the image to. Aspect ratio will be kept and size/scale will only be decreased, not increase.
 ###     (save_path) A path to save the new resized image file. If not provided the image file will be overwritten.
 ###     --> Returns a [bool]
+@timedStage('Image Resize (Decode/Encode)')
 def resizeCoverImage(image_path: Path, new_height: int = 720, save_path: Path = Path()) -> bool:
-    if not pillow_installed:
+    if not importPillow():
         print(f'WARNING: The Pillow (PIL) Python module is not installed and is required to resize images.')
         print(f'To install Pillow open a command prompt and first enter:')
         print(f'  python3 -m pip install --upgrade pip')
@@ -379,7 +975,8 @@ def resizeCoverImage(image_path: Path, new_height: int = 720, save_path: Path =
 ###     (keep_aspect_ratio) Keep aspect ratio only if one size, width or height, has changed.
 ###     (resample) Resampling filter to use while modifying an Image.
 ###     --> Returns a [Image]
-def resizeImage(image: Image, width_change: (int, int), height_change: (int, int), keep_aspect_ratio: bool = True, resample: int = NEAREST) -> Image:
+def resizeImage(image: 'Image', width_change: (int, int), height_change: (int, int), keep_aspect_ratio: bool = True, resample: int = NEAREST) -> 'Image':
+    importPillow()
     if resample == BILINEAR:  resample = Image.Resampling.BILINEAR
     elif resample == BICUBIC: resample = Image.Resampling.BICUBIC
     else:                     resample = Image.Resampling.NEAREST
@@ -547,9 +1144,12 @@ def getListIndexOf(value: str, in_list: list, multi_level_key: int = -1) -> int:
 ###     (key) Key repersenting the value ID or DISC_PATH.
 ###     --> Returns a [str] Game Title
 def getPCSX2GameTitleFrom(value: str, key: int) -> str:
-    i = getListIndexOf(value, pcsx2_user_game_list, key)
-    if i > -1:
-        return pcsx2_user_game_list[i][TITLE]
+    if key == DISC_PATH:
+        game = pcsx2_games_by_disc_path.get(str(value))
+    else:
+        game = pcsx2_games_by_id.get(str(value))
+    if game:
+        return game[TITLE]
     else:
         return ''
 
@@ -708,6 +1308,8 @@ def multiSelectionMenu(labels: list, choices: list, not_found_choice: str = '',
 ###     (show_command_only) Only check for the "show" command.
 ###     --> Returns a [bool] True if command found.
 def isCommand(user_input: str, show_command_only = False)-> bool:
+    if user_input.lower().startswith(('show', 'list')):
+        waitForCatalogs()
     if user_input.lower() == 'show launchbox' or user_input.lower() == 'show lb':
         openDirectory(launchbox_image_folder)
         return True
@@ -728,12 +1330,22 @@ def isCommand(user_input: str, show_command_only = False)-> bool:
     if user_input.lower() == 'settings' or user_input.lower() == '*':
         showSettingsMenu()
         return True
+    if user_input.lower() == 'watch':
+        watchLaunchBoxImages(watch_poll_interval)
+        return True
+    if user_input.lower() == 'report':
+        printRunReport()
+        return True
+    if user_input.lower() == 'shards':
+        printShardResults(mergeShardJournals())
+        return True
     return False
 
 
 ### Build PCSX2 game list consisting of user PS2 games. Also a builds a full list of games for fallback searching.
 ###     (sort) Sort full list of games alphabetically.
 ###     --> Returns a [bool] Success or Failure
+@timedStage('PCSX2 Game List Build')
 def createListOfPCSX2Games(sort: bool = False) -> bool:
     if_error_file_path = pcsx2_game_database
     
@@ -760,8 +1372,8 @@ def createListOfPCSX2Games(sort: bool = False) -> bool:
                     
                     if next_line == DISC_PATH:
                         path = Path(line)
-                        if path.exists():
-                            pcsx2_user_game_list.append(['','',path])
+                        if line and path.exists(): # An empty line would be the current folder.
+                            pcsx2_user_game_list.append(GameRecord('', '', path))
                             next_line = ID
                     
                     elif next_line == ID:
@@ -789,11 +1401,15 @@ def createListOfPCSX2Games(sort: bool = False) -> bool:
             print(f'ERROR: {e}')
             return False
     
+    indexGameList(PCSX2_ROOT)
+    
     # Build full list of PS2 games, while also updating "pcsx2_user_game_list" with proper title names.
     if len(pcsx2_full_game_list) == 0:
         try:
             with open(pcsx2_game_database, 'r', encoding='utf-8') as file:
-                current_user_game_index = -1
+                current_user_game = None
+                full_game_titles = pcsx2_full_game_titles
+                full_game_titles.clear()
                 for line in file:
                     
                     game_id_match = RE.search(r'(\w{4}-\d{5})', line)
@@ -804,35 +1420,39 @@ def createListOfPCSX2Games(sort: bool = False) -> bool:
                     # New game found when a new ID is found.
                     if game_id_match:
                         current_game_id = game_id_match.group(0)
-                        current_user_game_index = getListIndexOf(current_game_id, pcsx2_user_game_list, ID)
+                        current_user_game = pcsx2_games_by_id.get(current_game_id)
                     
                     # Next line may be a title
                     elif game_title_match:
-                        current_game_title = game_title_match.group(1)
+                        current_game_title = SYS.intern(game_title_match.group(1))
                         
                         # Add to full game list
-                        if current_game_title not in pcsx2_full_game_list:
+                        if current_game_title not in full_game_titles:
                             pcsx2_full_game_list.append(current_game_title)
+                            full_game_titles.add(current_game_title)
                     
                     # Next line may be an English title
                     elif game_title_eng_match:
-                        current_game_title = game_title_eng_match.group(1)
+                        current_game_title = SYS.intern(game_title_eng_match.group(1))
                         
                         # Add to full game list
                         if only_english_characters_in_game_list:
                             # Replace the non-English title above (last added).
-                            if current_game_title not in pcsx2_full_game_list:
+                            full_game_titles.discard(pcsx2_full_game_list[-1])
+                            if current_game_title not in full_game_titles:
                                 pcsx2_full_game_list[-1] = current_game_title
+                                full_game_titles.add(current_game_title)
                             else:
                                 pcsx2_full_game_list.pop(-1)
-                        elif current_game_title not in pcsx2_full_game_list:
+                        elif current_game_title not in full_game_titles:
                             pcsx2_full_game_list.append(current_game_title)
+                            full_game_titles.add(current_game_title)
                     
                     if current_game_title != '': # If an English title exists, it will overwrite previous non-English title.
                         
                         # Update the user game list with new title if matching ID found.
-                        if len(pcsx2_user_game_list) > current_user_game_index > -1:
-                            pcsx2_user_game_list[current_user_game_index][TITLE] = current_game_title
+                        if current_user_game:
+                            current_user_game[TITLE] = current_game_title
             
             if sort:
                 pcsx2_full_game_list.sort()
@@ -863,8 +1483,9 @@ def createListOfPCSX2Games(sort: bool = False) -> bool:
                 ## Skip custom disc names with square bracket characters.
                 ## This is a temporary fix, REMOVE if PCSX2 fixes its custom title issue.
                 if custom_game_title.find('[') == -1 and custom_game_title.find(']') == -1:
-                    i = getListIndexOf(disc_path, pcsx2_user_game_list, DISC_PATH)
-                    pcsx2_user_game_list[i][TITLE] = custom_game_title
+                    game = pcsx2_games_by_disc_path.get(disc_path)
+                    if game:
+                        game[TITLE] = custom_game_title
     
     except CP.Error as e:
         print(rf'Error reading "{pcsx2_custom_game_title_file.name}": {e}')
@@ -882,6 +1503,7 @@ def createListOfPCSX2Games(sort: bool = False) -> bool:
 ###     (in_game_title_list) The list to search through.
 ###     (multi_level_key) Preform search in a 2nd level deep list using this key/index.
 ###     --> Returns a [list, list]
+@timedStage('Title Search')
 def searchFor(search_words: str, in_game_title_list: list, multi_level_key: int = -1) -> (list, list):
     full_matched_list = []
     high_probability_list = []
@@ -974,10 +1596,10 @@ def changeNumberSystemIn(search_words: str, to_roman_numerals_only: bool = False
     
     all_n_found = []
     if uppercase_roman_numerals_only:
-        all_n_found = re_object.findall(search_item)
+        all_n_found = re_object.findall(search_words)
         alt_search_words = search_words
     else:
-        all_n_found = re_object.findall(search_item.lower())
+        all_n_found = re_object.findall(search_words.lower())
         alt_search_words = search_words.lower()
     
     if len(all_n_found):
@@ -998,6 +1620,87 @@ def changeNumberSystemIn(search_words: str, to_roman_numerals_only: bool = False
         return alt_search_words
 
 
+### Hold an advisory lock while a block of code runs, so other instances of this script (and other threads) that
+### lock the same lock file and slot wait their turn. Works on Windows (msvcrt) and Linux/macOS (fcntl), including
+### folders shared over a network if the file server supports locking.
+###     (lock_file) The lock file (created if missing).
+###     (slot) Lock only this slot (byte) of the lock file, so unrelated things can be locked with one file.
+###     (hidden) Hide the lock file on Windows too (when first opened), for lock files kept in the user's folders.
+@ContextManager
+def lockFile(lock_file: Path, slot: int = 0, hidden: bool = False):
+    lock_file = Path(lock_file)
+    with lock_files_lock:
+        slot_lock = slot_locks.setdefault((str(lock_file), slot), Thread.Lock())
+    
+    with slot_lock:
+        wait_started = Time.perf_counter()
+        with lock_files_lock:
+            file = lock_files.get(str(lock_file))
+            if file is None:
+                try:
+                    file = lock_files[str(lock_file)] = open(lock_file, 'a+b')
+                    if hidden and SYS.platform == 'win32':
+                        import ctypes as CTypes
+                        attributes = CTypes.windll.kernel32.GetFileAttributesW(str(lock_file))
+                        if attributes != -1 and not attributes & FILE_ATTRIBUTE_HIDDEN: # -1 = Invalid attributes
+                            CTypes.windll.kernel32.SetFileAttributesW(str(lock_file), attributes | FILE_ATTRIBUTE_HIDDEN)
+                except OSError:
+                    pass # Read-only folder, only threads of this instance are kept out.
+        locked = False
+        if file:
+            try:
+                if LockFileRange:
+                    LockFileRange(file.fileno(), LOCK_EX, 1, slot)
+                    locked = True
+                elif MSVCRT:
+                    while not locked:
+                        try:
+                            with lock_files_lock: # The file position is shared by all threads, seek right before locking.
+                                file.seek(slot)
+                                MSVCRT.locking(file.fileno(), MSVCRT.LK_NBLCK, 1)
+                            locked = True
+                        except OSError:
+                            Time.sleep(0.05) # Held by another instance.
+            except OSError as e:
+                print(f'WARNING: Failed to lock "{lock_file.name}": {e}')
+        addStageTime('Lock Wait', Time.perf_counter() - wait_started)
+        try:
+            yield
+        finally:
+            if locked:
+                try:
+                    if LockFileRange:
+                        LockFileRange(file.fileno(), LOCK_UN, 1, slot)
+                    else:
+                        with lock_files_lock:
+                            file.seek(slot)
+                            MSVCRT.locking(file.fileno(), MSVCRT.LK_UNLCK, 1)
+                except OSError as e:
+                    print(f'WARNING: Failed to unlock "{lock_file.name}": {e}')
+
+
+### Lock a PCSX2 cover image (by folder and name, any extension) while it's being replaced. The lock file is kept in
+### the PCSX2 cover folder, the one folder every computer writing these covers must share (a script folder may not be).
+###     (destination_image) The PCSX2 cover image file path.
+def lockCoverImage(destination_image: Path):
+    cover_key = destination_image.stem.casefold().encode('utf-8')
+    slot = int.from_bytes(HashLib.sha1(cover_key).digest()[:4], 'big') % COVER_LOCK_SLOTS
+    return lockFile(destination_image.parent / COVER_LOCK_FILE, slot, True)
+
+
+### Save the settings XML tree, replacing the settings file in one step so it's never seen half written.
+### Note: Call while holding the settings lock (see: lockFile(settings_lock_file)).
+###     (tree) The settings ElementTree.
+def writeSettingsTree(tree: ET.ElementTree):
+    ET.indent(tree, space='  ', level=0) # Indent the tree for "pretty printing" (3.9+)
+    temp_file = settings_file.with_name(f'{settings_file.name}.{PID()}-{HOST_TAG}.tmp')
+    try:
+        tree.write(temp_file, encoding='utf-8', xml_declaration=True)
+        ReplaceFile(temp_file, settings_file)
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+
 ### Create a XML file for saving user settings and choices made on each game disc.
 ###     --> Returns a [bool] Success or Failure
 def createSettingsFile() -> bool:
@@ -1007,8 +1710,8 @@ def createSettingsFile() -> bool:
         root = ET.Element('Data')
         tree = ET.ElementTree(root)
         element_settings = ET.SubElement(root, 'Settings')
-        ET.indent(tree, space='  ', level=0) # Indent the tree for "pretty printing" (3.9+)
-        tree.write(settings_file, encoding='utf-8', xml_declaration=True)
+        with lockFile(settings_lock_file):
+            writeSettingsTree(tree)
         settings_file_created = True
     except IOError as e:
         print(f'ERROR: Failed to create settings XML file: {e}')
@@ -1018,8 +1721,8 @@ def createSettingsFile() -> bool:
         print(f'ERROR: {e}')
     print('               ', end='\r', flush=True)
     if rootPathCheck():
-        updatePathsUsing(LAUNCHBOX_ROOT)
-        updatePathsUsing(PCSX2_ROOT)
+        loadCatalogFor(LAUNCHBOX_ROOT)
+        loadCatalogFor(PCSX2_ROOT)
     if settings_file_created:
         print('[Settings Loaded]')
         return True
@@ -1029,6 +1732,8 @@ def createSettingsFile() -> bool:
 ### Load settings from XML settings file.
 ###     --> Returns a [bool] Success or Failure
 def loadSettings() -> bool:
+    global settings_unsaved
+    
     root = 0
     print('[Loading...]', end='\r', flush=True)
     try:
@@ -1045,37 +1750,50 @@ def loadSettings() -> bool:
         print(f'ERROR: Failed loading of "{settings_file.name}" file: {e}')
         return False
     
-    element_launchbox_root = root.find('Settings/LaunchBox/Root')
-    if element_launchbox_root is not None:
-        updateSetting(LAUNCHBOX_ROOT, element_launchbox_root.text, False, False)
-    else: # Settings file just created, but default root paths are correct and working.
-        updatePathsUsing(LAUNCHBOX_ROOT)
-    
-    element_launchbox_type = root.find('Settings/LaunchBox/MediaType')
-    if element_launchbox_type is not None:
-        updateSetting(LAUNCHBOX_MEDIA_TYPE, element_launchbox_type.text, False, False)
-    
-    element_launchbox_search = root.find('Settings/LaunchBox/SearchBothNS')
-    if element_launchbox_search is not None:
-        updateSetting(SEARCH_BOTH_NUMBER_SYSTEMS, element_launchbox_search.text, False, False)
-    
-    element_launchbox_last_dir = root.find('Settings/LaunchBox/LastPS2Directory')
-    if element_launchbox_last_dir is not None:
-        updateSetting(LAST_PS2_DIRECTORY, element_launchbox_last_dir.text, False, False)
-    
-    element_pcsx2_root = root.find('Settings/PCSX2/Root')
-    if element_pcsx2_root is not None:
-        updateSetting(PCSX2_ROOT, element_pcsx2_root.text, False, False)
-    else: # Settings file just created, but default root paths are correct and working.
-        updatePathsUsing(PCSX2_ROOT)
-    
-    element_pcsx2_size = root.find('Settings/PCSX2/ImageSize')
-    if element_pcsx2_size is not None:
-        updateSetting(RESIZE_COVER_IMAGE, element_pcsx2_size.text, False, False)
-    
-    element_pcsx2_overwrite = root.find('Settings/PCSX2/Overwrite')
-    if element_pcsx2_overwrite is not None:
-        updateSetting(ALWAYS_OVERWRITE, element_pcsx2_overwrite.text, False, False)
+    with settingsBatch():
+        element_launchbox_type = root.find('Settings/LaunchBox/MediaType')
+        if element_launchbox_type is not None:
+            updateSetting(LAUNCHBOX_MEDIA_TYPE, element_launchbox_type.text, False, False)
+        
+        element_launchbox_search = root.find('Settings/LaunchBox/SearchBothNS')
+        if element_launchbox_search is not None:
+            updateSetting(SEARCH_BOTH_NUMBER_SYSTEMS, element_launchbox_search.text, False, False)
+        
+        element_launchbox_last_dir = root.find('Settings/LaunchBox/LastPS2Directory')
+        if element_launchbox_last_dir is not None:
+            updateSetting(LAST_PS2_DIRECTORY, element_launchbox_last_dir.text, False, False)
+        
+        element_launchbox_fallback = root.find('Settings/LaunchBox/MediaTypeFallback')
+        if element_launchbox_fallback is not None:
+            updateSetting(MEDIA_TYPE_FALLBACK, element_launchbox_fallback.text or '', False, False)
+        
+        element_pcsx2_size = root.find('Settings/PCSX2/ImageSize')
+        if element_pcsx2_size is not None:
+            updateSetting(RESIZE_COVER_IMAGE, element_pcsx2_size.text, False, False)
+        
+        element_pcsx2_overwrite = root.find('Settings/PCSX2/Overwrite')
+        if element_pcsx2_overwrite is not None:
+            updateSetting(ALWAYS_OVERWRITE, element_pcsx2_overwrite.text, False, False)
+        
+        element_pcsx2_output_mode = root.find('Settings/PCSX2/OutputMode')
+        if element_pcsx2_output_mode is not None:
+            updateSetting(COVER_OUTPUT_MODE, element_pcsx2_output_mode.text, False, False)
+        
+        # Root paths last, so the catalogs loading in the background see all the other settings.
+        element_launchbox_root = root.find('Settings/LaunchBox/Root')
+        if element_launchbox_root is not None:
+            updateSetting(LAUNCHBOX_ROOT, element_launchbox_root.text, False, False)
+        else: # Settings file just created, but default root paths are correct and working.
+            loadCatalogFor(LAUNCHBOX_ROOT)
+        
+        element_pcsx2_root = root.find('Settings/PCSX2/Root')
+        if element_pcsx2_root is not None:
+            updateSetting(PCSX2_ROOT, element_pcsx2_root.text, False, False)
+        else: # Settings file just created, but default root paths are correct and working.
+            loadCatalogFor(PCSX2_ROOT)
+        
+        # Same as the file, unless the file is missing settings (added in a later version), then the next save writes them.
+        settings_unsaved = any(root.find(f'Settings/{element}') is None for element in SETTINGS_ELEMENTS)
     
     print('[Settings Loaded]')
     return True
@@ -1083,17 +1801,58 @@ def loadSettings() -> bool:
 
 ### Set all settings back to their defaults.
 def defaultSettings():
-    root_path = rf'{ENV.get("USERPROFILE")}\LaunchBox'
-    if Path(root_path).exists():
-        updateSetting(LAUNCHBOX_ROOT, root_path, False, False)
-    root_path = rf'{ENV.get("ProgramFiles")}\PCSX2'
-    if Path(root_path).exists():
-        updateSetting(PCSX2_ROOT, root_path, False, False)
-    updateSetting(LAUNCHBOX_MEDIA_TYPE, 'Box - Front', False, False)
-    updateSetting(SEARCH_BOTH_NUMBER_SYSTEMS, True, False, False)
-    updateSetting(LAST_PS2_DIRECTORY, ROOT, False, False)
-    updateSetting(RESIZE_COVER_IMAGE, 720, False, False)
-    updateSetting(ALWAYS_OVERWRITE, True, True, True)
+    with settingsBatch():
+        root_path = rf'{ENV.get("USERPROFILE")}\LaunchBox'
+        if Path(root_path).exists():
+            updateSetting(LAUNCHBOX_ROOT, root_path, False, False)
+        root_path = rf'{ENV.get("ProgramFiles")}\PCSX2'
+        if Path(root_path).exists():
+            updateSetting(PCSX2_ROOT, root_path, False, False)
+        updateSetting(LAUNCHBOX_MEDIA_TYPE, 'Box - Front', False, False)
+        updateSetting(MEDIA_TYPE_FALLBACK, ['Box - Front', 'Box - Front - Reconstructed', 'Box - 3D'], False, False)
+        updateSetting(SEARCH_BOTH_NUMBER_SYSTEMS, True, False, False)
+        updateSetting(LAST_PS2_DIRECTORY, ROOT, False, False)
+        updateSetting(RESIZE_COVER_IMAGE, 720, False, False)
+        updateSetting(COVER_OUTPUT_MODE, OUTPUT_COPY, False, False)
+        updateSetting(ALWAYS_OVERWRITE, True, True, True)
+
+
+### Change many settings as one batch: the settings file is saved once (if any change asked to be saved) and each
+### catalog affected by a changed root path is loaded once, both when the (outermost) batch ends.
+@ContextManager
+def settingsBatch():
+    global settings_batch_depth
+    global settings_batch_save
+    
+    settings_batch_depth += 1
+    try:
+        yield
+    finally:
+        settings_batch_depth -= 1
+        if settings_batch_depth == 0:
+            save = settings_batch_save
+            settings_batch_save = False
+            catalogs = dict(settings_batch_catalogs)
+            settings_batch_catalogs.clear()
+            if save and settings_unsaved:
+                saveSettings()
+            for app_root, reload in catalogs.items():
+                if reload:
+                    submitCatalogTask(app_root, reloadCatalog, app_root)
+                else:
+                    loadCatalogInBackground(app_root)
+
+
+### Get the current value of a setting.
+###     (setting) The setting constant.
+###     --> Returns the value
+def getSettingValue(setting: int):
+    return {
+        LAUNCHBOX_ROOT : launchbox_root, PCSX2_ROOT : pcsx2_root, LAUNCHBOX_MEDIA_TYPE : launchbox_media_type,
+        RESIZE_COVER_IMAGE : resize_cover_image, ALWAYS_OVERWRITE : always_overwrite, COVER_OUTPUT_MODE : cover_output_mode,
+        SEARCH_BOTH_NUMBER_SYSTEMS : search_both_number_systems, LAST_PS2_DIRECTORY : last_ps2_directory,
+        MEDIA_TYPE_FALLBACK : list(media_type_fallback),
+    }.get(setting)
 
 
 ### Update and save a setting's value.
@@ -1108,20 +1867,29 @@ def updateSetting(setting: int, value, save: bool, show_message = True) -> bool:
     global launchbox_media_type
     global resize_cover_image
     global always_overwrite
+    global cover_output_mode
     global search_both_number_systems
     global launchbox_image_folder
     global last_ps2_directory
+    global media_type_fallback
+    global settings_unsaved
+    global settings_batch_save
+    
+    previous_value = getSettingValue(setting)
     
     # Update the setting varible
+    # Note: Only the LaunchBox/PCSX2 catalogs depend on their root paths. Everything else derived from settings is
+    #       either updated right here (image folder) or checked when used (image index, renditions).
     if setting == LAUNCHBOX_ROOT:
         launchbox_root = str(value)
-        updatePathsUsing(LAUNCHBOX_ROOT)
+        loadCatalogFor(LAUNCHBOX_ROOT)
     
     elif setting == PCSX2_ROOT:
         pcsx2_root = str(value)
-        updatePathsUsing(PCSX2_ROOT)
+        loadCatalogFor(PCSX2_ROOT)
     
     elif setting == LAUNCHBOX_MEDIA_TYPE:
+        waitForCatalogs(LAUNCHBOX_ROOT)
         launchbox_media_type = str(value)
         # If media types and paths loaded in, update "launchbox_image_folder" too.
         i = getListIndexOf(launchbox_media_type, launchbox_media_type_list, TYPE)
@@ -1134,22 +1902,47 @@ def updateSetting(setting: int, value, save: bool, show_message = True) -> bool:
     elif setting == ALWAYS_OVERWRITE:
         always_overwrite = (str(value).lower() == "true")
     
+    elif setting == COVER_OUTPUT_MODE:
+        cover_output_mode = str(value) if str(value) in COVER_OUTPUT_MODES else OUTPUT_COPY
+    
     elif setting == SEARCH_BOTH_NUMBER_SYSTEMS:
         search_both_number_systems = (str(value).lower() == "true")
     
     elif setting == LAST_PS2_DIRECTORY:
         last_ps2_directory = str(value)
     
+    elif setting == MEDIA_TYPE_FALLBACK: # A list or "|" separated string of image categories
+        media_types = value.split('|') if isinstance(value, str) else value
+        media_type_fallback = [str(media_type) for media_type in media_types if media_type]
+    
     else:
         print('\nWARNING: Setting Not Found!')
         return False
     
     if show_message:
         print('\n[Settings Updated]')
+    if str(getSettingValue(setting)) != str(previous_value): # Paths may be saved as a Path or str.
+        settings_unsaved = True
     
-    # Save changes to XML settings file
-    if save:
-        try:
+    # Save changes to XML settings file (once a batch of changes is done).
+    if save and settings_batch_depth:
+        settings_batch_save = True
+    elif save and settings_unsaved:
+        return saveSettings(show_message)
+    elif save:
+        countInReport('Settings Writes Skipped')
+    return True
+
+
+### Save all settings to the XML settings file.
+###     (show_message) Show successful save message.
+###     --> Returns a [bool] Success or Failure
+def saveSettings(show_message: bool = True) -> bool:
+    global settings_unsaved
+    
+    save_started = Time.perf_counter()
+    try:
+        with lockFile(settings_lock_file):
             tree = ET.parse(settings_file)
             root = tree.getroot()
             
@@ -1183,6 +1976,11 @@ def updateSetting(setting: int, value, save: bool, show_message = True) -> bool:
                 element_launchbox_last_dir = ET.SubElement(element_launchbox, 'LastPS2Directory')
             element_launchbox_last_dir.text = str(last_ps2_directory)
             
+            element_launchbox_fallback = element_launchbox.find('MediaTypeFallback')
+            if element_launchbox_fallback is None:
+                element_launchbox_fallback = ET.SubElement(element_launchbox, 'MediaTypeFallback')
+            element_launchbox_fallback.text = '|'.join(media_type_fallback)
+            
             element_pcsx2_root = element_pcsx2.find('Root')
             if element_pcsx2_root is None:
                 element_pcsx2_root = ET.SubElement(element_pcsx2, 'Root')
@@ -1198,30 +1996,36 @@ def updateSetting(setting: int, value, save: bool, show_message = True) -> bool:
                 element_pcsx2_overwrite = ET.SubElement(element_pcsx2, 'Overwrite')
             element_pcsx2_overwrite.text = str(always_overwrite)
             
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space='  ', level=0)
-            tree.write(settings_file, encoding='utf-8', xml_declaration=True)
+            element_pcsx2_output_mode = element_pcsx2.find('OutputMode')
+            if element_pcsx2_output_mode is None:
+                element_pcsx2_output_mode = ET.SubElement(element_pcsx2, 'OutputMode')
+            element_pcsx2_output_mode.text = cover_output_mode
             
-            if show_message:
-                print('[Settings Saved]')
-            return True
-        
-        except IOError as e:
-            print(f"ERROR: Failed writing to XML file: {e}")
-        except OSError as e:
-            print(f"ERROR: Operating system error: {e}")
-        except Exception as e:
-            print(f'ERROR: {e}')
+            writeSettingsTree(ET.ElementTree(root))
+        settings_unsaved = False
         
-        print(f'ERROR: Failed to save settings to "{settings_file.name}"')
-        return False
-    else:
+        if show_message:
+            print('[Settings Saved]')
         return True
+    
+    except IOError as e:
+        print(f"ERROR: Failed writing to XML file: {e}")
+    except OSError as e:
+        print(f"ERROR: Operating system error: {e}")
+    except Exception as e:
+        print(f'ERROR: {e}')
+    finally:
+        addStageTime('Settings Write', Time.perf_counter() - save_started)
+    
+    print(f'ERROR: Failed to save settings to "{settings_file.name}"')
+    return False
 
 
 ### Show the settings menu and allow user to change and save each setting.
 def showSettingsMenu():
+    waitForCatalogs()
     resize_cover_image_str = f'{resize_cover_image}p' if resize_cover_image else 'No Resize'
+    media_type_fallback_str = ' > '.join(media_type_fallback) if len(media_type_fallback) else 'None, Use Every Category'
     choices = [
         f'LaunchBox Root Directory\n        Current: {launchbox_root}\n',
         f'PCSX2 Root Directory\n        Current: {pcsx2_root}\n',
@@ -1229,6 +2033,8 @@ def showSettingsMenu():
         f'PCSX2 Cover Image Resize\n        Current: {resize_cover_image_str}\n',
         f'Always Overwrite PCSX2 Cover Images\n        Current: {always_overwrite}\n',
         f'Search For Both Arabic and Roman Numerals\n        Current: {search_both_number_systems}\n',
+        f'Cover Image Output When Not Resized\n        Current: {cover_output_mode}\n',
+        f'LaunchBox Image Category Order (For "{MEDIA_TYPE_ALL}")\n        Current: {media_type_fallback_str}\n',
         f'Restore All Setting Defaults\n'
     ]
     setting_selection = selectionMenu(
@@ -1258,6 +2064,44 @@ def showSettingsMenu():
             if selection:
                 updateSetting(setting_selection, launchbox_media_type_list[selection - 1][TYPE], True)
         
+        elif setting_selection == MEDIA_TYPE_FALLBACK:
+            media_types = [media_type[TYPE] for media_type in launchbox_media_type_list if media_type[TYPE] != MEDIA_TYPE_ALL]
+            fallback_chain = []
+            while len(fallback_chain) < len(media_types):
+                remaining_media_types = [media_type for media_type in media_types if media_type not in fallback_chain]
+                if len(fallback_chain) == 0:
+                    selection = selectionMenu(
+                        ['Select the first image category to try:',
+                         '  (Or the last option to offer images from every category)\n'],
+                        remaining_media_types + ['Use Every Category'],
+                        '--No Change--', 3
+                    )
+                    if selection == 0:
+                        break
+                else:
+                    selection = selectionMenu(
+                        ['Select the next image category to try if none found:',
+                         f'  (Current Order: {" > ".join(fallback_chain)})\n'],
+                        remaining_media_types,
+                        '--Done--', 3
+                    )
+                if selection == 0 or selection > len(remaining_media_types):
+                    updateSetting(setting_selection, fallback_chain, True)
+                    break
+                fallback_chain.append(remaining_media_types[selection - 1])
+            else:
+                updateSetting(setting_selection, fallback_chain, True)
+        
+        elif setting_selection == COVER_OUTPUT_MODE:
+            selection = selectionMenu(
+                [f'Select a {setting}:',
+                 '  (Links and reflinks fallback to copying if not supported between folders)\n'],
+                COVER_OUTPUT_MODES,
+                '--No Change--'
+            )
+            if selection:
+                updateSetting(setting_selection, COVER_OUTPUT_MODES[selection - 1], True)
+        
         elif setting_selection == ALWAYS_OVERWRITE or setting_selection == SEARCH_BOTH_NUMBER_SYSTEMS:
             toggle = [True, False]
             selection = selectionMenu(
@@ -1306,60 +2150,60 @@ def showSettingsMenu():
 ###     (choice) The string representing the choice being made.
 ###     (selection) The specific option selected from the choice given.
 ###     --> Returns a [bool] Success or Failure
+@timedStage('Settings Write')
 def updateSavedChoice(game_title: str, game_path: str, choice: str, selection: int) -> bool:
-    if settings_file.exists():
-        tree = ET.parse(settings_file)
-        root = tree.getroot()
-        game_found = False
-        path_found = False
-        choice_updated = False
-        
-        for element_game in root.findall('Game'):
-            element_game_title = element_game.find('Title')
+    with lockFile(settings_lock_file):
+        if settings_file.exists():
+            tree = ET.parse(settings_file)
+            root = tree.getroot()
+            game_found = False
+            path_found = False
+            choice_updated = False
             
-            if element_game_title.text == game_title:
-                game_found = True
-                element_path = element_game.find(f'.//Disc[@path="{game_path}"]')
+            for element_game in root.findall('Game'):
+                element_game_title = element_game.find('Title')
                 
-                if element_path is not None:
-                    path_found = True
-                    
-                    if choice == 'Image' or choice == 'Overwrite':
-                        element_choice = element_path.find(f'.//{choice}[@type="{launchbox_media_type}"]')
-                    else:
-                        element_choice = element_path.find(choice)
+                if element_game_title.text == game_title:
+                    game_found = True
+                    element_path = element_game.find(f'.//Disc[@path="{game_path}"]')
                     
-                    if element_choice is not None:
-                        element_choice.text = str(selection)
-                        choice_updated = True
-                break
-        
-        if not game_found:
-            element_game = ET.SubElement(root, 'Game')
-            element_game_title = ET.SubElement(element_game, 'Title')
-            element_game_title.text = game_title
-        
-        if not path_found:
-            element_path = ET.SubElement(element_game, 'Disc')
-            element_path.set('path', game_path)
-        
-        if not choice_updated:
-            element_choice = ET.SubElement(element_path, choice)
+                    if element_path is not None:
+                        path_found = True
+                        
+                        if choice == 'Image' or choice == 'Overwrite':
+                            element_choice = element_path.find(f'.//{choice}[@type="{launchbox_media_type}"]')
+                        else:
+                            element_choice = element_path.find(choice)
+                        
+                        if element_choice is not None:
+                            element_choice.text = str(selection)
+                            choice_updated = True
+                    break
             
-            if choice == 'Image' or choice == 'Overwrite':
-                element_choice.set('type', launchbox_media_type)
+            if not game_found:
+                element_game = ET.SubElement(root, 'Game')
+                element_game_title = ET.SubElement(element_game, 'Title')
+                element_game_title.text = game_title
             
-            element_choice.text = str(selection)
-            choice_updated = True
-        
-        if choice_updated:
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space='  ', level=0)
-            tree.write(settings_file, encoding='utf-8', xml_declaration=True)
-            return True
-    else:
-        print(f'Failed to find and update "{settings_file.name}"')
-    return False
+            if not path_found:
+                element_path = ET.SubElement(element_game, 'Disc')
+                element_path.set('path', game_path)
+            
+            if not choice_updated:
+                element_choice = ET.SubElement(element_path, choice)
+                
+                if choice == 'Image' or choice == 'Overwrite':
+                    element_choice.set('type', launchbox_media_type)
+                
+                element_choice.text = str(selection)
+                choice_updated = True
+            
+            if choice_updated:
+                writeSettingsTree(ET.ElementTree(root))
+                return True
+        else:
+            print(f'Failed to find and update "{settings_file.name}"')
+        return False
 
 
 ### Remove a user choice from the XML file.
@@ -1367,39 +2211,39 @@ def updateSavedChoice(game_title: str, game_path: str, choice: str, selection: i
 ###     (game_path) The current game disc path.
 ###     (choice) The string representing the choice being made.
 ###     --> Returns a [int] Selection
+@timedStage('Settings Write')
 def removeSavedChoice(game_title: str, game_path: str, choice: str) -> bool:
-    if settings_file.exists():
-        tree = ET.parse(settings_file)
-        root = tree.getroot()
-        choice_removed = False
-        
-        for element_game in root.findall('Game'):
-            element_game_title = element_game.find('Title')
+    with lockFile(settings_lock_file):
+        if settings_file.exists():
+            tree = ET.parse(settings_file)
+            root = tree.getroot()
+            choice_removed = False
             
-            if element_game_title.text == game_title:
-                element_path = element_game.find(f'.//Disc[@path="{game_path}"]')
+            for element_game in root.findall('Game'):
+                element_game_title = element_game.find('Title')
                 
-                if element_path is not None:
-                    
-                    element_choice = None
-                    if choice == 'Image' or choice == 'Overwrite':
-                        element_choice = element_path.find(f'.//{choice}[@type="{launchbox_media_type}"]')
-                    else:
-                        element_choice = element_path.find(choice)
+                if element_game_title.text == game_title:
+                    element_path = element_game.find(f'.//Disc[@path="{game_path}"]')
                     
-                    if element_choice is not None:
-                        element_path.remove(element_choice)
-                        choice_removed = True
-                break
-        
-        if choice_removed:
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space='  ', level=0)
-            tree.write(settings_file, encoding='utf-8', xml_declaration=True)
-            return True
-    else:
-        print(f'Failed to find and update "{settings_file.name}"')
-    return False
+                    if element_path is not None:
+                        
+                        element_choice = None
+                        if choice == 'Image' or choice == 'Overwrite':
+                            element_choice = element_path.find(f'.//{choice}[@type="{launchbox_media_type}"]')
+                        else:
+                            element_choice = element_path.find(choice)
+                        
+                        if element_choice is not None:
+                            element_path.remove(element_choice)
+                            choice_removed = True
+                    break
+            
+            if choice_removed:
+                writeSettingsTree(ET.ElementTree(root))
+                return True
+        else:
+            print(f'Failed to find and update "{settings_file.name}"')
+        return False
 
 
 ### Get a user selected choice from the XML file.
@@ -1436,6 +2280,7 @@ def getSavedChoice(game_title: str, game_path: str, choice: str) -> int:
 ###     (app_dir) LAUNCHBOX_ROOT or PCSX2_ROOT.
 ###     --> Returns a [Path] to a Directory
 def selectDirectoryFor(app_dir) -> Path:
+    importTkinter()
     window = TK.Tk()  # Create a basic Tkinter window
     window.withdraw() # Hide the main window
     
@@ -1462,6 +2307,7 @@ def selectDirectoryFor(app_dir) -> Path:
 ### Open a dialog allowing user to select one or more PlayStation 2 discs.
 ###     --> Returns a [list] of Disc Paths
 def selectPS2Discs() -> list:
+    importTkinter()
     window = TK.Tk()  # Create a basic Tkinter window
     window.withdraw() # Hide the main window
     
@@ -1497,41 +2343,2387 @@ def openDirectory(directory_path: str):
         print(f'WARNING: Failed to open directory. Operating system unknown or unsupported: "{os_platform}"')
 
 
-### Start the overwriting process by renaming the existing image.
-###     (destination_image) The existing image file path to be renamed.
-###     (existing_images) All other images (includeing destination_image) that will later be deleted/overwritten.
-###     --> Returns a [list] of files to be later deleted/overwritten.
-def initiateOverwritingOf(destination_image: Path, existing_images: list) -> list:
-    if destination_image in existing_images:
-        temp_existing_image = destination_image.parent / f'{destination_image.name}.tmp'
-        n = 0
-        while temp_existing_image.exists():
-            n += 1
-            temp_existing_image = destination_image.parent / f'{destination_image.name}.tmp{n}'
-        destination_image.rename(temp_existing_image)
-        
-        # Remove the new image from "existing_images" and add the temp file to be later deleted/overwritten.
-        i = existing_images.index(destination_image)
-        if i > -1:
-            existing_images.pop(i)
-        existing_images.append(temp_existing_image)
-    
-    return existing_images
+### Check if the file names in a folder are case sensitive (Linux) or not (Windows, macOS). Checked once per folder.
+###     (folder) The folder path.
+###     --> Returns a [bool]
+def isCaseSensitiveFolder(folder: Path) -> bool:
+    folder = Path(folder)
+    case_sensitive = case_sensitive_folders.get(folder)
+    if case_sensitive is None:
+        swapped_case_folder = folder.with_name(folder.name.swapcase())
+        try:
+            case_sensitive = swapped_case_folder == folder or not (
+                swapped_case_folder.exists() and SameFile(folder, swapped_case_folder)
+            )
+        except OSError:
+            case_sensitive = True
+        case_sensitive_folders[folder] = case_sensitive
+    return case_sensitive
+
+
+### Forget the listed PCSX2 cover folders, so the next run lists them again (see: getCoverIndex).
+def resetCoverIndex():
+    with cover_index_lock:
+        cover_index.clear()
+
+
+### Get the cover images in a PCSX2 cover folder by name (casefolded, without extension). The folder is listed once
+### per run and kept up to date with the covers this instance writes and deletes (see: updateCoverIndex).
+### Note: Call while holding "cover_index_lock".
+###     (cover_folder) The PCSX2 cover folder.
+###     --> Returns a [dict] { Cover Name : { Image Path,...} }
+def getCoverIndex(cover_folder: Path) -> dict:
+    covers = cover_index.get(cover_folder)
+    if covers is None:
+        covers = cover_index[cover_folder] = {}
+        try:
+            with ScanDirectory(cover_folder) as entries:
+                for entry in entries:
+                    stem, extension = SplitExtension(entry.name)
+                    if extension.lower() in supported_images and entry.is_file():
+                        covers.setdefault(stem.casefold(), set()).add(Path(entry.path))
+        except OSError:
+            pass # No cover folder yet
+    return covers
+
+
+### Add or remove a PCSX2 cover image in the cover folder index (if its folder was listed this run).
+###     (image_path) The cover image file path.
+###     (exists) The cover image was written (True) or deleted (False).
+def updateCoverIndex(image_path: Path, exists: bool):
+    with cover_index_lock:
+        covers = cover_index.get(image_path.parent)
+        if covers is None:
+            return
+        same_named_images = covers.setdefault(image_path.stem.casefold(), set())
+        if exists:
+            same_named_images.add(image_path)
+        else:
+            same_named_images.discard(image_path)
+
+
+### Find all PCSX2 cover images with the same name as a cover image, with any extension in any upper/lower case.
+### Note: Where file names aren't case sensitive only the possible file names are checked. Otherwise the cover folder
+###       index is used, plus the possible lower case file names (covers other instances may have written since).
+###     (destination_image) The PCSX2 cover image file path.
+###     --> Returns a [list] of existing image Paths
+def findSameNamedCovers(destination_image: Path) -> list:
+    destination_directory = destination_image.parent
+    possible_images = [destination_directory / (destination_image.stem + extension) for extension in supported_images]
+    if not isCaseSensitiveFolder(destination_directory):
+        return [image for image in possible_images if image.is_file()]
+    with cover_index_lock:
+        indexed_images = getCoverIndex(destination_directory).get(destination_image.stem.casefold(), ())
+        same_named_images = sorted(image for image in indexed_images if image.stem == destination_image.stem)
+    return [image for image in same_named_images + [image for image in possible_images if image not in same_named_images]
+            if image.is_file()]
+
+
+### Copy (and if set, resize) a LaunchBox image into a temp file next to the destination, then atomically
+### replace the destination with it. An existing cover is never touched until the new one is fully written.
+###     (source_image) The LaunchBox image file path.
+###     (destination_image) The PCSX2 cover image file path.
+###     (replaced_images) Other existing images (same name, any extension) to delete once the new cover is in place.
+###                       None (or empty) if overwriting wasn't allowed.
+###     --> Returns a [tuple] (Copied, Resized)
+def writeCoverImage(source_image: Path, destination_image: Path, replaced_images: list = None) -> (bool, bool):
+    replaced_images = list(replaced_images) if replaced_images else []
+    image_copied = False
+    image_resized = False
+    temp_image = destination_image.parent / (
+        f'{destination_image.stem}.{PID()}-{next(temp_cover_counter)}-{HOST_TAG}{TEMP_COVER_TAG}{destination_image.suffix}'
+    )
+    
+    if resize_cover_image > 0:
+        print()
+        image_copied = image_resized = createResizedCover(source_image, resize_cover_image, temp_image)
+    
+    # If image resizing din't happen for whatever reason, just link or copy the image to the temp file.
+    if not image_copied:
+        try:
+            linkOrCopyFile(source_image, temp_image, cover_output_mode)
+            image_copied = True
+        except FileNotFoundError:
+            print(f'\nERROR: Source image "{source_image}" not found.')
+        except PermissionError:
+            print(f'\nERROR: Permission denied when copying "{source_image}" to "{temp_image}".')
+        except SameFileError:
+            print(f'\nERROR: Source and destination images are the same: "{source_image}".')
+        except Exception as e:
+            print(f'\nERROR: Failed copying: "{source_image}" to "{temp_image}"\nAn unexpected error occurred: {e}')
+    
+    if not image_copied:
+        temp_image.unlink(missing_ok=True)
+        return False, False
+    
+    # Other instances/threads may be replacing a cover image of the same name right now, so the new cover and
+    # deleting the other same named images (any extension) are done while holding the cover image's lock.
+    with lockCoverImage(destination_image):
+        
+        # Same named images created since this cover job was planned (by another instance) were never allowed to be
+        # overwritten, unless always overwriting.
+        same_named_images = findSameNamedCovers(destination_image)
+        if same_named_images and not replaced_images and not always_overwrite:
+            countInReport('Covers Already Existing (Not Overwritten)')
+            print(f'\nSkipped, Cover Image Already Exists (Overwrite Not Allowed): "{destination_image}"')
+            temp_image.unlink(missing_ok=True)
+            return False, False
+        
+        try:
+            ReplaceFile(temp_image, destination_image)
+        except PermissionError:
+            print(f'\nERROR: Permission denied. Unable to replace "{destination_image}".')
+            image_copied = image_resized = False
+        except OSError as e:
+            print(f'\nERROR: Failed to replace file: "{destination_image}"\nAn unexpected error occurred: {e}')
+            image_copied = image_resized = False
+        
+        if not image_copied:
+            try:
+                temp_image.unlink(missing_ok=True)
+            except OSError as e:
+                print(f'ERROR: Failed to delete temp file: "{temp_image}": {e}')
+            return False, False
+        
+        updateCoverIndex(destination_image, True)
+        
+        # Delete any other images with the same name, only one cover image can be shown per game in PCSX2.
+        # Note: Includes any created by another instance after this cover job was planned.
+        replaced_images += [image for image in same_named_images if image not in replaced_images]
+        for deleted_image in replaced_images:
+            if deleted_image == destination_image:
+                continue
+            try:
+                deleted_image.unlink(missing_ok=True)
+                updateCoverIndex(deleted_image, False)
+            except PermissionError:
+                print(f'ERROR: Permission denied while attempting to delete file: "{deleted_image}".')
+            except IsADirectoryError:
+                print(f'ERROR: "{deleted_image}" is a directory, not a file.')
+            except Exception as e:
+                print(f'ERROR: Failed to delete file: "{deleted_image}"\nAn unexpected error occurred: {e}')
+    
+    return image_copied, image_resized
+
+
+### Resize a LaunchBox image into a new cover image, reusing a cached rendition if the same image content was
+### already resized to the same height (and caching the new rendition if not).
+###     (source_image) The LaunchBox image.
+###     (new_height) Height to resize to.
+###     (save_path) Where to save the resized image.
+###     --> Returns a [bool] True if a resized image was saved
+def createResizedCover(source_image: Path, new_height: int, save_path: Path) -> bool:
+    rendition = getRenditionPath(source_image, new_height, save_path.suffix)
+    if rendition:
+        try:
+            CopyFile(str(rendition), str(save_path))
+            Path(rendition).touch() # Most recently used
+            countInReport('Rendition Cache Hits')
+            print(f'Resized Image Reused From Cache: {rendition.name}')
+            return True
+        except FileNotFoundError:
+            pass # Not cached (yet) or just removed.
+        except OSError as e:
+            print(f'WARNING: Failed to reuse cached rendition "{rendition.name}": {e}')
+    
+    if not resizeCoverImage(source_image, new_height, save_path):
+        return False
+    
+    if rendition:
+        countInReport('Rendition Cache Misses')
+        addRenditionToCache(save_path, rendition)
+    return True
+
+
+### Get the SHA-256 hash of a LaunchBox image, only reading the image again if its size or modified time changed.
+###     (image_path) The LaunchBox image.
+###     --> Returns a [str] Hex Digest
+def getSourceHash(image_path: Path) -> str:
+    stats = Path(image_path).stat()
+    with source_hashes.lock:
+        known_hash = source_hashes.get().get(str(image_path))
+    if known_hash and known_hash[:2] == (stats.st_size, stats.st_mtime_ns):
+        return known_hash[2]
+    
+    file_hash = getFileHash(image_path)
+    with source_hashes.lock:
+        source_hashes.get()[str(image_path)] = (stats.st_size, stats.st_mtime_ns, file_hash)
+        source_hashes.saveAtExit() # So unchanged images don't need to be read again next time.
+    return file_hash
+
+
+### Get the path a rendition of a LaunchBox image is (or would be) cached at.
+### Note: Named by image content, so a renamed/moved image or the same image used in another category still matches.
+###     (source_image) The LaunchBox image.
+###     (new_height) Height of the rendition.
+###     (image_format) File extension the rendition is saved as.
+###     --> Returns a [Path] or None if renditions aren't cached
+def getRenditionPath(source_image: Path, new_height: int, image_format: str) -> Path:
+    if rendition_cache_size_mb <= 0:
+        return None
+    try:
+        source_hash = getSourceHash(source_image)
+    except OSError:
+        return None
+    return rendition_cache_folder / f'{source_hash}-{new_height}-{BICUBIC}{image_format.lower()}'
+
+
+### Add a newly resized image to the rendition cache, removing the least recently used renditions if it's full.
+###     (resized_image) The resized image.
+###     (rendition) Its path in the rendition cache.
+def addRenditionToCache(resized_image: Path, rendition: Path):
+    global rendition_cache_bytes
+    
+    try:
+        rendition_cache_folder.mkdir(parents=True, exist_ok=True)
+        temp_rendition = rendition.with_name(f'{rendition.name}.{PID()}-{next(temp_cover_counter)}.tmp')
+        CopyFile(str(resized_image), str(temp_rendition))
+        ReplaceFile(temp_rendition, rendition)
+    except OSError as e:
+        print(f'WARNING: Failed to cache rendition "{rendition.name}": {e}')
+        return
+    
+    with rendition_cache_lock:
+        if rendition_cache_bytes is None:
+            rendition_cache_bytes = sum(
+                entry.stat().st_size for entry in rendition_cache_folder.glob(f'*-{BICUBIC}.*') if entry.suffix != '.tmp'
+            )
+        else:
+            rendition_cache_bytes += rendition.stat().st_size
+        if rendition_cache_bytes <= rendition_cache_size_mb * 1048576:
+            return
+        
+        # Least recently used first.
+        renditions = []
+        for entry in rendition_cache_folder.glob(f'*-{BICUBIC}.*'):
+            if entry.suffix == '.tmp':
+                continue
+            try:
+                stats = entry.stat()
+                renditions.append((stats.st_mtime_ns, stats.st_size, entry))
+            except OSError:
+                continue
+        renditions.sort()
+        rendition_cache_bytes = sum(size for modified_time, size, entry in renditions)
+        for modified_time, size, entry in renditions:
+            if rendition_cache_bytes <= rendition_cache_size_mb * 1048576 * RENDITION_CACHE_TRIM:
+                break
+            try:
+                entry.unlink()
+                rendition_cache_bytes -= size
+                countInReport('Renditions Removed From Cache')
+            except OSError:
+                continue
+
+
+### Link a file using the chosen output mode, falling back to a normal copy if linking isn't possible.
+### Note: Linking is safe since covers are always written to a new temp file and never edited in place.
+###     (source_file) The file to link to or copy.
+###     (destination_file) The new file path (must not already exist).
+###     (output_mode) OUTPUT_COPY, OUTPUT_HARD_LINK, OUTPUT_SYMBOLIC_LINK, or OUTPUT_REFLINK.
+###     --> Returns a [str] The output mode actually used
+@timedStage('Image Copy/Link')
+def linkOrCopyFile(source_file: Path, destination_file: Path, output_mode: str = OUTPUT_COPY) -> str:
+    try:
+        if output_mode == OUTPUT_HARD_LINK:
+            HardLink(source_file, destination_file)
+            return OUTPUT_HARD_LINK
+        
+        elif output_mode == OUTPUT_SYMBOLIC_LINK:
+            SymbolicLink(Path(source_file).resolve(), destination_file)
+            return OUTPUT_SYMBOLIC_LINK
+        
+        elif output_mode == OUTPUT_REFLINK and IOControl:
+            with open(source_file, 'rb') as source, open(destination_file, 'wb') as destination:
+                IOControl(destination.fileno(), FICLONE, source.fileno())
+            CopyFileStats(source_file, destination_file)
+            return OUTPUT_REFLINK
+    
+    except OSError:
+        # Different drives/file systems, no permission to create links, or reflinks not supported.
+        Path(destination_file).unlink(missing_ok=True)
+    
+    CopyFile(str(source_file), str(destination_file))
+    return OUTPUT_COPY
+
+
+### Check if a process on this computer is still running.
+###     (pid) The process ID.
+###     --> Returns a [bool] True if running (or if it can't be told)
+def isProcessRunning(pid: int) -> bool:
+    if pid == PID():
+        return True
+    if SYS.platform == 'win32':
+        # Note: os.kill() on Windows ends the process, so ask the system instead.
+        import ctypes as CTypes
+        kernel32 = CTypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return kernel32.GetLastError() == 5 # Access denied, it exists.
+        try:
+            exit_code = CTypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, CTypes.byref(exit_code)):
+                return True
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        SignalProcess(pid, 0) # Signal 0 only checks the process exists.
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass # Owned by another user, but running.
+    return True
+
+
+### Remove temp cover images left behind by an interrupted run.
+### A temp cover is abandoned if it was made on this computer by a process that's no longer running, or (made by any
+### computer or process) if it's older than "STALE_TEMP_COVER_AGE", so temps of other computers and of reused process
+### IDs don't stay forever.
+### Note: Temp covers keep the source image's modified time (copies, links), so their age is taken from the newer of
+###       their modified and status change (Windows: creation) times, which are set when the temp cover is made.
+###     (image_folder) The PCSX2 cover image folder.
+###     --> Returns a [int] Count of files removed
+def removeStaleTempCovers(image_folder) -> int:
+    image_folder = Path(image_folder)
+    removed = 0
+    if not image_folder.is_dir():
+        return removed
+    running_processes = {}
+    stale_time = Time.time() - STALE_TEMP_COVER_AGE
+    for temp_image in image_folder.glob(f'*{TEMP_COVER_TAG}.*'):
+        try:
+            stats = temp_image.lstat() # A temp cover may be a symbolic link.
+        except OSError:
+            continue
+        if max(stats.st_mtime, stats.st_ctime) >= stale_time:
+            temp_tag = RE_TEMP_COVER_TAG.search(temp_image.name)
+            if not temp_tag or temp_tag.group(2) != HOST_TAG:
+                continue # Not a temp cover made by this script on this computer.
+            pid = int(temp_tag.group(1))
+            if pid not in running_processes:
+                running_processes[pid] = isProcessRunning(pid)
+            if running_processes[pid]:
+                continue
+        try:
+            temp_image.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass # Already replaced or removed by the process that made it.
+        except OSError as e:
+            print(f'ERROR: Failed to delete temp file: "{temp_image}": {e}')
+    if removed:
+        print(f'[Removed {removed} Stale Temp Cover Image(s)]')
+    return removed
+
+
+### Get the saved PCSX2 title and LaunchBox images matched to a LaunchBox game disc.
+###     (game) A LaunchBox GameRecord.
+###     (disc_path) One of its disc paths.
+###     --> Returns a [dict] { 'title' : PCSX2 Title, 'images' : { Media Type : Image Path } } (Empty if none saved)
+def getResolvedMatch(game: GameRecord, disc_path: str) -> dict:
+    global resolved_matches
+    
+    with resolved_matches_lock:
+        if resolved_matches is None:
+            resolved_matches = {}
+            try:
+                with open(resolved_matches_file, 'r', encoding='utf-8') as file:
+                    resolved_matches = JSON.load(file)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f'WARNING: Ignoring unreadable matches file "{resolved_matches_file.name}": {e}')
+        return resolved_matches.get(game[ID], {}).get(disc_path, {})
+
+
+### Get the PCSX2 title matched to a LaunchBox game disc before, if it's still in the PCSX2 game list.
+###     (game) A LaunchBox GameRecord.
+###     (disc_path) One of its disc paths.
+###     --> Returns a [str] PCSX2 Title or '' if none saved or out of date
+def getResolvedTitle(game: GameRecord, disc_path: str) -> str:
+    pcsx2_game_title = getResolvedMatch(game, disc_path).get('title', '')
+    if pcsx2_game_title and pcsx2_game_title not in pcsx2_full_game_titles:
+        countInReport('Out Of Date Matches')
+        return ''
+    return pcsx2_game_title
+
+
+### Get the LaunchBox image chosen for a game disc before (in the current image category), if it still exists.
+###     (game) A LaunchBox GameRecord.
+###     (disc_path) One of its disc paths.
+###     --> Returns a [Path] or None if none saved or out of date
+def getResolvedImage(game: GameRecord, disc_path: str) -> Path:
+    image_path = getResolvedMatch(game, disc_path).get('images', {}).get(launchbox_media_type)
+    if image_path is None:
+        return None
+    if not Path(image_path).is_file():
+        countInReport('Out Of Date Matches')
+        return None
+    return Path(image_path)
+
+
+### Get a PCSX2 title from the menu selections (list positions) saved by older versions of this script.
+###     (game) A LaunchBox GameRecord.
+###     (disc_path) One of its disc paths.
+###     (full_matched_game_list) Full matched titles from searchPCSX2TitlesFor().
+###     (high_probability_game_list) Loosely matched titles from searchPCSX2TitlesFor().
+###     --> Returns a [str] PCSX2 Title or '' if none saved
+def getLegacySavedTitle(game: GameRecord, disc_path: str, full_matched_game_list: list, high_probability_game_list: list) -> str:
+    saved_selection_full = getSavedChoice(game[TITLE], disc_path, 'FullMatched') - 1
+    saved_selection_loose = getSavedChoice(game[TITLE], disc_path, 'LooseMatched') - 1
+    pcsx2_game_title = ''
+    if len(full_matched_game_list) > saved_selection_full > -1:
+        pcsx2_game_title = full_matched_game_list[saved_selection_full]
+    elif len(high_probability_game_list) > saved_selection_loose > -1:
+        pcsx2_game_title = high_probability_game_list[saved_selection_loose]
+    if pcsx2_game_title:
+        saveResolvedMatch(game, disc_path, pcsx2_game_title=pcsx2_game_title)
+    return pcsx2_game_title
+
+
+### Remember the PCSX2 title and/or LaunchBox image matched to a LaunchBox game disc.
+### Note: Saved to file by saveResolvedMatches() after each run (and when this script closes).
+###     (game) A LaunchBox GameRecord.
+###     (disc_path) One of its disc paths.
+###     (pcsx2_game_title) The matching PCSX2 title.
+###     (source_image) The LaunchBox image chosen (for the current image category).
+def saveResolvedMatch(game: GameRecord, disc_path: str, pcsx2_game_title: str = None, source_image: Path = None):
+    if planning_covers:
+        return # Dry run
+    getResolvedMatch(game, disc_path) # Make sure saved matches are loaded first.
+    with resolved_matches_lock:
+        match = resolved_matches.setdefault(game[ID], {}).setdefault(disc_path, {})
+        if pcsx2_game_title is not None:
+            match['title'] = pcsx2_game_title
+        if source_image is not None:
+            match.setdefault('images', {})[launchbox_media_type] = str(source_image)
+        if not resolved_matches_changed:
+            AtExit.register(saveResolvedMatches)
+        resolved_matches_changed.add(game[ID])
+
+
+### Save all matched PCSX2 titles and LaunchBox images to file.
+### Note: Matches saved by other instances (like other shards) since it was read are kept, only the games matched
+###       by this instance are replaced (while holding the matches lock, slot 1 of the settings lock file).
+def saveResolvedMatches():
+    with resolved_matches_lock, lockFile(settings_lock_file, 1):
+        if not resolved_matches_changed:
+            return
+        try:
+            try:
+                with open(resolved_matches_file, 'r', encoding='utf-8') as file:
+                    saved_matches = JSON.load(file)
+            except (FileNotFoundError, ValueError):
+                saved_matches = {}
+            for game_id in resolved_matches_changed:
+                saved_matches[game_id] = resolved_matches[game_id]
+            resolved_matches.update(saved_matches)
+            temp_file = resolved_matches_file.with_name(f'{resolved_matches_file.name}.{PID()}-{HOST_TAG}.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as file:
+                JSON.dump(saved_matches, file, indent=1, ensure_ascii=False)
+            ReplaceFile(temp_file, resolved_matches_file)
+            resolved_matches_changed.clear()
+        except Exception as e:
+            print(f'WARNING: Failed to save matches file "{resolved_matches_file.name}": {e}')
+
+
+### Match a LaunchBox game disc to its PCSX2 title(s) and find its LaunchBox image, asking the user when needed.
+### Nothing is written here, each cover image still to be created is yielded as a job instead.
+###     (game) The LaunchBox game.
+###     (disc_path) The game disc path being matched.
+###     (use_saved_selections) Reuse previous user choices saved for this game disc.
+###     (unattended) Never ask the user, skip the game disc instead if a choice is needed.
+###     (wait_for_cover) Called with each destination image before looking for existing cover images of the same name,
+###                      to wait for any cover image of that name still being written.
+###     (auto_choose_image) Pick one of several images by the "auto_image_choice" rules even if not unattended.
+###     (overwrite_existing) Replace existing cover images without asking (covers regenerated by "watch" mode).
+###     --> Yields a [tuple] ( Source Image, Destination Image, [ Replaced Images,...] ) for each cover image
+def resolveCoverJobs(game: GameRecord, disc_path: str, use_saved_selections: bool = False, unattended: bool = False,
+                     wait_for_cover = None, auto_choose_image: bool = False, overwrite_existing: bool = False):
+    pcsx2_game_title_list = []
+    countInReport('Discs Processed')
+    canceled = False
+    overwritten = False
+    would_ask = False # Planning a dry run, the real run would ask the user.
+    
+    # Get PCSX2 game title using a disc path.
+    pcsx2_game_title = getPCSX2GameTitleFrom(disc_path, DISC_PATH)
+    resolved_title = getResolvedTitle(game, disc_path) if use_saved_selections and not pcsx2_game_title else ''
+    if len(pcsx2_game_title): # Exact match has been made
+        pcsx2_game_title_list.append(pcsx2_game_title)
+    
+    # A title matched (searched for or chosen) before, no need to search again.
+    elif resolved_title:
+        pcsx2_game_title_list.append(resolved_title)
+    
+    # If for whatever reason a game disc match between LaunchBox and PCSX2 fails,
+    # fallback to a title search that allows user to select the correct title.
+    else:
+        selection = 0
+        full_matched_game_list, high_probability_game_list = searchPCSX2TitlesFor(game[TITLE])
+        
+        # Auto-select the only full match found or ask for the proper title if more than one.
+        if len(full_matched_game_list) == 1:
+            pcsx2_game_title_list.append(full_matched_game_list[selection])
+            saveResolvedMatch(game, disc_path, pcsx2_game_title=full_matched_game_list[selection])
+        else:
+            
+            use_previous_selection = use_saved_selections
+            
+            if use_previous_selection:
+                pcsx2_game_title = getLegacySavedTitle(game, disc_path, full_matched_game_list, high_probability_game_list)
+                if pcsx2_game_title:
+                    pcsx2_game_title_list.append(pcsx2_game_title)
+                else:
+                    use_previous_selection = False
+            
+            if not use_previous_selection and unattended:
+                countInReport('Discs Needing A Manual Choice')
+                print(f'\nSkipped, Multiple Or Loosely Matched PCSX2 Titles Need A Manual Choice For:')
+                print(f'  {game[TITLE]}')
+                print(f'    {disc_path}')
+                return
+            
+            if not use_previous_selection and planning_covers:
+                countInReport('Discs That Would Ask')
+                print(f'\nWould Ask, Multiple Or Loosely Matched PCSX2 Titles Need A Manual Choice For:')
+                print(f'  {game[TITLE]}')
+                print(f'    {disc_path}')
+                return
+            
+            if not use_previous_selection:
+                
+                if len(full_matched_game_list) > 1:
+                    print(f'\nLaunchBox Title Found:')
+                    print(f'  {game[TITLE]}')
+                    print(f'    {disc_path}')
+                    selection = selectionMenu(
+                        ['Multiple very similarly matched titles found in the search results.',
+                         f'Try to match one of these PCSX2 titles with the LaunchBox game title and path above.'],
+                        full_matched_game_list,
+                        '-- None Of The Above Match, Expand Search? --',
+                        2 if len(full_matched_game_list) > 9 else 1
+                    )
+                
+                if selection == 0:
+                    if len(high_probability_game_list):
+                        print(f'\nLaunchBox Title Found:')
+                        print(f'  {game[TITLE]}')
+                        print(f'    {disc_path}')
+                        selection = selectionMenu(
+                            ['No matching titles found, but here are some loosely matched search results.',
+                             f'Try to match one of these PCSX2 titles with the LaunchBox game title and path above.'],
+                            high_probability_game_list,
+                            '-- None Of The Above Match, Try Searching For Another Game? --',
+                            2 if len(high_probability_game_list) > 9 else 1
+                        )
+                    
+                    if selection == 0:
+                        print(f'\nNo Matching PCSX2 Titles Found For:')
+                        print(f'  {game[TITLE]}')
+                        print(f'    {disc_path}')
+                        return
+                    else:
+                        pcsx2_game_title_list.append(high_probability_game_list[selection - 1])
+                else:
+                    pcsx2_game_title_list.append(full_matched_game_list[selection - 1])
+                saveResolvedMatch(game, disc_path, pcsx2_game_title=pcsx2_game_title_list[-1])
+    
+    print(f'\nMatching PCSX2 Title Found:')
+    for pcsx2_game_title in pcsx2_game_title_list:
+        print(f'  {pcsx2_game_title}')
+    
+    # Find all reletive matching LaunchBox image files (unless one was already chosen before).
+    image_list = []
+    resolved_image = getResolvedImage(game, disc_path) if use_saved_selections else None
+    if resolved_image:
+        image_list.append(resolved_image)
+    else:
+        image_list = collapseSimilarImages(findImagesFor(game[TITLE]))
+    images_found = len(image_list)
+    
+    if (images_found > 0):
+        selection = 1 # 0 index
+        
+        # Select the cover image to copy over if more than one found.
+        if (images_found > 1):
+            
+            use_previous_selection = use_saved_selections
+            
+            if use_previous_selection:
+                saved_selection_image = getSavedChoice(game[TITLE], disc_path, 'Image') # Older settings files only.
+                
+                if len(image_list) >= saved_selection_image > 0:
+                    selection = saved_selection_image
+                    saveResolvedMatch(game, disc_path, source_image=image_list[selection - 1])
+                else:
+                    use_previous_selection = False
+            
+            if not use_previous_selection and (unattended or auto_choose_image):
+                selection = chooseBestImage(image_list)
+                if selection:
+                    print(f'\nPicked Image {selection} Of {images_found} Found (By {" > ".join(auto_image_choice)}):')
+                    print(f'  {image_list[selection - 1]}')
+                    saveResolvedMatch(game, disc_path, source_image=image_list[selection - 1])
+                    use_previous_selection = True
+                elif unattended:
+                    countInReport('Discs Needing A Manual Choice')
+                    print(f'\nSkipped, Multiple Images Found Need A Manual Choice For: {game[TITLE]}')
+                    return
+            
+            if not use_previous_selection and planning_covers:
+                countInReport('Discs That Would Ask')
+                print(f'\nWould Ask, Multiple Images Found Need A Manual Choice For: {game[TITLE]}')
+                return
+            
+            if not use_previous_selection:
+                selection = selectionMenu(
+                    ['Multiple images found, choose which image file to copy to the PCSX2 cover folder.'],
+                    image_list, 'Cancel/Skip'
+                )
+                if selection:
+                    saveResolvedMatch(game, disc_path, source_image=image_list[selection - 1])
+                else:
+                    canceled = True
+        
+        if not canceled:
+            for pcsx2_game_title in pcsx2_game_title_list:
+                
+                source_image = image_list[selection - 1]
+                
+                # Create a new destination/save path
+                new_image_file_name = pcsx2_game_title.replace(':', ' -') + source_image.suffix
+                destination_image = Path(pcsx2_image_folder) / new_image_file_name
+                
+                print(f'\nLaunchBox Image Found:')
+                print(f'  Source Path:      {str(source_image)}')
+                print(f'  Destination Path: {str(destination_image)}')
+                
+                # Get all existing images with the same name minus extension. Only one image can be shown per game in PCSX2,
+                # but multple images can have the same game title with different extensions.
+                if wait_for_cover:
+                    wait_for_cover(destination_image)
+                search_started = Time.perf_counter()
+                existing_images = findSameNamedCovers(destination_image)
+                addStageTime('Existing Cover Search', Time.perf_counter() - search_started)
+                
+                if len(existing_images):
+                    use_previous_selection = use_saved_selections
+                    selection = 0
+                    
+                    if use_previous_selection:
+                        saved_selection_image = getSavedChoice(game[TITLE], disc_path, 'Overwrite')
+                        if saved_selection_image == 1:
+                            selection = saved_selection_image
+                        else:
+                            use_previous_selection = False
+                    
+                    if not use_previous_selection:
+                        if always_overwrite or overwrite_existing:
+                            selection = 1
+                        elif unattended:
+                            selection = 0 # Never overwrite without permission.
+                        elif planning_covers:
+                            selection = 0
+                            would_ask = True
+                        else:
+                            selection = selectionMenu(
+                                ['An image file of the same name already exists in the PCSX2 cover image folder.',
+                                'How do you wish to proceed?'],
+                                ['Overwrite', 'Rename'], 'Cancel/Skip'
+                            )
+                            if selection == 1:
+                                updateSavedChoice(game[TITLE], disc_path, 'Overwrite', selection)
+                            else:
+                                # Only the "Overwrite" option can be saved and reused.
+                                # If another option is selected, remove previous choice.
+                                removeSavedChoice(game[TITLE], disc_path, 'Overwrite')
+                    
+                    # Existing image(s) will be replaced once the new cover image is fully written.
+                    if selection == 1:
+                        overwritten = True
+                    
+                    # Rename cover image file.
+                    elif selection == 2:
+                        while True:
+                            new_cover_image_name = input(f'\nEnter the new cover image name (existing name = "{destination_image.stem}"): ')
+                            
+                            illegal_characters_found = RE.search(r'\*|\\|\||\:|\"|\<|\>|\/|\?', new_cover_image_name)
+                             
+                            # Allow the use of the "show" command here.
+                            if isCommand(new_cover_image_name, True):
+                                continue
+                            
+                            elif illegal_characters_found:
+                                print('  One or more illegal file name characters found, please try again.')
+                                print('  Note: A file name can\'t contain any of the following characters: \\ / : * ? " < > |')
+                                continue
+                            
+                            # No Change
+                            elif new_cover_image_name == '' or new_cover_image_name == destination_image.stem:
+                                selection = selectionMenu(
+                                    ['A blank or identical name was submitted.'],
+                                    ['Try Again', 'Just Overwrite'], 'Cancel/Skip'
+                                )
+                                if selection == 1:
+                                    continue # Try Again
+                                elif selection == 2:
+                                    overwritten = True
+                                    updateSavedChoice(game[TITLE], disc_path, 'Overwrite', 1)
+                                    break
+                                else:
+                                    canceled = True
+                                    break
+                            
+                            # Change
+                            new_image_file_name = new_cover_image_name + source_image.suffix
+                            dest_image = Path(pcsx2_image_folder) / new_image_file_name
+                            if dest_image.exists():
+                                print(f'  This name "{new_cover_image_name}" already exists, please try again.')
+                            else:
+                                destination_image = dest_image
+                                break
+                    
+                    # Cancel copying and skip this game disc.
+                    elif selection == 0:
+                        canceled = True
+                
+                if canceled and would_ask:
+                    countInReport('Covers That Would Ask To Overwrite')
+                    print('\nWould Ask, Cover Image Already Exists.')
+                    canceled = would_ask = False
+                elif canceled:
+                    countInReport('Covers Canceled' if not unattended else 'Covers Already Existing (Not Overwritten)')
+                    print('\nCanceled!' if not unattended else '\nSkipped, Cover Image Already Exists (Overwrite Not Allowed).')
+                    canceled = False
+                else:
+                    yield (source_image, destination_image, existing_images if overwritten else [])
+    else:
+        countInReport('Discs Without Images')
+        print(f'\nNo Cover Images Found For The Game: {game[TITLE]}')
+
+
+### Create (copy and if set, resize) a cover image and show the result.
+###     (cover_job) A ( Source Image, Destination Image, [ Replaced Images,...] ) job from resolveCoverJobs().
+###     --> Returns a [bool] True if the cover image was created
+def writeCoverJob(cover_job: tuple) -> bool:
+    source_image, destination_image, replaced_images = cover_job
+    image_copied, image_resized = writeCoverImage(source_image, destination_image, replaced_images)
+    if image_copied:
+        countInReport('Covers Resized' if image_resized else 'Covers Copied/Linked')
+        print(f'\nLaunchBox Image:\n  "{str(source_image)}"')
+        if image_resized:
+            print(f'Copied and Resized Successfully To The PCSX2 Folder:')
+        else:
+            print(f'Copied Successfully To The PCSX2 Folder:')
+        print(f'  "{str(destination_image)}"')
+    return image_copied
+
+
+### Match a LaunchBox game disc to its PCSX2 title(s), find its LaunchBox image, and create the PCSX2 cover image.
+###     (game) The LaunchBox game.
+###     (disc_path) The game disc path being matched.
+###     (use_saved_selections) Reuse previous user choices saved for this game disc.
+###     (unattended) Never ask the user, skip the game disc instead if a choice is needed.
+###     (overwrite_existing) Replace existing cover images without asking.
+###     --> Returns a [bool] True if a cover image was created
+def processGameDisc(game: GameRecord, disc_path: str, use_saved_selections: bool = False, unattended: bool = False,
+                    overwrite_existing: bool = False) -> bool:
+    covers_created = 0
+    resetCoverIndex()
+    for cover_job in resolveCoverJobs(game, disc_path, use_saved_selections, unattended,
+                                      overwrite_existing=overwrite_existing):
+        covers_created += writeCoverJob(cover_job)
+    saveResolvedMatches()
+    return covers_created > 0
+
+
+### Create cover images for many game discs as a bounded pipeline:
+###   game discs -> cover jobs (matched here, may ask the user) -> resize/copy/write (worker threads)
+### Game discs are pulled one at a time and matching waits whenever "max_images_in_flight" cover images are
+### already being created, so memory use stays flat no matter how many games are in the library.
+### Note: If not unattended, what the worker threads print is held back and shown between game discs, so results are
+###       never printed in the middle of a menu or prompt.
+###     (game_discs) An iterable (or generator) of ( GameRecord, Disc Path ) to process in order.
+###     (use_saved_selections) Reuse previous user choices saved for each game disc.
+###     (unattended) Never ask the user, skip a game disc instead if a choice is needed.
+###     (auto_choose_image) Pick one of several images by the "auto_image_choice" rules even if not unattended.
+###     --> Returns a [int] Count of cover images created
+def processGameDiscs(game_discs, use_saved_selections: bool = False, unattended: bool = False,
+                     auto_choose_image: bool = False) -> int:
+    images_in_flight = Thread.BoundedSemaphore(max(1, max_images_in_flight))
+    finished_jobs = Queue()
+    covers_created = 0
+    covers_in_flight = {} # { Cover Name : ( Cover Job, Future ) } Covers still being written, by name without extension.
+    covers_in_flight_lock = Thread.Lock()
+    held_output = None if unattended else HeldOutput(SYS.stdout)
+    resetCoverIndex()
+    
+    def getCoverName(destination_image: Path) -> str:
+        return str(destination_image.with_suffix('')).casefold()
+    
+    # Matching a disc waits for any cover of the same name still being written, so it sees that cover and asks
+    # to overwrite it (or not) just like a one at a time run would.
+    def waitForCover(destination_image: Path):
+        with covers_in_flight_lock:
+            cover_in_flight = covers_in_flight.get(getCoverName(destination_image))
+        if cover_in_flight:
+            WaitForFutures([cover_in_flight[1]])
+    
+    def writeInWorker(cover_job: tuple, disc_record: dict):
+        image_copied = False
+        if held_output:
+            held_output.hold()
+        try:
+            image_copied = writeCoverJob(cover_job)
+        except Exception as e:
+            print(f'\nERROR: Failed creating cover image "{cover_job[1]}": {e}')
+        finally:
+            images_in_flight.release()
+        finished_jobs.put((image_copied, held_output.release() if held_output else ''))
+        finishDiscRecord(disc_record, cover_job, image_copied)
+        with covers_in_flight_lock:
+            if covers_in_flight.get(getCoverName(cover_job[1]), (None,))[0] is cover_job:
+                covers_in_flight.pop(getCoverName(cover_job[1]))
+    
+    # Count (and show what was held back of) each cover image written so far.
+    def collectFinishedJobs():
+        nonlocal covers_created
+        while not finished_jobs.empty():
+            image_copied, output = finished_jobs.get()
+            covers_created += image_copied
+            print(output, end='')
+    
+    if held_output:
+        SYS.stdout = held_output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(cover_workers, max_images_in_flight)), thread_name_prefix='CoverWriter') as workers:
+            for game, disc_path in game_discs:
+                collectFinishedJobs()
+                cover_jobs = list(resolveCoverJobs(game, disc_path, use_saved_selections, unattended, waitForCover, auto_choose_image)) # Just paths, no images.
+                disc_record = {'game' : game[ID], 'disc' : disc_path, 'covers' : [], 'remaining' : len(cover_jobs), 'failed' : False}
+                if len(cover_jobs) == 0:
+                    finishDiscRecord(disc_record)
+                for cover_job in cover_jobs:
+                    images_in_flight.acquire() # Backpressure: wait for a free slot before starting another image.
+                    with covers_in_flight_lock:
+                        covers_in_flight[getCoverName(cover_job[1])] = (cover_job, workers.submit(writeInWorker, cover_job, disc_record))
+                collectFinishedJobs()
+        collectFinishedJobs()
+    finally:
+        if held_output:
+            SYS.stdout = held_output.stream
+    saveResolvedMatches()
+    return covers_created
+
+
+### Get the size of an image by only reading its header (the image isn't decoded).
+###     (image_path) The image file.
+###     --> Returns a [tuple] ( Width, Height ) or None if unknown
+def probeImageSize(image_path: Path) -> (int, int):
+    if not importPillow():
+        return None
+    try:
+        with Image.open(image_path) as image:
+            return image.size
+    except (OSError, ValueError, UnidentifiedImageError):
+        return None
+
+
+### Get the file and header details of a LaunchBox image (cached until the file changes).
+###     (image_path) The image file.
+###     --> Returns a [tuple] ( Modified Time, Width, Height ), Width and Height are 0 if unknown
+def getImageDetails(image_path: Path) -> (int, int, int):
+    try:
+        stats = StatPath(image_path)
+    except OSError:
+        return 0, 0, 0
+    details = image_details.get(image_path)
+    if details is None or details[:2] != (stats.st_size, stats.st_mtime_ns):
+        width, height = probeImageSize(image_path) or (0, 0)
+        details = image_details[image_path] = (stats.st_size, stats.st_mtime_ns, width, height)
+    return details[1:]
+
+
+### Get the perceptual hash (dHash) of a LaunchBox image: which of each pair of neighboring pixels is brighter in a
+### tiny grayscale copy of it. Images that look the same get the same (or a very close) hash at any size or format.
+### Note: JPEG images are only decoded at a fraction of their full size (draft mode).
+###     (image_path) The image file.
+###     --> Returns a [int] 64 bit hash, or None if the image can't be read
+@timedStage('Perceptual Hash')
+def getPerceptualHash(image_path: Path) -> int:
+    try:
+        stats = StatPath(image_path)
+    except OSError:
+        return None
+    with image_hashes.lock:
+        known_hash = image_hashes.get().get(str(image_path))
+    if known_hash and known_hash[:2] == (stats.st_size, stats.st_mtime_ns):
+        return known_hash[2]
+    
+    if not importPillow():
+        return None
+    try:
+        with Image.open(image_path) as image:
+            image.draft('L', (PERCEPTUAL_HASH_SIZE * 8, PERCEPTUAL_HASH_SIZE * 8))
+            grid = image.convert('L').resize((PERCEPTUAL_HASH_SIZE + 1, PERCEPTUAL_HASH_SIZE), Image.Resampling.BILINEAR)
+            pixels = list(grid.getdata())
+    except (OSError, ValueError, UnidentifiedImageError):
+        return None
+    image_hash = 0
+    for row in range(PERCEPTUAL_HASH_SIZE):
+        for column in range(PERCEPTUAL_HASH_SIZE):
+            i = row * (PERCEPTUAL_HASH_SIZE + 1) + column
+            image_hash = (image_hash << 1) | (pixels[i] > pixels[i + 1])
+    countInReport('Images Hashed')
+    
+    with image_hashes.lock:
+        image_hashes.get()[str(image_path)] = (stats.st_size, stats.st_mtime_ns, image_hash)
+        image_hashes.saveAtExit() # So unchanged images don't need to be read again next time.
+    return image_hash
+
+
+### Collapse LaunchBox images that look the same into one (the largest), if "collapse_similar_images" is set.
+###     (image_list) A list of image paths.
+###     --> Returns a [list] of image paths, in the same order
+def collapseSimilarImages(image_list: list) -> list:
+    if not collapse_similar_images or len(image_list) < 2:
+        return image_list
+    
+    similar_images = [] # [ [ dHash, Image Path ],...]
+    for image_path in image_list:
+        image_hash = getPerceptualHash(image_path)
+        for similar_image in similar_images:
+            if image_hash is not None and similar_image[0] is not None:
+                if bin(similar_image[0] ^ image_hash).count('1') <= similar_image_distance:
+                    modified_time, width, height = getImageDetails(image_path)
+                    kept_modified_time, kept_width, kept_height = getImageDetails(similar_image[1])
+                    if width * height > kept_width * kept_height:
+                        similar_image[0] = image_hash
+                        similar_image[1] = image_path
+                    countInReport('Similar Images Collapsed')
+                    break
+        else:
+            similar_images.append([image_hash, image_path])
+    return [image_path for image_hash, image_path in similar_images]
+
+
+### Pick the best of several LaunchBox images for a game disc using the "auto_image_choice" rules.
+###     (image_list) A list of image paths.
+###     --> Returns a [int] Selection (1 = first image) or 0 if no rules are set
+@timedStage('Image Auto Choice')
+def chooseBestImage(image_list: list) -> int:
+    rules = [rule.lower() for rule in auto_image_choice]
+    if len(rules) == 0 or len(image_list) == 0:
+        return 0
+    regions = [region.casefold() for region in preferred_image_regions]
+    
+    # Lower is better for each rule, ties are left to the next rule (then the first image found).
+    def rank(i: int) -> list:
+        image_path = Path(image_list[i])
+        modified_time, width, height = getImageDetails(image_path)
+        ranking = []
+        for rule in rules:
+            if rule == 'region':
+                region = image_path.parent.name.casefold()
+                ranking.append(regions.index(region) if region in regions else len(regions))
+            elif rule == 'aspect':
+                ranking.append(round(abs(width / height - COVER_ASPECT_RATIO) / COVER_ASPECT_RATIO_STEP) if height else Math.inf)
+            elif rule == 'resolution':
+                ranking.append(-width * height)
+            elif rule == 'newest':
+                ranking.append(-modified_time)
+        return ranking + [i]
+    
+    countInReport('Images Picked Automatically')
+    return min(range(len(image_list)), key=rank) + 1
+
+
+### Time how long it takes to decode, resize and encode an image (in memory only) per source megapixel.
+### Used to estimate resizing time for a whole plan from a single sample image.
+###     (image_path) A sample image that needs resizing.
+###     (new_height) Height to resize to.
+###     --> Returns a [float] Seconds Per Megapixel, or 0 if the image can't be resized
+def measureResizeRate(image_path: Path, new_height: int) -> float:
+    if not importPillow():
+        return 0.0
+    try:
+        start = Time.process_time()
+        with Image.open(image_path) as image_source:
+            megapixels = image_source.width * image_source.height / 1000000
+            resized_image = resizeImage(image_source, NO_CHANGE, (CHANGE_TO, new_height), True, BICUBIC)
+            resized_image.save(BytesIO(), image_source.format or 'PNG', quality=95, compress_level=9)
+        return (Time.process_time() - start) / megapixels if megapixels else 0.0
+    except (OSError, ValueError, UnidentifiedImageError):
+        return 0.0
+
+
+### Work out what an "all" or multi-disc run would do without writing anything (dry run).
+### Uses the same matching and image decisions as a real run given the same options, but never asks: discs a real
+### run would ask about are counted as "would ask". Only image headers are read to know which images would be resized.
+###     (game_discs) An iterable (or generator) of ( GameRecord, Disc Path ).
+###     (use_saved_selections) Reuse previous user choices saved for each game disc.
+###     (unattended) Plan an unattended run, discs needing a choice are skipped instead.
+###     (auto_choose_image) Plan a run that picks one of several images by the "auto_image_choice" rules.
+###     --> Returns a [dict] The plan: action counts, bytes, megapixels and estimated seconds
+def planGameDiscs(game_discs, use_saved_selections: bool = False, unattended: bool = False,
+                  auto_choose_image: bool = False) -> dict:
+    global planning_covers
+    
+    plan = {
+        'Discs' : 0, 'Covers Created' : 0, 'Covers Overwritten' : 0, 'Covers Resized' : 0, 'Covers Copied/Linked' : 0,
+        'Discs Skipped' : 0, 'Bytes Read' : 0, 'Bytes Written' : 0, 'Resize Megapixels' : 0.0,
+        'Resize CPU Seconds' : 0.0, 'Estimated Seconds' : 0.0,
+    }
+    with run_report_lock:
+        counters_before = dict(run_report_counters)
+    resize_sample = None
+    
+    planning_covers = True
+    resetCoverIndex()
+    try:
+        for game, disc_path in game_discs:
+            plan['Discs'] += 1
+            cover_jobs = list(resolveCoverJobs(game, disc_path, use_saved_selections, unattended, None, auto_choose_image))
+            if len(cover_jobs) == 0:
+                plan['Discs Skipped'] += 1
+            for source_image, destination_image, replaced_images in cover_jobs:
+                if replaced_images or destination_image.exists():
+                    plan['Covers Overwritten'] += 1
+                else:
+                    plan['Covers Created'] += 1
+                
+                try:
+                    source_size = source_image.stat().st_size
+                except OSError:
+                    source_size = 0
+                image_size = probeImageSize(source_image) if resize_cover_image > 0 else None
+                
+                if image_size and image_size[HEIGHT] > resize_cover_image:
+                    resized_pixels = round(image_size[WIDTH] * resize_cover_image / image_size[HEIGHT]) * resize_cover_image
+                    plan['Covers Resized'] += 1
+                    plan['Bytes Read'] += source_size
+                    plan['Bytes Written'] += round(source_size * resized_pixels / (image_size[WIDTH] * image_size[HEIGHT]))
+                    plan['Resize Megapixels'] += image_size[WIDTH] * image_size[HEIGHT] / 1000000
+                    resize_sample = resize_sample or source_image
+                else:
+                    plan['Covers Copied/Linked'] += 1
+                    if cover_output_mode == OUTPUT_COPY:
+                        plan['Bytes Read'] += source_size
+                        plan['Bytes Written'] += source_size
+    finally:
+        planning_covers = False
+    
+    if resize_sample:
+        plan['Resize CPU Seconds'] = plan['Resize Megapixels'] * measureResizeRate(resize_sample, resize_cover_image)
+    plan['Estimated Seconds'] = plan['Resize CPU Seconds'] / max(1, min(cover_workers, max_images_in_flight))
+    
+    with run_report_lock:
+        for counter in ['Discs Without Images', 'Discs Needing A Manual Choice', 'Discs That Would Ask',
+                        'Covers That Would Ask To Overwrite', 'Images Picked Automatically',
+                        'Covers Already Existing (Not Overwritten)']:
+            plan[counter] = run_report_counters.get(counter, 0) - counters_before.get(counter, 0)
+    return plan
+
+
+### Print a dry run plan from planGameDiscs().
+###     (plan) The plan [dict].
+def printCoverPlan(plan: dict):
+    showTitleBox(['Dry Run: Nothing Was Written'], '=', 1, 'Center')
+    for name in ['Discs', 'Covers Created', 'Covers Overwritten', 'Covers Resized', 'Covers Copied/Linked',
+                 'Discs Skipped', 'Discs Without Images', 'Discs Needing A Manual Choice', 'Discs That Would Ask',
+                 'Covers Already Existing (Not Overwritten)', 'Covers That Would Ask To Overwrite']:
+        print(f'  {name:<44}{plan[name]:>10}')
+    print()
+    print(f'  {"Data To Read":<44}{plan["Bytes Read"] / 1048576:>9.1f} MiB')
+    print(f'  {"Data To Write":<44}{plan["Bytes Written"] / 1048576:>9.1f} MiB')
+    print(f'  {"Megapixels To Resize":<44}{plan["Resize Megapixels"]:>10.1f}')
+    print(f'  {"Estimated Resize CPU Time":<44}{plan["Resize CPU Seconds"]:>9.1f}s')
+    print(f'  {f"Estimated Run Time ({max(1, min(cover_workers, max_images_in_flight))} Workers)":<44}{plan["Estimated Seconds"]:>9.1f}s')
+    print('  Note: Discs and covers that would ask (or need a manual choice) aren\'t included in the estimate.')
+
+
+### Go through each disc of each game, showing the game before its discs are processed.
+###     (game_list) List of GameRecords.
+###     (show_divider) Show a divider line before each game.
+###     (skip_discs) Set of ( ID, Disc Path ) already completed (resumed runs), these are quietly skipped.
+###     --> Yields a [tuple] ( GameRecord, Disc Path )
+def iterateGameDiscs(game_list: list, show_divider: bool = False, skip_discs: set = frozenset()):
+    for game in game_list:
+        if skip_discs and all((game[ID], disc_path) in skip_discs for disc_path in game[DISC_PATH]):
+            countInReport('Discs Already Completed', len(game[DISC_PATH]))
+            continue
+        if show_divider:
+            print('\n--------------------------------------------------\n')
+        print(f'LaunchBox Title Found:')
+        print(f'  {game[TITLE]}')
+        for disc_path in game[DISC_PATH]:
+            print(f'    {disc_path}')
+        for disc_path in game[DISC_PATH]:
+            if (game[ID], disc_path) in skip_discs:
+                countInReport('Discs Already Completed')
+                continue
+            yield game, disc_path
+
+
+### Get the SHA-256 hash of a file.
+###     (file_path) The file to hash.
+###     --> Returns a [str] Hex Digest
+def getFileHash(file_path: Path) -> str:
+    file_hash = HashLib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1048576), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+### Read the batch journal of the last "all" run.
+###     --> Returns a [tuple] ( Header [dict] or None, [ Completed Disc Entries [dict],...], Finished [bool] )
+def loadBatchJournal(journal_file: Path = None) -> (dict, list, bool):
+    journal_file = journal_file or batch_journal_file
+    header = None
+    entries = []
+    finished = False
+    try:
+        with open(journal_file, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = JSON.loads(line)
+                except ValueError:
+                    continue # A line cut short when the run was stopped.
+                if 'started' in entry:
+                    header = entry
+                    header['processes'] = [(entry.get('pid'), entry.get('host', '*'))]
+                elif 'resumed' in entry and header:
+                    header['processes'].append((entry.get('pid'), entry.get('host', '*')))
+                elif 'finished' in entry:
+                    finished = True
+                elif 'disc' in entry:
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f'ERROR: Failed reading batch journal "{journal_file.name}": {e}')
+    return header, entries, finished
+
+
+### Start recording each completed disc of an "all" run to the batch journal.
+### When resuming, the last (unfinished) run is continued: its temp cover images are removed, and all discs it
+### completed are returned so they can be skipped, unless their cover images were changed or removed since.
+###     (resume) Continue the last unfinished run instead of starting a new one.
+###     (use_saved_selections) Saved with a new run so it's also used when resuming.
+###     --> Returns a [tuple] ( Set of Completed ( ID, Disc Path ), Use Saved Selections [bool] )
+def startBatchJournal(resume: bool = False, use_saved_selections: bool = False) -> (set, bool):
+    global batch_journal
+    global batch_journal_failures
+    
+    batch_journal_failures = 0
+    completed_discs = set()
+    header, entries, finished = loadBatchJournal() if resume else (None, [], False)
+    
+    if resume and (header is None or finished):
+        print('\n[Nothing To Resume, Starting A New Run]')
+        resume = False
+    
+    if resume:
+        use_saved_selections = header.get('use_saved_selections', use_saved_selections)
+        
+        # Remove any half-written temp cover images left by the stopped run.
+        removed = 0
+        for pid, host_tag in header['processes']:
+            for temp_image in Path(pcsx2_image_folder).glob(f'*.{pid}-*-{host_tag}{TEMP_COVER_TAG}.*'):
+                try:
+                    temp_image.unlink()
+                    removed += 1
+                except OSError as e:
+                    print(f'ERROR: Failed to delete temp file: "{temp_image}": {e}')
+        
+        for entry in entries:
+            if entry.get('skipped'):
+                continue # Nothing was created, try it again.
+            for cover in entry['covers']:
+                try:
+                    stats = Path(cover['destination']).stat()
+                    if stats.st_size != cover['size'] or stats.st_mtime_ns != cover['mtime_ns']:
+                        break # Changed since, create it again.
+                except OSError:
+                    break # Removed since, create it again.
+            else:
+                completed_discs.add((entry['game'], entry['disc']))
+        print(f'\n[Resuming Last Run: {len(completed_discs)} Disc(s) Already Completed, {removed} Temp Cover Image(s) Removed]')
+    
+    try:
+        batch_journal = open(batch_journal_file, 'a' if resume else 'w', encoding='utf-8')
+        if not resume:
+            recordInJournal({'started' : Time.strftime('%Y-%m-%dT%H:%M:%S'), 'pid' : PID(), 'host' : HOST_TAG,
+                             'use_saved_selections' : use_saved_selections,
+                             'shard' : f'{batch_shard[0]}/{batch_shard[1]}' if batch_shard else None})
+        else:
+            recordInJournal({'resumed' : Time.strftime('%Y-%m-%dT%H:%M:%S'), 'pid' : PID(), 'host' : HOST_TAG})
+    except OSError as e:
+        print(f'ERROR: Failed to open batch journal "{batch_journal_file.name}", this run can\'t be resumed: {e}')
+        batch_journal = None
+    return completed_discs, use_saved_selections
+
+
+### Get the shard ( Shard Number, Shard Count ) from a shard spec like "2/4" (the 2nd of 4 shards).
+###     (shard_spec) The shard spec.
+###     --> Returns a [tuple] ( Shard Number, Shard Count ) or None if not valid
+def parseShard(shard_spec: str) -> (int, int):
+    match = RE.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', shard_spec)
+    if match and 0 < int(match.group(1)) <= int(match.group(2)):
+        return int(match.group(1)), int(match.group(2))
+    return None
+
+
+### Check if a LaunchBox game belongs to a shard. Games are split by a hash of their LaunchBox ID, so every
+### computer/process given the same shard count gets the same disjoint slice of the library.
+###     (game) A LaunchBox GameRecord.
+###     (shard) ( Shard Number, Shard Count )
+###     --> Returns a [bool]
+def isInShard(game: GameRecord, shard: tuple) -> bool:
+    shard_number, shard_count = shard
+    game_hash = int.from_bytes(HashLib.sha1(game[ID].encode('utf-8')).digest()[:8], 'big')
+    return game_hash % shard_count == shard_number - 1
+
+
+### Get the batch journal file used by a shard, each shard has its own so they can be resumed separately.
+###     (shard) ( Shard Number, Shard Count ) or None if not sharded.
+###     --> Returns a [Path]
+def getShardJournalFile(shard: tuple) -> Path:
+    if shard is None:
+        return ROOT / f'{Path(__file__).stem}-Journal.jsonl'
+    return ROOT / f'{Path(__file__).stem}-Journal-{shard[0]}of{shard[1]}.jsonl'
+
+
+### Merge the batch journals of all shards into one summary, showing which shards finished and any cover images
+### claimed by games in more than one shard (the cover image currently in place is the one kept).
+###     --> Returns a [dict] { 'shards' : [...], 'discs' : Count, 'covers' : Count, 'conflicts' : {...} }
+def mergeShardJournals() -> dict:
+    merged = {'shards' : [], 'discs' : 0, 'covers' : 0, 'conflicts' : {}}
+    destinations = {} # { Destination : [ ( Shard, Game ID, Hash ),...] }
+    
+    for journal_file in sorted(ROOT.glob(f'{Path(__file__).stem}-Journal-*of*.jsonl')):
+        header, entries, finished = loadBatchJournal(journal_file)
+        if header is None:
+            continue
+        shard = header.get('shard') or journal_file.stem.rpartition('-')[2].replace('of', '/')
+        completed_entries = [entry for entry in entries if not entry.get('skipped')]
+        merged['shards'].append({'shard' : shard, 'finished' : finished, 'discs' : len(completed_entries),
+                                 'covers' : sum(len(entry['covers']) for entry in entries)})
+        merged['discs'] += len(completed_entries)
+        for entry in entries:
+            for cover in entry['covers']:
+                merged['covers'] += 1
+                destinations.setdefault(cover['destination'], []).append((shard, entry['game'], cover['hash']))
+    
+    for destination, claims in destinations.items():
+        if len({game_id for shard, game_id, file_hash in claims}) > 1:
+            try:
+                current_hash = getFileHash(Path(destination))
+            except OSError:
+                current_hash = None
+            merged['conflicts'][destination] = [
+                {'shard' : shard, 'game' : game_id, 'kept' : file_hash == current_hash} for shard, game_id, file_hash in claims
+            ]
+    return merged
+
+
+### Print the merged results of all shards from mergeShardJournals().
+###     (merged) The merged results [dict].
+def printShardResults(merged: dict):
+    showTitleBox(['Sharded Run Results'], '=', 1, 'Center')
+    if len(merged['shards']) == 0:
+        print('  No shard journals found (start an "all" run with "--shard=i/n").')
+        return
+    for shard in merged['shards']:
+        print(f'  Shard {shard["shard"]:<8} {"Finished" if shard["finished"] else "Unfinished":<12} '
+              f'{shard["discs"]:>7} Disc(s) {shard["covers"]:>7} Cover(s)')
+    print(f'\n  Total                 {merged["discs"]:>7} Disc(s) {merged["covers"]:>7} Cover(s)')
+    if merged['conflicts']:
+        print(f'\n  {len(merged["conflicts"])} Cover Image(s) Claimed By More Than One Game:')
+        for destination, claims in merged['conflicts'].items():
+            print(f'    {destination}')
+            for claim in claims:
+                print(f'      Shard {claim["shard"]}, Game {claim["game"]}{" (Kept)" if claim["kept"] else ""}')
+
+
+### Add an entry (a single line of JSON) to the batch journal, written right away so nothing is lost if stopped.
+###     (entry) A [dict] to record.
+def recordInJournal(entry: dict):
+    with batch_journal_lock:
+        if batch_journal:
+            batch_journal.write(JSON.dumps(entry) + '\n')
+            batch_journal.flush()
+
+
+### Record one cover job of a disc as finished. Once all cover jobs of a disc are finished (and none failed),
+### the disc is recorded in the batch journal as completed. A disc with nothing to create (skipped, canceled, no
+### images,...) is recorded as skipped instead, so resuming tries it again.
+###     (disc_record) { 'game', 'disc', 'covers', 'remaining', 'failed' } for the disc.
+###     (cover_job) The finished cover job, None if the disc had nothing to create.
+###     (image_copied) If the cover image was created.
+def finishDiscRecord(disc_record: dict, cover_job: tuple = None, image_copied: bool = False):
+    global batch_journal_failures
+    
+    if batch_journal is None:
+        return
+    if cover_job:
+        destination_image = cover_job[1]
+        try:
+            if image_copied:
+                stats = destination_image.stat()
+                cover = {'source' : str(cover_job[0]), 'destination' : str(destination_image),
+                         'hash' : getFileHash(destination_image), 'size' : stats.st_size, 'mtime_ns' : stats.st_mtime_ns}
+        except OSError:
+            image_copied = False
+    with batch_journal_lock:
+        if cover_job:
+            disc_record['remaining'] -= 1
+            if image_copied:
+                disc_record['covers'].append(cover)
+            elif not disc_record['failed']:
+                disc_record['failed'] = True
+                batch_journal_failures += 1
+        if disc_record['remaining'] > 0 or disc_record['failed']:
+            return
+    if cover_job is None:
+        recordInJournal({'game' : disc_record['game'], 'disc' : disc_record['disc'], 'covers' : [], 'skipped' : True})
+        return
+    recordInJournal({'game' : disc_record['game'], 'disc' : disc_record['disc'], 'covers' : disc_record['covers']})
+
+
+### Stop recording to the batch journal.
+### Note: If any discs failed, the run is left unfinished so they can be retried using "resume".
+def finishBatchJournal():
+    global batch_journal
+    
+    if batch_journal_failures:
+        print(f'\n[{batch_journal_failures} Disc(s) Failed, Enter "resume" To Retry Them]')
+    else:
+        recordInJournal({'finished' : Time.strftime('%Y-%m-%dT%H:%M:%S')})
+    with batch_journal_lock:
+        if batch_journal:
+            batch_journal.close()
+        batch_journal = None
+
+
+### Get the text used to match a LaunchBox game title with its image file names.
+### Note: LaunchBox replaces characters not allowed in file names with underscores.
+###     (game_title) A LaunchBox game title.
+###     --> Returns a [str]
+def getImageSearchQuery(game_title: str) -> str:
+    return game_title.replace(':', '_').replace('\'', '_').replace('\\\\', '_').replace('\\', '_').replace('//', '_').replace('/', '_')
+
+
+### Search the full PCSX2 game list for a LaunchBox game title.
+###     (game_title) A LaunchBox game title.
+###     --> Returns a [tuple] ( [Full Matched Titles], [Loosely Matched Titles] )
+def searchPCSX2TitlesFor(game_title: str) -> (list, list):
+    alt_search_item = ''
+    
+    # Check for numbers and if found, combine two search results using different numbering systems (2 <-> II).
+    if search_both_number_systems:
+        alt_search_item = changeNumberSystemIn(game_title)
+    
+    # Preform the search (and also an extra alt search if needed).
+    full_matched_game_list, high_probability_game_list = searchFor(game_title, pcsx2_full_game_list)
+    if len(alt_search_item):
+        full_matched_game_list_alt, high_probability_game_list_alt = searchFor(alt_search_item, pcsx2_full_game_list)
+        # Merge the lists, no repeats/duplicates.
+        for found_game in full_matched_game_list_alt:
+            if found_game not in full_matched_game_list:
+                full_matched_game_list.append(found_game)
+        for found_game in high_probability_game_list_alt:
+            if found_game not in full_matched_game_list and found_game not in high_probability_game_list:
+                high_probability_game_list.append(found_game)
+    return full_matched_game_list, high_probability_game_list
+
+
+### Get the LaunchBox image folders currently used to find cover images (based on the chosen image category).
+###     --> Returns a [list] of Paths, in search order
+def getImageFolders() -> list:
+    if launchbox_media_type == MEDIA_TYPE_ALL:
+        folders = {media_type: folder_path for media_type, folder_path in launchbox_media_type_list if media_type != MEDIA_TYPE_ALL}
+        fallback_folders = [Path(folders[media_type]) for media_type in media_type_fallback if media_type in folders]
+        return fallback_folders if len(fallback_folders) else [Path(folder_path) for folder_path in folders.values()]
+    return [Path(launchbox_image_folder)]
+
+
+### Check if images are searched for using the image category fallback order (stopping at the first with images).
+###     --> Returns a [bool]
+def usingMediaTypeFallback() -> bool:
+    if launchbox_media_type != MEDIA_TYPE_ALL:
+        return False
+    return any(media_type in media_type_fallback for media_type, folder_path in launchbox_media_type_list)
+
+
+### Get the key used to match LaunchBox game titles and image files in both directions.
+###     (game_title) A LaunchBox game title.
+###     (image_path) Or a LaunchBox image file path ("-01", "-02",... endings are ignored).
+###     --> Returns a [str] Image Key
+def getImageKey(game_title: str = '', image_path: Path = None) -> str:
+    if image_path is not None:
+        return RE_IMAGE_NUMBER.sub('', Path(image_path).stem).casefold()
+    return getImageSearchQuery(game_title).casefold()
+
+
+### List one folder for scanFolderTree(), splitting its entries into sub folders and files.
+###     (directory) Folder path.
+###     (extensions) Only keep files with these (lowercase) extensions, or None to keep all files.
+###     --> Returns a [tuple] ( Modified Time, [ Sub Folder Path,...], [ File DirEntry,...] )
+def scanFolder(directory: str, extensions) -> (int, list, list):
+    sub_directories = []
+    files = []
+    modified_time = StatPath(directory).st_mtime_ns
+    with ScanDirectory(directory) as entries:
+        for entry in entries:
+            # Note: The entry type comes with the folder listing, no extra stat per file needed.
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_directories.append(entry.path)
+                elif entry.is_file() and (extensions is None or SplitExtension(entry.name)[1].lower() in extensions):
+                    files.append(entry)
+            except OSError:
+                continue # Removed while listing
+    sub_directories.sort()
+    files.sort(key=lambda entry: entry.name)
+    return modified_time, sub_directories, files
+
+
+### Find every file in a folder and all its sub folders, listing many sub folders at the same time.
+###     (folder) Folder to scan.
+###     (extensions) Only find files with these (lowercase) extensions, or None to find all files.
+###     --> Returns a [list] of [tuple] ( Folder Path, Modified Time, [ File DirEntry,...] ), parent folders first, sorted by name
+def scanFolderTree(folder, extensions = None) -> list:
+    global folder_scanner
+    
+    with folder_scanner_lock:
+        if folder_scanner is None:
+            folder_scanner = ThreadPoolExecutor(max_workers=max(1, folder_scan_workers), thread_name_prefix='FolderScanner')
+    
+    folder = str(folder)
+    scanned_folders = {}  # { Folder Path : ( Modified Time, [ Sub Folder Path,...], [ File DirEntry,...] ) }
+    pending = {folder_scanner.submit(scanFolder, folder, extensions): folder}
+    while pending:
+        done, not_done = WaitForFutures(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            directory = pending.pop(future)
+            try:
+                scanned_folders[directory] = future.result()
+            except OSError:
+                continue # Removed or unreadable
+            for sub_directory in scanned_folders[directory][1]:
+                pending[folder_scanner.submit(scanFolder, sub_directory, extensions)] = sub_directory
+    
+    # Put the folders back in the same order a one folder at a time (top-down) walk would find them.
+    folder_tree = []
+    directories = [folder]
+    while directories:
+        directory = directories.pop()
+        if directory not in scanned_folders:
+            continue
+        modified_time, sub_directories, files = scanned_folders[directory]
+        folder_tree.append((directory, modified_time, files))
+        directories.extend(reversed(sub_directories))
+    countInReport('Folders Scanned', len(folder_tree))
+    return folder_tree
+
+
+### Index every LaunchBox image in one image folder (category) by its image key.
+###     (image_folder) Image folder to index.
+###     --> Returns a [dict] { Image Key : [ Image Path,...] }
+@timedStage('Image Index Build')
+def indexImageFolder(image_folder: Path) -> dict:
+    with image_index_lock:
+        folder_index = {}
+        directories = {}
+        for directory, modified_time, image_files in scanFolderTree(image_folder, supported_images):
+            directories[directory] = modified_time
+            for image_file in image_files:
+                image_path = Path(image_file.path)
+                folder_index.setdefault(getImageKey(image_path=image_path), []).append(image_path)
+        image_index[image_folder] = folder_index
+        image_index_directories[image_folder] = directories
+        countInReport('Images Indexed', sum(len(images) for images in folder_index.values()))
+        return folder_index
+
+
+### Index every LaunchBox image in the image folders, throwing out any other folders indexed before.
+###     (image_folders) Image folders to index.
+def buildImageIndex(image_folders: list):
+    global image_index_checked
+    
+    with image_index_lock:
+        image_index.clear()
+        image_index_directories.clear()
+        for image_folder in image_folders:
+            indexImageFolder(image_folder)
+        image_index_checked = Time.monotonic()
+
+
+### Make sure no images were added/removed in the indexed image folders since last checked, and throw out any
+### folders no longer used. Image folders not indexed yet are indexed when first searched.
+def refreshImageIndex():
+    global image_index_checked
+    
+    with image_index_lock:
+        image_folders = getImageFolders()
+        for image_folder in list(image_index):
+            if image_folder not in image_folders:
+                image_index.pop(image_folder)
+                image_index_directories.pop(image_folder)
+        if Time.monotonic() - image_index_checked < IMAGE_INDEX_RECHECK_TIME:
+            return
+        for image_folder, directories in list(image_index_directories.items()):
+            for directory, modified_time in directories.items():
+                try:
+                    changed = StatPath(directory).st_mtime_ns != modified_time
+                except OSError:
+                    changed = True
+                if changed:
+                    indexImageFolder(image_folder)
+                    break
+        image_index_checked = Time.monotonic()
+
+
+### Get the indexed LaunchBox images for an image key, indexing each image folder the first time it's needed.
+### Using the image category fallback order, stops at the first category with any images.
+###     (image_key) The image key from getImageKey().
+###     --> Returns a [list] of Image Paths
+def getIndexedImages(image_key: str) -> list:
+    images = []
+    stop_at_first_found = usingMediaTypeFallback()
+    with image_index_lock:
+        for i, image_folder in enumerate(getImageFolders()):
+            folder_index = image_index.get(image_folder)
+            if folder_index is None:
+                folder_index = indexImageFolder(image_folder)
+            images += folder_index.get(image_key, [])
+            if len(images) and stop_at_first_found:
+                if i:
+                    countInReport('Image Category Fallbacks')
+                break
+    return images
+
+
+### Add, keep or remove a single image in the image index after it was created, changed or deleted.
+###     (image_path) A LaunchBox image file path.
+def updateImageIndex(image_path: Path):
+    image_path = Path(image_path)
+    if image_path.suffix.lower() not in supported_images:
+        return
+    with image_index_lock:
+        folder_index = next((image_index[folder] for folder in image_path.parents if folder in image_index), None)
+        if folder_index is None:
+            return
+        image_key = getImageKey(image_path=image_path)
+        images = folder_index.setdefault(image_key, [])
+        if image_path.exists():
+            if image_path not in images:
+                images.append(image_path)
+        elif image_path in images:
+            images.remove(image_path)
+        if len(images) == 0:
+            folder_index.pop(image_key)
+
+
+### Find all LaunchBox images for a game.
+###     (game_title) A LaunchBox game title.
+###     --> Returns a [list] of Image Paths
+@timedStage('Image Discovery')
+def findImagesFor(game_title: str) -> list:
+    refreshImageIndex()
+    return getIndexedImages(getImageKey(game_title))
+
+
+### Find all LaunchBox images for many games at once, checking the image index for changes only once.
+###     (game_titles) LaunchBox game titles.
+###     --> Returns a [dict] { Game Title : [ Image Path,...] }
+@timedStage('Image Discovery')
+def findImagesForAll(game_titles: list) -> dict:
+    refreshImageIndex()
+    return {game_title: getIndexedImages(getImageKey(game_title)) for game_title in game_titles}
+
+
+### Find all LaunchBox games that would use an image file as their cover image.
+###     (image_path) A LaunchBox image file path.
+###     --> Returns a [list] of GameRecords
+def getGamesUsingImage(image_path: Path) -> list:
+    return list(launchbox_games_by_image_key.get(getImageKey(image_path=image_path), []))
+
+
+### Import the optional "watchdog" module used to get instant file change events.
+###     --> Returns a [bool] True if watchdog is installed
+def importWatchdog() -> bool:
+    global WatchdogObserver
+    global WatchdogEventHandler
+    
+    try:
+        from watchdog.observers import Observer as WatchdogObserver
+        from watchdog.events import FileSystemEventHandler as WatchdogEventHandler
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
+### Get all files and folders to watch for changes.
+###     --> Returns a [tuple] ([ Image Folders ], [ Catalog Files ])
+def getWatchedPaths() -> (list, list):
+    catalog_files = [Path(launchbox_ps2_xml), Path(launchbox_platform_xml), Path(pcsx2_game_list_file)]
+    return getImageFolders(), catalog_files
+
+
+### Get the size and modified time of every watched file (polling fallback).
+###     (image_folders) Folders to recursively scan for image files.
+###     (catalog_files) Single files to check.
+###     --> Returns a [dict] { Path String : ( Size, Modified Time ) }
+def scanWatchedPaths(image_folders: list, catalog_files: list) -> dict:
+    file_stats = {}
+    for image_folder in image_folders:
+        for directory, modified_time, image_files in scanFolderTree(image_folder, supported_images):
+            for image_file in image_files:
+                try:
+                    stats = image_file.stat() # Already known on Windows, from the folder listing.
+                    file_stats[image_file.path] = (stats.st_size, stats.st_mtime_ns)
+                except OSError:
+                    pass # Deleted while scanning
+    for path, size, modified_time in getFileSignatures(catalog_files):
+        if size is not None:
+            file_stats[path] = (size, modified_time)
+    return file_stats
+
+
+### Figure out which LaunchBox games are affected by a group of file changes, reloading any changed catalogs,
+### then create new PCSX2 cover images for just those games.
+###     (changed_paths) A set of changed (created/modified/deleted/moved) file paths.
+###     --> Returns a [bool] True if the watched paths need to be refreshed (image folders may have changed)
+def processWatchedChanges(changed_paths: set) -> bool:
+    changed_paths = {str(Path(path)) for path in changed_paths}
+    affected_games = {}  # { ID : GameRecord }
+    refresh_watched_paths = False
+    
+    # LaunchBox games added or changed.
+    if str(Path(launchbox_ps2_xml)) in changed_paths or str(Path(launchbox_platform_xml)) in changed_paths:
+        print('\n[LaunchBox Data Changed, Reloading...]')
+        old_games = {game[ID]: (game[TITLE], game[DISC_PATH]) for game in launchbox_game_list}
+        reloadCatalog(LAUNCHBOX_ROOT)
+        for game in launchbox_game_list:
+            if old_games.get(game[ID]) != (game[TITLE], game[DISC_PATH]):
+                affected_games[game[ID]] = game
+        refresh_watched_paths = str(Path(launchbox_platform_xml)) in changed_paths
+    
+    # PCSX2 games added or renamed.
+    if str(Path(pcsx2_game_list_file)) in changed_paths:
+        print('\n[PCSX2 Game List Changed, Reloading...]')
+        old_titles = {disc_path: game[TITLE] for disc_path, game in pcsx2_games_by_disc_path.items()}
+        reloadCatalog(PCSX2_ROOT)
+        for disc_path, game in pcsx2_games_by_disc_path.items():
+            if old_titles.get(disc_path) != game[TITLE]:
+                for lb_game in launchbox_games_by_disc_path.get(disc_path, []):
+                    affected_games[lb_game[ID]] = lb_game
+    
+    # LaunchBox images added or changed.
+    for path in changed_paths:
+        if Path(path).suffix.lower() in supported_images:
+            updateImageIndex(path)
+            if Path(path).exists():
+                for game in getGamesUsingImage(path):
+                    affected_games[game[ID]] = game
+    
+    if affected_games:
+        print(f'\n[{len(affected_games)} Game(s) Affected By LaunchBox/PCSX2 Changes]')
+    for game in affected_games.values():
+        for disc_path in game[DISC_PATH]:
+            print('\n--------------------------------------------------')
+            # The LaunchBox image (or title) of the game changed, so its old cover image is out of date.
+            processGameDisc(game, disc_path, True, True, True)
+    
+    return refresh_watched_paths
+
+
+### Watch LaunchBox image folders and catalog files, creating new PCSX2 cover images as LaunchBox images change.
+### Uses instant file system events if the "watchdog" module is installed, otherwise falls back to polling.
+###     (poll_interval) Seconds between polling scans.
+###     (force_polling) Always use polling, even if watchdog is installed.
+###     (max_checks) Stop after this many checks (0 = watch until Ctrl+C is pressed).
+def watchLaunchBoxImages(poll_interval: float = 5, force_polling: bool = False, max_checks: int = 0):
+    waitForCatalogs()
+    image_folders, catalog_files = getWatchedPaths()
+    use_events = not force_polling and importWatchdog()
+    print(f'\n[Watching {len(image_folders)} LaunchBox Image Folder(s) For Changes Using {"Events" if use_events else "Polling"}]')
+    print('[Press Ctrl+C To Stop Watching]')
+    
+    if use_events:
+        changed_queue = Queue()
+        
+        # Note: Only changes are handled, not opened/closed events. This script reads LaunchBox images itself (hashing,
+        #       probing, resizing), which would otherwise keep triggering itself.
+        class ChangeHandler(WatchdogEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    changed_queue.put(event.src_path)
+            
+            def on_modified(self, event):
+                if not event.is_directory:
+                    changed_queue.put(event.src_path)
+            
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    changed_queue.put(event.src_path)
+            
+            def on_moved(self, event):
+                if not event.is_directory:
+                    changed_queue.put(event.src_path)
+                    changed_queue.put(event.dest_path)
+        
+        def startObserver(image_folders: list, catalog_files: list):
+            observer = WatchdogObserver()
+            handler = ChangeHandler()
+            for image_folder in image_folders:
+                if image_folder.exists():
+                    observer.schedule(handler, str(image_folder), recursive=True)
+            for catalog_folder in {catalog_file.parent for catalog_file in catalog_files}:
+                if catalog_folder.exists():
+                    observer.schedule(handler, str(catalog_folder), recursive=False)
+            observer.start()
+            return observer
+        
+        observer = startObserver(image_folders, catalog_files)
+    else:
+        previous_stats = scanWatchedPaths(image_folders, catalog_files)
+        pending_paths = set()
+    
+    checks = 0
+    try:
+        while max_checks == 0 or checks < max_checks:
+            checks += 1
+            ready_paths = set()
+            
+            if use_events:
+                # Wait for an event, then keep collecting until changes settle (images are often written in pieces).
+                try:
+                    ready_paths.add(changed_queue.get(timeout=poll_interval))
+                    while True:
+                        ready_paths.add(changed_queue.get(timeout=WATCH_SETTLE_TIME))
+                except QueueEmpty:
+                    pass
+                watched_files = {str(catalog_file) for catalog_file in catalog_files}
+                ready_paths = {path for path in ready_paths if
+                               Path(path).suffix.lower() in supported_images or path in watched_files}
+            else:
+                Time.sleep(poll_interval)
+                current_stats = scanWatchedPaths(image_folders, catalog_files)
+                changed_paths = {path for path in current_stats.keys() | previous_stats.keys()
+                                 if current_stats.get(path) != previous_stats.get(path)}
+                previous_stats = current_stats
+                
+                # Only process files that have stopped changing since the last check.
+                ready_paths = pending_paths - changed_paths
+                pending_paths = changed_paths
+            
+            if ready_paths and processWatchedChanges(ready_paths):
+                image_folders, catalog_files = getWatchedPaths()
+                if use_events:
+                    observer.stop()
+                    observer.join()
+                    observer = startObserver(image_folders, catalog_files)
+                else:
+                    previous_stats = scanWatchedPaths(image_folders, catalog_files)
+    
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if use_events:
+            observer.stop()
+            observer.join()
+    print('\n[Stopped Watching]')
+
+
+### Get the catalog files for LaunchBox or PCSX2, used to see if a catalog changed while the daemon was running.
+###     (app_root) LAUNCHBOX_ROOT or PCSX2_ROOT.
+###     --> Returns a [list] of File Paths
+def getCatalogFiles(app_root: int) -> list:
+    if app_root == LAUNCHBOX_ROOT:
+        return [launchbox_ps2_xml, launchbox_platform_xml]
+    return [pcsx2_game_database, pcsx2_game_list_file, pcsx2_custom_game_title_file, pcsx2_settings_file]
+
+
+### Reload any catalogs whose files changed since they were last loaded by the daemon.
+def refreshCatalogsIfChanged():
+    for app_root in [LAUNCHBOX_ROOT, PCSX2_ROOT]:
+        signatures = getFileSignatures(getCatalogFiles(app_root))
+        if loaded_catalog_signatures.get(app_root, signatures) != signatures:
+            print(f'\n[{"LaunchBox" if app_root == LAUNCHBOX_ROOT else "PCSX2"} Data Changed, Reloading...]')
+            reloadCatalog(app_root)
+            signatures = getFileSignatures(getCatalogFiles(app_root))
+        loaded_catalog_signatures[app_root] = signatures
+
+
+### Find the LaunchBox games for each dropped disc path.
+###     (disc_paths) List of disc paths.
+###     --> Returns a [list] of GameRecord (One disc path per game)
+def getDroppedGames(disc_paths: list) -> list:
+    found_game_list = []
+    for disc_path in disc_paths:
+        disc_path = str(Path(str(disc_path).strip().replace('"', '')))
+        games = launchbox_games_by_disc_path.get(disc_path, [])
+        if len(games) == 0:
+            print(f'\nNo PS2 Games Found In LaunchBox For: {disc_path}')
+        for game in games:
+            found_game_list.append(GameRecord(game[ID], game[TITLE], disc_path))
+    return found_game_list
+
+
+### Save a file that only the current user can read (secret tokens), it's never readable by others, not even briefly.
+###     (file) The file to save (replaced if it exists).
+###     (text) The file contents.
+def saveSecretFile(file: Path, text: str):
+    Path(file).unlink(missing_ok=True) # A new file is needed, the permissions of an existing one aren't changed.
+    with open(OpenFileDescriptor(file, O_WRONLY | O_CREAT | O_EXCL, 0o600), 'w', encoding='utf-8') as secret_file:
+        secret_file.write(text)
+
+
+### Send a request to the running daemon.
+###     (request) The request [dict] ({ 'discs' : [...] } or { 'command' : 'stop' }).
+###     --> Returns a [dict] The daemon's response, or None if no daemon is running
+def sendToDaemon(request: dict) -> dict:
+    try:
+        daemon = JSON.loads(daemon_file.read_text(encoding='utf-8'))
+        with Socket.create_connection(('127.0.0.1', daemon['port']), timeout=DAEMON_CONNECT_TIMEOUT) as connection:
+            connection.sendall((JSON.dumps(dict(request, token=daemon['token'])) + '\n').encode('utf-8'))
+            with connection.makefile('r', encoding='utf-8') as reader:
+                return JSON.loads(reader.readline())
+    except (OSError, ValueError, KeyError):
+        return None # No daemon running (or it just stopped).
+
+
+### Run as a resident daemon that keeps all catalogs, indexes and caches loaded and creates cover images for
+### disc paths sent to it (by dropping discs onto this script while the daemon is running).
+### Note: Discs are processed unattended using previously saved choices, discs needing a new choice are skipped.
+###     (port) Local port to listen on, 0 = any free port.
+def runDaemon(port: int = 0):
+    waitForCatalogs()
+    refreshCatalogsIfChanged()
+    refreshImageIndex()
+    
+    requests = Queue()
+    token = RandomBytes(16).hex()
+    server = Socket.socket(Socket.AF_INET, Socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', port)) # Local connections only.
+    server.listen()
+    
+    def acceptClients():
+        while True:
+            try:
+                connection, address = server.accept()
+            except OSError:
+                break # Server closed.
+            with connection:
+                try:
+                    connection.settimeout(5)
+                    with connection.makefile('r', encoding='utf-8') as reader:
+                        request = JSON.loads(reader.readline())
+                    disc_paths = None
+                    if request.get('token') != token:
+                        response = {'error' : 'Invalid token'}
+                    elif request.get('command') == 'stop':
+                        response = {'stopping' : True}
+                    else:
+                        disc_paths = [str(disc_path) for disc_path in request.get('discs', [])]
+                        response = {'accepted' : len(disc_paths)}
+                    connection.sendall((JSON.dumps(response) + '\n').encode('utf-8'))
+                    if 'error' not in response:
+                        requests.put(disc_paths) # Queued after responding, so the client isn't kept waiting.
+                except (OSError, ValueError, AttributeError) as e:
+                    print(f'\nWARNING: Bad daemon request: {e}')
+    
+    Thread.Thread(target=acceptClients, name='DaemonServer', daemon=True).start()
+    try:
+        saveSecretFile(daemon_file, JSON.dumps({'port' : server.getsockname()[1], 'token' : token, 'pid' : PID()}))
+    except OSError as e:
+        print(f'ERROR: Failed to save daemon file "{daemon_file.name}", dropped discs won\'t be sent to this daemon: {e}')
+    print(f'\n[Daemon Running On Port {server.getsockname()[1]}, Drop PS2 Discs Onto This Script To Create Their Cover Images]')
+    print('[Press Ctrl+C To Stop The Daemon]')
+    
+    try:
+        while True:
+            try:
+                disc_paths = requests.get(timeout=1)
+            except QueueEmpty:
+                continue
+            if disc_paths is None:
+                break
+            # Handle every request already waiting as one batch.
+            while not requests.empty():
+                more_disc_paths = requests.get()
+                if more_disc_paths is None:
+                    requests.put(None)
+                    break
+                disc_paths += more_disc_paths
+            
+            resetRunReport()
+            try:
+                refreshCatalogsIfChanged()
+                processGameDiscs(iterateGameDiscs(getDroppedGames(disc_paths), True), True, True)
+            except Exception as e: # Keep the daemon running for the next dropped discs.
+                print(f'\nERROR: Failed to create cover images for {len(disc_paths)} dropped disc(s): {e}')
+            printRunReport(f'Daemon Run Report ({len(disc_paths)} Disc(s))')
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            if JSON.loads(daemon_file.read_text(encoding='utf-8')).get('pid') == PID():
+                daemon_file.unlink()
+        except (OSError, ValueError):
+            pass
+    print('\n[Daemon Stopped]')
+
+
+### Turn a game list entry into something that can be sent as JSON.
+###     (game) A GameRecord or PCSX2 title.
+###     --> Returns a [dict] or [str]
+def getGameAsJSON(game) -> dict:
+    if isinstance(game, GameRecord):
+        return {'id' : game[ID], 'title' : game[TITLE], 'disc_paths' : list(game[DISC_PATH])}
+    return game
+
+
+### Resolve LaunchBox games to the PCSX2 titles and LaunchBox images that would be used for their cover images,
+### without asking the user anything or creating any cover images.
+###     (game_ids) LaunchBox game IDs.
+###     --> Returns a [list] of [dict] (One per game ID)
+def resolveGamesForAPI(game_ids: list) -> list:
+    games = [launchbox_games_by_id.get(game_id) for game_id in game_ids]
+    images_by_title = findImagesForAll([game[TITLE] for game in games if game is not None])
+    resolved_games = []
+    
+    for game_id, game in zip(game_ids, games):
+        if game is None:
+            resolved_games.append({'id' : game_id, 'error' : 'No LaunchBox PS2 game found with this ID'})
+            continue
+        image_list = images_by_title[game[TITLE]]
+        resolved_discs = []
+        
+        for disc_path in game[DISC_PATH]:
+            full_matched_game_list, high_probability_game_list = [], []
+            pcsx2_game_title = getPCSX2GameTitleFrom(disc_path, DISC_PATH)
+            resolved_title = getResolvedTitle(game, disc_path) if not pcsx2_game_title else ''
+            if len(pcsx2_game_title):
+                matched_by = 'Disc Path'
+            elif resolved_title:
+                pcsx2_game_title, matched_by = resolved_title, 'Saved Match'
+            else:
+                full_matched_game_list, high_probability_game_list = searchPCSX2TitlesFor(game[TITLE])
+                if len(full_matched_game_list) == 1:
+                    pcsx2_game_title, matched_by = full_matched_game_list[0], 'Title Search'
+                else:
+                    pcsx2_game_title = getLegacySavedTitle(game, disc_path, full_matched_game_list, high_probability_game_list)
+                    matched_by = 'Saved Match' if pcsx2_game_title else 'Needs A Manual Choice'
+                    pcsx2_game_title = pcsx2_game_title or None
+            
+            source_image = getResolvedImage(game, disc_path)
+            if source_image is None:
+                selection = 1 if len(image_list) == 1 else getSavedChoice(game[TITLE], disc_path, 'Image')
+                source_image = image_list[selection - 1] if len(image_list) >= selection > 0 else None
+            resolved_discs.append({
+                'disc_path' : disc_path,
+                'pcsx2_title' : pcsx2_game_title,
+                'matched_by' : matched_by,
+                'full_matched_titles' : full_matched_game_list,
+                'loosely_matched_titles' : high_probability_game_list,
+                'images' : [str(image_path) for image_path in image_list],
+                'image' : str(source_image) if source_image else None,
+                'cover_image' : str(Path(pcsx2_image_folder) / (pcsx2_game_title.replace(':', ' -') + source_image.suffix))
+                                if pcsx2_game_title and source_image else None,
+            })
+        resolved_games.append({'id' : game[ID], 'title' : game[TITLE], 'discs' : resolved_discs})
+    return resolved_games
+
+
+### Add a sync job that creates cover images for LaunchBox games (by ID) and/or disc paths.
+###     (game_ids) LaunchBox game IDs.
+###     (disc_paths) Disc paths of LaunchBox games.
+###     (use_saved_selections) Reuse previous user choices saved for each game disc.
+###     --> Returns a [dict] The new job
+def enqueueSyncJob(game_ids: list, disc_paths: list, use_saved_selections: bool = True) -> dict:
+    game_list = [launchbox_games_by_id[game_id] for game_id in game_ids if game_id in launchbox_games_by_id]
+    game_list += [GameRecord(game[ID], game[TITLE], disc_path)
+                  for disc_path in disc_paths for game in launchbox_games_by_disc_path.get(disc_path, [])]
+    job = {
+        'id' : next(api_job_ids),
+        'status' : 'Queued',
+        'games' : [game[ID] for game in game_list],
+        'unknown' : [game_id for game_id in game_ids if game_id not in launchbox_games_by_id] +
+                    [disc_path for disc_path in disc_paths if disc_path not in launchbox_games_by_disc_path],
+        'discs' : sum(len(game[DISC_PATH]) for game in game_list),
+        'covers_created' : 0,
+        'queued' : Time.time(),
+        'started' : None,
+        'finished' : None,
+        'error' : None,
+    }
+    with api_jobs_lock:
+        api_jobs[job['id']] = (job, game_list, use_saved_selections)
+    api_job_queue.put(job['id'])
+    return dict(job)
+
+
+### Get a copy of an API sync job (safe to send while the job is still running).
+###     (job_id) The job ID.
+###     --> Returns a [dict] or None if there's no such job (or it expired)
+def getSyncJob(job_id: int) -> dict:
+    with api_jobs_lock:
+        job = api_jobs.get(job_id)
+        return dict(job[0]) if job else None
+
+
+### Remove finished API sync jobs once expired, or the oldest ones once too many are kept.
+### Note: Call while holding "api_jobs_lock".
+def removeFinishedSyncJobs():
+    expire_time = Time.time() - API_JOB_EXPIRE_TIME
+    finished_job_ids = [job_id for job_id, (job, game_list, use_saved_selections) in api_jobs.items() if job['finished']]
+    for i, job_id in enumerate(finished_job_ids):
+        if api_jobs[job_id][0]['finished'] < expire_time or i < len(finished_job_ids) - API_FINISHED_JOBS_KEPT:
+            del api_jobs[job_id]
+
+
+### Run queued sync jobs one after the other. Cover images are created by the "cover_workers" pool and all jobs
+### waiting when a batch starts share a single catalog and image index refresh.
+def runSyncJobs():
+    while True:
+        job_ids = [api_job_queue.get()]
+        while not api_job_queue.empty():
+            job_ids.append(api_job_queue.get())
+        
+        with api_catalog_lock:
+            refreshCatalogsIfChanged()
+        refreshImageIndex()
+        
+        for job_id in job_ids:
+            with api_jobs_lock:
+                job, game_list, use_saved_selections = api_jobs[job_id]
+                job['status'], job['started'] = 'Running', Time.time()
+            try:
+                covers_created = processGameDiscs(iterateGameDiscs(game_list, True), use_saved_selections, True)
+                status, error = 'Done', None
+            except Exception as e:
+                covers_created, status, error = 0, 'Failed', str(e)
+                print(f'\nERROR: Sync job {job_id} failed: {e}')
+            with api_jobs_lock:
+                job['covers_created'], job['status'], job['error'] = covers_created, status, error
+                job['finished'] = Time.time()
+                removeFinishedSyncJobs()
+
+
+### Resolve the games of "/resolve" requests. All requests waiting when a batch starts are resolved together, so
+### they share one image index lookup for all of their games (see: resolveGamesForAPI()).
+def runResolveBatches():
+    while True:
+        requests = [api_resolve_queue.get()]
+        while not api_resolve_queue.empty():
+            requests.append(api_resolve_queue.get())
+        
+        game_ids = [game_id for request_game_ids, future in requests for game_id in request_game_ids]
+        try:
+            with api_catalog_lock:
+                resolved_games = resolveGamesForAPI(game_ids)
+        except Exception as e:
+            for request_game_ids, future in requests:
+                future.set_exception(e)
+            continue
+        
+        first = 0
+        for request_game_ids, future in requests:
+            future.set_result(resolved_games[first:first + len(request_game_ids)])
+            first += len(request_game_ids)
+
+
+### Run the local HTTP/JSON API until Ctrl+C is pressed. Requests are answered from the loaded catalogs and
+### image index, and sync jobs are run in the background.
+###     (port) Local port to listen on.
+def runAPIServer(port: int = 8642):
+    global HTTPServer, HTTPRequestHandler
+    from http.server import BaseHTTPRequestHandler as HTTPRequestHandler, ThreadingHTTPServer as HTTPServer
+    
+    token = RandomBytes(16).hex()
+    
+    ### Handles each HTTP request sent to the API.
+    ### Note: Every request must send the secret token (see: api_file) as an "X-API-Token" header, so web pages open in
+    ###       a browser can't use the API. Requests sent by web pages (Origin header), to any other host name (DNS
+    ###       rebinding), or POST requests that aren't "application/json" are also refused.
+    ###   GET  /search?q=<title>[&list=pcsx2|pcsx2-user|launchbox]   Search a game list (backed by searchFor).
+    ###   GET  /resolve?id=<LaunchBox ID>[&id=...]                   PCSX2 title and LaunchBox image for each game disc.
+###                                                              (Requests sent at the same time share one image lookup.)
+    ###   POST /sync   {"ids" : [...], "discs" : [...], "use_saved_selections" : true}   Queue a cover sync job.
+    ###   GET  /jobs[/<job ID>]                                      Status of all sync jobs or just one.
+    class APIRequestHandler(HTTPRequestHandler):
+        
+        def sendJSON(self, data, status: int = 200):
+            body = JSON.dumps(data).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def isRefused(self, post: bool = False) -> bool:
+            # The token already keeps out web pages on a rebound DNS name, "localhost" is just as local as 127.0.0.1.
+            if (self.headers.get('Host', '').lower() not in [f'127.0.0.1:{port}', f'localhost:{port}'] or
+                self.headers.get('Origin') is not None):
+                self.sendJSON({'error' : 'Only local tools can use the API, not web pages'}, 403)
+            elif self.headers.get('X-API-Token') != token:
+                self.sendJSON({'error' : f'Send the token saved in "{api_file.name}" as an "X-API-Token" header'}, 401)
+            elif post and self.headers.get('Content-Type', '').split(';')[0].strip().lower() != 'application/json':
+                self.sendJSON({'error' : 'Send the request as "application/json"'}, 415)
+            else:
+                return False
+            return True
+        
+        def do_GET(self):
+            if self.isRefused():
+                return
+            url = SplitURL(self.path)
+            query = ParseQuery(url.query)
+            path_parts = [part for part in url.path.split('/') if part]
+            
+            if path_parts == ['search']:
+                search_words = query.get('q', [''])[0]
+                game_list_name = query.get('list', ['pcsx2'])[0]
+                game_lists = {'pcsx2' : (pcsx2_full_game_list, -1), 'pcsx2-user' : (pcsx2_user_game_list, TITLE),
+                              'launchbox' : (launchbox_game_list, TITLE)}
+                if search_words.strip() == '' or game_list_name not in game_lists:
+                    return self.sendJSON({'error' : 'Use "q=<title>" and "list=pcsx2", "pcsx2-user" or "launchbox"'}, 400)
+                with api_catalog_lock:
+                    full_matched_list, high_probability_list = searchFor(search_words, *game_lists[game_list_name])
+                self.sendJSON({
+                    'full_matched' : [getGameAsJSON(game) for game in full_matched_list],
+                    'loosely_matched' : [getGameAsJSON(game) for game in high_probability_list],
+                })
+            
+            elif path_parts == ['resolve']:
+                if 'id' not in query:
+                    return self.sendJSON({'error' : 'Use "id=<LaunchBox game ID>"'}, 400)
+                resolved = Future()
+                api_resolve_queue.put((query['id'], resolved))
+                try:
+                    self.sendJSON({'games' : resolved.result()})
+                except Exception as e:
+                    self.sendJSON({'error' : f'Failed to resolve games: {e}'}, 500)
+            
+            elif path_parts == ['jobs']:
+                with api_jobs_lock:
+                    jobs = [dict(job) for job, game_list, use_saved_selections in api_jobs.values()]
+                self.sendJSON({'jobs' : jobs})
+            
+            elif len(path_parts) == 2 and path_parts[0] == 'jobs':
+                job = getSyncJob(int(path_parts[1])) if path_parts[1].isdigit() else None
+                if job is None:
+                    return self.sendJSON({'error' : f'No job found with the ID "{path_parts[1]}"'}, 404)
+                self.sendJSON(job)
+            
+            else:
+                self.sendJSON({'error' : 'Unknown endpoint'}, 404)
+        
+        def do_POST(self):
+            if self.isRefused(True):
+                return
+            if SplitURL(self.path).path.strip('/') != 'sync':
+                return self.sendJSON({'error' : 'Unknown endpoint'}, 404)
+            try:
+                request = JSON.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                game_ids = [str(game_id) for game_id in request.get('ids', [])]
+                disc_paths = [str(disc_path) for disc_path in request.get('discs', [])]
+                use_saved_selections = bool(request.get('use_saved_selections', True))
+            except (ValueError, AttributeError, TypeError):
+                return self.sendJSON({'error' : 'Send a JSON object: {"ids" : [...], "discs" : [...]}'}, 400)
+            if game_ids == [] and disc_paths == []:
+                return self.sendJSON({'error' : 'No LaunchBox game IDs or disc paths sent'}, 400)
+            with api_catalog_lock:
+                job = enqueueSyncJob(game_ids, disc_paths, use_saved_selections)
+            self.sendJSON(job, 202)
+        
+        def log_message(self, format, *args):
+            pass # Keep the console for cover image output.
+    
+    waitForCatalogs()
+    refreshCatalogsIfChanged()
+    refreshImageIndex()
+    
+    try:
+        server = HTTPServer(('127.0.0.1', port), APIRequestHandler) # Local connections only.
+    except OSError as e:
+        print(f'ERROR: Failed to start the API on port {port}: {e}')
+        return
+    server.daemon_threads = True
+    Thread.Thread(target=runSyncJobs, name='SyncJobs', daemon=True).start()
+    Thread.Thread(target=runResolveBatches, name='ResolveBatches', daemon=True).start()
+    try:
+        saveSecretFile(api_file, JSON.dumps({'port' : port, 'token' : token, 'pid' : PID()}))
+    except OSError as e:
+        print(f'ERROR: Failed to save API file "{api_file.name}", no tool will be able to use the API: {e}')
+    print(f'\n[API Running At http://127.0.0.1:{port}/ (search, resolve, sync, jobs)]')
+    print(f'[Send The Token Saved In "{api_file.name}" As An "X-API-Token" Header With Each Request]')
+    print('[Press Ctrl+C To Stop The API]')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            if JSON.loads(api_file.read_text(encoding='utf-8')).get('pid') == PID():
+                api_file.unlink()
+        except (OSError, ValueError):
+            pass
+    print('\n[API Stopped]')
+
+
+### Start profiling CPU time (cProfile) and/or memory use (tracemalloc) until this script closes.
+### Note: While profiling CPU time, catalogs are loaded in the foreground so they are included in the profile.
+###     (profile_file) Save CPU profile stats (pstats) to this file, None to skip CPU profiling.
+###     (trace_memory) Trace memory allocations and show the largest ones and peak memory use at the end.
+def startProfiling(profile_file: Path = None, trace_memory: bool = False):
+    global CProfile
+    global PStats
+    global TraceMalloc
+    global cpu_profiler
+    global cpu_profile_file
+    
+    if trace_memory:
+        import tracemalloc as TraceMalloc
+        TraceMalloc.start()
+        print('[Tracing Memory Allocations]')
+    
+    if profile_file:
+        import cProfile as CProfile
+        import pstats as PStats
+        cpu_profile_file = Path(profile_file)
+        cpu_profiler = CProfile.Profile()
+        cpu_profiler.enable()
+        print('[Profiling CPU Time]')
+    
+    if profile_file or trace_memory:
+        AtExit.register(stopProfiling)
+
+
+### Stop profiling, save the CPU profile stats to file, and print the top functions and memory allocations.
+def stopProfiling():
+    global cpu_profiler
+    
+    # Memory first, so nothing allocated while printing CPU stats is included.
+    if TraceMalloc and TraceMalloc.is_tracing():
+        snapshot = TraceMalloc.take_snapshot().filter_traces([
+            TraceMalloc.Filter(False, TraceMalloc.__file__),
+            TraceMalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ])
+        current_size, peak_size = TraceMalloc.get_traced_memory()
+        TraceMalloc.stop()
+        print(f'\nTop {PROFILE_TOP_COUNT} Memory Allocations (Still In Use):')
+        for i, statistic in enumerate(snapshot.statistics('lineno')[:PROFILE_TOP_COUNT], 1):
+            frame = statistic.traceback[0]
+            print(f'  {i:>2}.) {statistic.size / 1024:>10.1f} KiB {statistic.count:>8} Blocks  {Path(frame.filename).name}:{frame.lineno}')
+        print(f'\nMemory In Use: {current_size / 1048576:.1f} MiB   Peak Memory Use: {peak_size / 1048576:.1f} MiB')
+    
+    if cpu_profiler:
+        cpu_profiler.disable()
+        profiler = cpu_profiler
+        cpu_profiler = None
+        try:
+            profiler.dump_stats(cpu_profile_file)
+            print(f'\n[CPU Profile Saved To "{cpu_profile_file}"]')
+            print(f'  View with: python -m pstats "{cpu_profile_file}"')
+        except OSError as e:
+            print(f'ERROR: Failed to save CPU profile to "{cpu_profile_file}": {e}')
+        print(f'\nTop {PROFILE_TOP_COUNT} Functions By Cumulative Time:')
+        PStats.Stats(profiler).strip_dirs().sort_stats(PStats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_COUNT)
+
+
+### Print a summary of time spent in each stage and all counters since the last run report.
+###     (title) Shown above the report.
+def printRunReport(title: str = 'Run Report'):
+    with run_report_lock:
+        timings = sorted(run_report_timings.items(), key=lambda timing: timing[1][1], reverse=True)
+        counters = list(run_report_counters.items())
+    
+    showTitleBox([title], '=', 1, 'Center')
+    print(f'  {"Stage":<30}{"Calls":>8}{"Total":>11}{"Average":>11}')
+    for stage, (calls, seconds) in timings:
+        print(f'  {stage:<30}{calls:>8}{seconds:>10.3f}s{seconds / calls * 1000:>9.2f}ms')
+    print(f'  {"Total Run Time":<30}{"":>8}{Time.time() - run_report_started:>10.3f}s')
+    if counters:
+        print()
+        for counter, count in counters:
+            print(f'  {counter:<30}{count:>8}')
+
+
+### Save the run report as a single line of JSON added to the end of a file.
+###     (report_file) The file to add the report to.
+###     (run_type) What kind of run this was ("all", "discs",...).
+###     --> Returns a [bool] Success or Failure
+def saveRunReport(report_file, run_type: str) -> bool:
+    with run_report_lock:
+        report = {
+            'time' : Time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'run' : run_type,
+            'version' : SCRIPT_VERSION,
+            'seconds' : round(Time.time() - run_report_started, 6),
+            'stages' : {stage : {'calls' : calls, 'seconds' : round(seconds, 6)} for stage, (calls, seconds) in run_report_timings.items()},
+            'counters' : dict(run_report_counters),
+        }
+    try:
+        with open(report_file, 'a', encoding='utf-8') as file:
+            file.write(JSON.dumps(report) + '\n')
+        print(f'[Run Report Saved To "{report_file}"]')
+        return True
+    except OSError as e:
+        print(f'ERROR: Failed to save run report to "{report_file}": {e}')
+        return False
+
+
+### Start a new run report (clear all timings and counters).
+def resetRunReport():
+    global run_report_started
+    
+    with run_report_lock:
+        run_report_timings.clear()
+        run_report_counters.clear()
+        run_report_started = Time.time()
 
 
 ### Print list of useful commands and other script details.
 def printHelp():
     print('\nList of Useful Commands:')
     print('  [all]      Will create PCSX2 cover images for all LaunchBox games found.')
+    print('  [plan]     Will show what [all] would do (covers created, overwritten, resized,...) and how long it would take.')
+    print('  [resume]   Will continue the last [all] run that was stopped (or had errors) before finishing.')
     print('  [open]     Will open a dialog window to manually find and select PS2 discs.')
     print('  [list =]   Will list or show all games found in =LaunchBox= or =PCSX2=.')
     print('  [show =]   Will open a file explorer pointing to the =LaunchBox= or =PCSX2= image directory.')
     print('  [settings] Will show all the changeable settings in this script.')
+    print('  [watch]    Will keep creating PCSX2 cover images as LaunchBox images are added or changed.')
+    print('             (Existing cover images of changed games are replaced without asking.)')
+    print('  [report]   Will show how much time was spent in each stage (loading, searching, resizing,...).')
+    print('  [shards]   Will merge and show the results of all sharded [all] runs ("--shard=i/n").')
     print('\nOther Details:')
     print('  Type a "*" after any search to use the previous options already selected for any')
     print('  game title or disc found. Used to speed through back-and-forth image changes.')
     print('  Shorthand: LB = LaunchBox, PS = PCSX2, @ = Open, * = Settings, ? = Help')
     print('  The [show] command is usable at every input prompt.')
+    print('  Start with "--watch" to only run watch mode. Install "watchdog" (pip) to see changes instantly.')
+    print('  Start with "--api" (or "--api=<port>") to run a local HTTP/JSON API: GET /search?q=, GET /resolve?id=,')
+    print('  POST /sync {"ids": [...]} and GET /jobs/<job id>.')
+    print('  Start with "--daemon" to keep everything loaded, then discs dropped onto this script are sent to it')
+    print('  and handled right away (using saved choices). Stop it with Ctrl+C or "--stop-daemon".')
+    print('  Start with "--dry-run" to only show what [all], title searches or dropped discs would do, nothing is written.')
+    print('  (Can\'t be used with "--watch", "--api" or "--daemon".)')
+    print('  Start with "--resume" to continue the last stopped [all] run right away.')
+    print('  Start with "--shard=i/n" to run [all] unattended for only shard i of n (split by LaunchBox game ID), so')
+    print('  several computers/processes can share one library and cover folder. Add "--resume" to continue a shard.')
+    print('  Start with "--report-json=<file>" to save a JSON run report after every "all" or multi-disc run.')
+    print('  Start with "--profile[=<file>]" to save a CPU profile (pstats) or "--trace-memory" to show memory use.')
     print('  Leave the "--->" input prompt blank and press the "Enter" key to close this window.')
 
 
@@ -1553,7 +4745,8 @@ def printGames(app: str, show_id: bool = False):
             if show_id:
                 print(f'Game ID:    {game[ID]}')
             print(f'Game Title: {game[TITLE]}')
-            print(f'Game Disc:  {game[DISC_PATH]}')
+            for disc_path in game[DISC_PATH]:
+                print(f'Game Disc:  {disc_path}')
             print()
 
 
@@ -1632,6 +4825,30 @@ if __name__ == '__main__':
     MIN_VERSION_STR = '.'.join([str(n) for n in MIN_VERSION])
     assert SYS.version_info >= MIN_VERSION, f'This Script Requires Python v{MIN_VERSION_STR} or Newer'
     
+    # Command line options (--option) and quick (multi) disc drop
+    command_line_options = [argument.lower() for argument in SYS.argv[1:] if argument.startswith('--')]
+    dropped_disc_paths = [argument for argument in SYS.argv[1:] if not argument.startswith('--')]
+    
+    # Hand dropped discs to a running daemon and close right away (no catalogs need to be loaded here).
+    if '--stop-daemon' in command_line_options:
+        print('[Daemon Stopping]' if sendToDaemon({'command' : 'stop'}) else '[No Daemon Running]')
+        SYS.exit()
+    if dropped_disc_paths != [] and '--no-daemon' not in command_line_options and not (dry_run or '--dry-run' in command_line_options):
+        response = sendToDaemon({'discs' : dropped_disc_paths})
+        if response and 'accepted' in response:
+            print(f'[{response["accepted"]} Disc(s) Sent To The Running Daemon]')
+            SYS.exit()
+    
+    # Profiling (started before anything is loaded).
+    profile_file = None
+    for argument in SYS.argv[1:]:
+        if argument.lower() == '--profile':
+            profile_file = ROOT / f'{Path(__file__).stem}-Profile.pstats'
+        elif argument.lower().startswith('--profile='):
+            profile_file = Path(argument.split('=', 1)[1])
+    if profile_file or '--trace-memory' in command_line_options:
+        startProfiling(profile_file, '--trace-memory' in command_line_options)
+    
     # Load or create saved user settings and choices from XML file.
     if settings_file.exists():
         loadSettings()
@@ -1639,6 +4856,9 @@ if __name__ == '__main__':
     elif not createSettingsFile():
         print('\nWARNING: This script won\'t work effectively without a settings file.')
     
+    # Clean up any temp cover images left behind by an interrupted run (once the PCSX2 cover folder is known).
+    submitCatalogTask(PCSX2_ROOT, lambda: removeStaleTempCovers(pcsx2_image_folder))
+    
     showTitleBox([SCRIPT_TITLE, SCRIPT_VERSION, SCRIPT_CREATOR], '|\__/|', 2, 'Right')
     
     starting_message = True
@@ -1649,11 +4869,62 @@ if __name__ == '__main__':
     all_games_search = False
     single_title_search = False
     multiple_disc_selections = []
+    resume_batch_run = False
+    plan_run = False # Dry run only this time ("plan" command).
+    batch_disc_count = 0 # Discs processed from the current batch of dropped/selected discs.
     divider = '\n--------------------------------------------------\n'
     
-    # Quick (Multi) Disc Drop
-    if SYS.argv[1:] != []:
-        multiple_disc_selections = SYS.argv[1:]
+    # Quick (multi) disc drop
+    if dropped_disc_paths != []:
+        multiple_disc_selections = dropped_disc_paths
+    
+    if '--dry-run' in command_line_options:
+        dry_run = True
+    if dry_run:
+        writing_options = [option for option in command_line_options if option.partition('=')[0] in ['--watch', '--api', '--daemon']]
+        if writing_options:
+            print(f'ERROR: A dry run can\'t be used with "{writing_options[0].partition("=")[0]}", it always writes cover images.')
+            SYS.exit(1)
+    
+    # Only run "all" for one slice of the library (and never ask, this may be a computer nobody is watching).
+    for argument in SYS.argv[1:]:
+        if argument.lower().startswith('--shard='):
+            batch_shard = parseShard(argument.split('=', 1)[1])
+            if batch_shard is None:
+                print(f'ERROR: Invalid shard "{argument}", use "--shard=i/n" (1 <= i <= n).')
+                SYS.exit(1)
+            batch_journal_file = getShardJournalFile(batch_shard)
+            all_games_search = True
+            use_saved_selections = True
+            search_item = 'all'
+            multiple_disc_selections = []
+    
+    # Continue the last "all" run that was stopped before it finished.
+    if '--resume' in command_line_options:
+        all_games_search = True
+        resume_batch_run = True
+        search_item = 'all'
+        multiple_disc_selections = []
+    for argument in SYS.argv[1:]:
+        if argument.lower().startswith('--report-json='):
+            run_report_file = argument.split('=', 1)[1]
+    
+    # Watch mode, keep PCSX2 cover images updated as LaunchBox images change (and then close).
+    if '--watch' in command_line_options:
+        watchLaunchBoxImages(watch_poll_interval)
+        script_loop = False
+    
+    # HTTP/JSON API mode (and then close).
+    api_option = [option for option in command_line_options if option == '--api' or option.startswith('--api=')]
+    if api_option:
+        port = api_option[0].partition('=')[2]
+        runAPIServer(int(port) if port.isdigit() else api_port)
+        script_loop = False
+    
+    # Daemon mode, keep everything loaded and wait for dropped discs (and then close).
+    if '--daemon' in command_line_options:
+        runDaemon()
+        script_loop = False
     
     ## Quick Testing
     #single_title_search = True
@@ -1663,6 +4934,7 @@ if __name__ == '__main__':
     # Script Loop
     while script_loop:
         if search_item:
+            waitForCatalogs()
             found_game_list = []
             full_matched_game_list = []
             high_probability_game_list = []
@@ -1670,6 +4942,9 @@ if __name__ == '__main__':
             # Find Game Title(s)
             if all_games_search: # All Games, All Discs Search
                 found_game_list = launchbox_game_list
+                if batch_shard:
+                    found_game_list = [game for game in launchbox_game_list if isInShard(game, batch_shard)]
+                    print(f'\n[Shard {batch_shard[0]} Of {batch_shard[1]}: {len(found_game_list)} Of {len(launchbox_game_list)} Games]')
             
             elif single_title_search: # Game Title Search (Multi-Disc)
                 print(divider)
@@ -1725,346 +5000,59 @@ if __name__ == '__main__':
             
             else: # Single Disc Path Search
                 print(divider)
-                for game in launchbox_game_list:
-                    for disc_path in game[DISC_PATH]:
-                        if str(search_item) == disc_path:
-                            found_game_list.append([ game[ID], game[TITLE], [disc_path] ])
+                for game in launchbox_games_by_disc_path.get(str(search_item), []):
+                    found_game_list.append(GameRecord(game[ID], game[TITLE], str(search_item)))
             
             if len(found_game_list) == 0:
                 print(f'No PS2 Games Found In LaunchBox For: {str(search_item)}')
             
-            for game in found_game_list:
-                
+            # Only show what would be done.
+            if dry_run or plan_run:
+                resume_batch_run = False
+                if len(found_game_list):
+                    plan = planGameDiscs(iterateGameDiscs(found_game_list, all_games_search), use_saved_selections,
+                                         batch_shard is not None, all_games_search and auto_image_choice_in_all)
+                    printCoverPlan(plan)
+            
+            else:
+                # Record each completed disc of an "all" run, so it can be resumed if stopped.
+                completed_discs = set()
                 if all_games_search:
-                    print(divider)
+                    completed_discs, use_saved_selections = startBatchJournal(resume_batch_run, use_saved_selections)
+                    resume_batch_run = False
                 
-                print(f'LaunchBox Title Found:')
-                print(f'  {game[TITLE]}')
-                for disc_path in game[DISC_PATH]:
-                    print(f'    {disc_path}')
+                processGameDiscs(iterateGameDiscs(found_game_list, all_games_search, completed_discs), use_saved_selections,
+                                 batch_shard is not None, all_games_search and auto_image_choice_in_all)
                 
-                for disc_path in game[DISC_PATH]:
-                    
-                    pcsx2_game_title_list = []
-                    canceled = False
-                    image_copied = False
-                    image_resized = False
-                    overwritten = False
-                    
-                    # Get PCSX2 game title using a disc path.
-                    pcsx2_game_title = getPCSX2GameTitleFrom(disc_path, DISC_PATH)
-                    if len(pcsx2_game_title): # Exact match has been made
-                        pcsx2_game_title_list.append(pcsx2_game_title)
-                    
-                    # If for whatever reason a game disc match between LaunchBox and PCSX2 fails,
-                    # fallback to a title search that allows user to select the correct title.
-                    else:
-                        selection = 0
-                        search_item = game[TITLE]
-                        alt_search_item = ''
-                        
-                        # Check for numbers and if found, combine two search results using different numbering systems (2 <-> II).
-                        if search_both_number_systems:
-                            alt_search_item = changeNumberSystemIn(search_item)
-                        
-                        # Preform the search (and also an extra alt search if needed).
-                        full_matched_game_list, high_probability_game_list = searchFor(search_item, pcsx2_full_game_list)
-                        if len(alt_search_item):
-                            full_matched_game_list_alt, high_probability_game_list_alt = searchFor(alt_search_item, pcsx2_full_game_list)
-                            # Merge the lists, no repeats/duplicates.
-                            for found_game in full_matched_game_list_alt:
-                                if found_game not in full_matched_game_list:
-                                    full_matched_game_list.append(found_game)
-                            for found_game in high_probability_game_list_alt:
-                                if found_game not in full_matched_game_list and found_game not in high_probability_game_list:
-                                    high_probability_game_list.append(found_game)
-                        
-                        # Auto-select the only full match found or ask for the proper title if more than one.
-                        if len(full_matched_game_list) == 1:
-                            pcsx2_game_title_list.append(full_matched_game_list[selection])
-                        else:
-                            
-                            use_previous_selection = use_saved_selections
-                            
-                            if use_previous_selection:
-                                saved_selection_full = getSavedChoice(game[TITLE], disc_path, 'FullMatched') - 1
-                                saved_selection_loose = getSavedChoice(game[TITLE], disc_path, 'LooseMatched') - 1
-                                
-                                if len(full_matched_game_list) > saved_selection_full > -1:
-                                    pcsx2_game_title_list.append(full_matched_game_list[saved_selection_full])
-                                elif len(high_probability_game_list) > saved_selection_loose > -1:
-                                    pcsx2_game_title_list.append(high_probability_game_list[saved_selection_loose])
-                                else:
-                                    use_previous_selection = False
-                            
-                            if not use_previous_selection:
-                                
-                                if len(full_matched_game_list) > 1:
-                                    print(f'\nLaunchBox Title Found:')
-                                    print(f'  {game[TITLE]}')
-                                    print(f'    {disc_path}')
-                                    selection = selectionMenu(
-                                        ['Multiple very similarly matched titles found in the search results.',
-                                         f'Try to match one of these PCSX2 titles with the LaunchBox game title and path above.'],
-                                        full_matched_game_list,
-                                        '-- None Of The Above Match, Expand Search? --',
-                                        2 if len(full_matched_game_list) > 9 else 1
-                                    )
-                                    updateSavedChoice(game[TITLE], disc_path, 'FullMatched', selection)
-                                
-                                if selection == 0:
-                                    if len(high_probability_game_list):
-                                        print(f'\nLaunchBox Title Found:')
-                                        print(f'  {game[TITLE]}')
-                                        print(f'    {disc_path}')
-                                        selection = selectionMenu(
-                                            ['No matching titles found, but here are some loosely matched search results.',
-                                             f'Try to match one of these PCSX2 titles with the LaunchBox game title and path above.'],
-                                            high_probability_game_list,
-                                            '-- None Of The Above Match, Try Searching For Another Game? --',
-                                            2 if len(high_probability_game_list) > 9 else 1
-                                        )
-                                        if selection:
-                                            updateSavedChoice(game[TITLE], disc_path, 'LooseMatched', selection)
-                                    
-                                    if selection == 0:
-                                        print(f'\nNo Matching PCSX2 Titles Found For:')
-                                        print(f'  {game[TITLE]}')
-                                        print(f'    {disc_path}')
-                                        continue
-                                    else:
-                                        pcsx2_game_title_list.append(high_probability_game_list[selection - 1])
-                                else:
-                                    pcsx2_game_title_list.append(full_matched_game_list[selection - 1])
-                    
-                    print(f'\nMatching PCSX2 Title Found:')
-                    for pcsx2_game_title in pcsx2_game_title_list:
-                        print(f'  {pcsx2_game_title}')
-                    
-                    # Find all reletive matching LaunchBox image files.
-                    image_list = []
-                    image_search_query = game[TITLE].replace(':', '_').replace('\'', '_').replace('\\\\', '_').replace('\\', '_').replace('//', '_').replace('/', '_')
-                    if launchbox_media_type == MEDIA_TYPE_ALL:
-                        for lb_media_type, lb_image_dir in launchbox_media_type_list:
-                            lb_image_dir = Path(lb_image_dir)
-                            if lb_image_dir.exists():
-                                for lb_image_path in lb_image_dir.rglob('*'): # Recursive Search
-                                    if lb_image_path.is_file() and lb_image_path.suffix.lower() in supported_images:
-                                        if getIndexOf(image_search_query, lb_image_path.stem) > -1:
-                                            image_list.append(lb_image_path)
-                    else:
-                        for lb_image_path in Path(launchbox_image_folder).rglob('*'): # Recursive Search
-                            if lb_image_path.is_file() and lb_image_path.suffix.lower() in supported_images:
-                                if getIndexOf(image_search_query, lb_image_path.stem) > -1:
-                                    image_list.append(lb_image_path)
-                    images_found = len(image_list)
-                    
-                    if (images_found > 0):
-                        selection = 1 # 0 index
-                        
-                        # Select the cover image to copy over if more than one found.
-                        if (images_found > 1):
-                            
-                            use_previous_selection = use_saved_selections
-                            
-                            if use_previous_selection:
-                                saved_selection_image = getSavedChoice(game[TITLE], disc_path, 'Image')
-                                
-                                if len(image_list) >= saved_selection_image > 0:
-                                    selection = saved_selection_image
-                                else:
-                                    use_previous_selection = False
-                            
-                            if not use_previous_selection:
-                                selection = selectionMenu(
-                                    ['Multiple images found, choose which image file to copy to the PCSX2 cover folder.'],
-                                    image_list, 'Cancel/Skip'
-                                )
-                                if selection:
-                                    updateSavedChoice(game[TITLE], disc_path, 'Image', selection)
-                                else:
-                                    canceled = True
-                        
-                        if not canceled:
-                            for pcsx2_game_title in pcsx2_game_title_list:
-                                
-                                source_image = image_list[selection - 1]
-                                
-                                # Create a new destination/save path
-                                new_image_file_name = pcsx2_game_title.replace(':', ' -') + source_image.suffix
-                                destination_image = pcsx2_image_folder / new_image_file_name
-                                
-                                print(f'\nLaunchBox Image Found:')
-                                print(f'  Source Path:      {str(source_image)}')
-                                print(f'  Destination Path: {str(destination_image)}')
-                                
-                                # Get all existing images with the same name minus extension. Only one image can be shown per game in PCSX2,
-                                # but multple images can have the same game title with different extensions.
-                                existing_images = []
-                                destination_directory = destination_image.parent
-                                for file in destination_directory.glob('*'):
-                                    if file.is_file() and file.suffix.lower() in supported_images:
-                                        if file.stem == destination_image.stem:
-                                            existing_images.append(file)
-                                
-                                if len(existing_images):
-                                    use_previous_selection = use_saved_selections
-                                    selection = 0
-                                    
-                                    if use_previous_selection:
-                                        saved_selection_image = getSavedChoice(game[TITLE], disc_path, 'Overwrite')
-                                        if saved_selection_image == 1:
-                                            selection = saved_selection_image
-                                        else:
-                                            use_previous_selection = False
-                                    
-                                    if not use_previous_selection:
-                                        if always_overwrite:
-                                            selection = 1
-                                        else:
-                                            selection = selectionMenu(
-                                                ['An image file of the same name already exists in the PCSX2 cover image folder.',
-                                                'How do you wish to proceed?'],
-                                                ['Overwrite', 'Rename'], 'Cancel/Skip'
-                                            )
-                                            if selection == 1:
-                                                updateSavedChoice(game[TITLE], disc_path, 'Overwrite', selection)
-                                            else:
-                                                # Only the "Overwrite" option can be saved and reused.
-                                                # If another option is selected, remove previous choice.
-                                                removeSavedChoice(game[TITLE], disc_path, 'Overwrite')
-                                    
-                                    # Temporally rename existing file that will later be deleted/overwritten
-                                    # (or reverted back to original name if file copy fails).
-                                    if selection == 1:
-                                        overwritten = True
-                                        existing_images = initiateOverwritingOf(destination_image, existing_images)
-                                    
-                                    # Rename cover image file.
-                                    elif selection == 2:
-                                        while True:
-                                            new_cover_image_name = input(f'\nEnter the new cover image name (existing name = "{destination_image.stem}"): ')
-                                            
-                                            illegal_characters_found = RE.search(r'\*|\\|\||\:|\"|\<|\>|\/|\?', new_cover_image_name)
-                                             
-                                            # Allow the use of the "show" command here.
-                                            if isCommand(new_cover_image_name, True):
-                                                continue
-                                            
-                                            elif illegal_characters_found:
-                                                print('  One or more illegal file name characters found, please try again.')
-                                                print('  Note: A file name can\'t contain any of the following characters: \\ / : * ? " < > |')
-                                                continue
-                                            
-                                            # No Change
-                                            elif new_cover_image_name == '' or new_cover_image_name == destination_image.stem:
-                                                selection = selectionMenu(
-                                                    ['A blank or identical name was submitted.'],
-                                                    ['Try Again', 'Just Overwrite'], 'Cancel/Skip'
-                                                )
-                                                if selection == 1:
-                                                    continue # Try Again
-                                                elif selection == 2:
-                                                    overwritten = True
-                                                    existing_images = initiateOverwritingOf(destination_image, existing_images)
-                                                    updateSavedChoice(game[TITLE], disc_path, 'Overwrite', 1)
-                                                    break
-                                                else:
-                                                    canceled = True
-                                                    break
-                                            
-                                            # Change
-                                            new_image_file_name = new_cover_image_name + source_image.suffix
-                                            dest_image = pcsx2_image_folder / new_image_file_name
-                                            if dest_image.exists():
-                                                print(f'  This name "{new_cover_image_name}" already exists, please try again.')
-                                            else:
-                                                destination_image = dest_image
-                                                break
-                                    
-                                    # Cancel copying and skip this game disc.
-                                    elif selection == 0:
-                                        canceled = True
-                                
-                                if canceled:
-                                    print('\nCanceled!')
-                                    canceled = False
-                                else:
-                                    # Copy (and if set, resize) a new cover image to a new location.
-                                    if resize_cover_image > 0:
-                                        print()
-                                        image_copied = image_resized = resizeCoverImage(source_image, resize_cover_image, destination_image)
-                                    
-                                    # If image resizing din't happen for whatever reason, just copy the image to new location.
-                                    if not image_copied:
-                                        try:
-                                            CopyFile(str(source_image), str(destination_image))
-                                            image_copied = True
-                                        except FileNotFoundError:
-                                            print(f'\nERROR: Source image "{source_file}" not found.')
-                                        except PermissionError:
-                                            print(f'\nERROR: Permission denied when copying "{source_file}" to "{destination_file}".')
-                                        except shutil.SameFileError:
-                                            print(f'\nERROR: Source and destination images are the same: "{source_file}".')
-                                        except Exception as e:
-                                            print(f'\nERROR: Failed copying: "{source_file}" to "{destination_file}"\nAn unexpected error occurred: {e}')
-                                    
-                                    if image_copied:
-                                        print(f'\nLaunchBox Image:\n  "{str(source_image)}"')
-                                        if image_resized:
-                                            print(f'Copied and Resized Successfully To The PCSX2 Folder:')
-                                        else:
-                                            print(f'Copied Successfully To The PCSX2 Folder:')
-                                        print(f'  "{str(destination_image)}"')
-                                    
-                                    # Delete renamed/overwritten temp file (and others in existing_images) if copy successful.
-                                    if overwritten and image_copied:
-                                        for deleted_image in existing_images:
-                                            try:
-                                                deleted_image.unlink() #missing_ok=True
-                                            except PermissionError:
-                                                print(f'ERROR: Permission denied while attempting to delete file: "{deleted_image}".')
-                                            except IsADirectoryError:
-                                                print(f'ERROR: "{deleted_image}" is a directory, not a file. Use rmdir() or shutil.rmtree().')
-                                            except FileNotFoundError:
-                                                print(f'ERROR: This file "{deleted_image}" not found.')
-                                            except Exception as e:
-                                                print(f'ERROR: Failed to delete file: "{deleted_image}"\nAn unexpected error occurred: {e}')
-                                    
-                                    # ...Or revert the renamed temp file back to its original name.
-                                    elif overwritten:
-                                        for image in existing_images:
-                                            if '.tmp' in image.suffix:
-                                                try:
-                                                    image.rename(destination_image)
-                                                except FileNotFoundError:
-                                                    print(f'ERROR: The temp file "{image}" was not found.')
-                                                except IsADirectoryError:
-                                                    print(f'ERROR: Cannot rename a file to an existing directory: "{destination_image}".')
-                                                except NotADirectoryError:
-                                                    print(f'ERROR: Cannot rename a directory to an existing file: "{destination_image}".')
-                                                except PermissionError:
-                                                    print(f'ERROR: Permission denied. Unable to rename "{image}".')
-                                                except OSError as e:
-                                                    print(f'ERROR: Failed to rename file: "{image}"\nAn unexpected error occurred: {e}')
-                    else:
-                        print(f'\nNo Cover Images Found For The Game: {game[TITLE]}')
+                if all_games_search:
+                    finishBatchJournal()
+            
+            # Report where the time went after a batch run.
+            if all_games_search or (batch_disc_count > 1 and len(multiple_disc_selections) == 0):
+                printRunReport('All Games Run Report' if all_games_search else 'Multi-Disc Run Report')
+                if run_report_file:
+                    saveRunReport(run_report_file, 'all' if all_games_search else 'discs')
+                resetRunReport()
             
             search_item = None
             if len(multiple_disc_selections) == 0:
+                batch_disc_count = 0
                 print(divider[:-1])
         
         else:
             # One or more file paths found. Go through list one by one.
             if len(multiple_disc_selections):
                 search_item = Path(multiple_disc_selections.pop(0).strip())
+                batch_disc_count += 1
                 command_prompt_loop = False
             else:
-                command_prompt_loop = loop_script
-                script_loop = loop_script
+                # A shard run closes once finished, no one may be there to type the next command.
+                script_loop = loop_script and batch_shard is None
+                command_prompt_loop = script_loop
                 use_saved_selections = False
                 all_games_search = False
                 single_title_search = False
+                plan_run = False
             
             # Command Prompt:
             while command_prompt_loop:
@@ -2098,6 +5086,16 @@ if __name__ == '__main__':
                     all_games_search = True
                     search_item = user_input
                     break
+                elif user_input.lower() == 'plan':
+                    plan_run = True
+                    all_games_search = True
+                    search_item = user_input
+                    break
+                elif user_input.lower() == 'resume':
+                    all_games_search = True
+                    resume_batch_run = True
+                    search_item = user_input
+                    break
                 elif user_input.lower() == 'open' or user_input.lower() == '@':
                     multiple_disc_selections = selectPS2Discs()
                     break
@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+LaunchBox To PCSX2 Cover Image - Watch Mode Test
+  by JDHatten
+
+    Description:
+        Runs watch mode (polling, so it works without the "watchdog" module on any OS) against a
+        synthetic LaunchBox and PCSX2 install from the benchmark and checks that changing a
+        LaunchBox image rewrites the PCSX2 cover image of its game (also when overwriting
+        existing cover images isn't allowed otherwise).
+
+    To Use:
+        python -m pytest tests
+        python -m unittest discover tests
+
+'''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from contextlib import redirect_stdout as RedirectOutput
+import importlib.util as ImportUtil
+from io import BytesIO
+from os import devnull as DEV_NULL, utime as SetFileTimes
+from pathlib import Path
+from shutil import rmtree as RemoveTree
+from tempfile import mkdtemp as MakeTempDirectory
+import time as Time
+import unittest
+
+try:
+    from PIL import Image
+except ModuleNotFoundError:
+    Image = None
+
+
+ROOT = Path(__file__).parent.parent
+BENCHMARK_FILE = ROOT / 'LaunchBox-To-PCSX2-Cover-Image-Benchmark.py'
+NEW_COLOR = (200, 30, 30) # The changed LaunchBox image is red, the benchmark's images are blue.
+
+
+### Import the benchmark script, it creates the synthetic LaunchBox and PCSX2 install.
+###     --> Returns the benchmark [module]
+def loadBenchmark():
+    spec = ImportUtil.spec_from_file_location('launchbox_to_pcsx2_cover_image_benchmark', BENCHMARK_FILE)
+    module = ImportUtil.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipIf(Image is None, 'Pillow is needed to create the LaunchBox images.')
+class WatchModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bench_dir = Path(MakeTempDirectory(prefix='lb2pcsx2-test-'))
+        benchmark = loadBenchmark()
+        self.fixtures = benchmark.createFixtures(self.bench_dir, 5, (60, 90))
+        self.script = benchmark.loadScript(self.fixtures['script'])
+
+    def tearDown(self):
+        self.script.waitForCatalogs()
+        RemoveTree(self.bench_dir, ignore_errors=True)
+
+    ### Create every cover image, then change one LaunchBox image while watch mode is polling.
+    ###     --> Returns a [tuple] ( Cover Image Of The Changed Game, { Other Cover Image : Modified Time } )
+    def changeImageWhileWatching(self) -> (Path, dict):
+        script = self.script
+        title = self.fixtures['games'][2][0]
+        image_path = self.fixtures['image_folder'] / f'{title}-01.jpg'
+        cover_path = self.fixtures['cover_folder'] / f'{title}.jpg'
+
+        with open(DEV_NULL, 'w') as quiet, RedirectOutput(quiet):
+            script.processGameDiscs(script.iterateGameDiscs(script.launchbox_game_list), False, True)
+        self.assertTrue(cover_path.exists())
+        other_covers = {cover: cover.stat().st_mtime_ns for cover in self.fixtures['cover_folder'].glob('*.jpg')
+                        if cover != cover_path}
+
+        # Change the LaunchBox image right after watch mode takes its first look at the image folders.
+        scanWatchedPaths = script.scanWatchedPaths
+        def scanThenChangeImage(*args):
+            file_stats = scanWatchedPaths(*args)
+            if not image_changed:
+                image_data = BytesIO()
+                Image.new('RGB', (60, 90), NEW_COLOR).save(image_data, 'JPEG', quality=95)
+                image_path.write_bytes(image_data.getvalue())
+                SetFileTimes(image_path, (Time.time() + 10, Time.time() + 10))
+                image_changed.append(image_path)
+            return file_stats
+        image_changed = []
+        script.scanWatchedPaths = scanThenChangeImage
+
+        # 1st check sees the change, 2nd sees it has settled and rewrites the cover image.
+        with open(DEV_NULL, 'w') as quiet, RedirectOutput(quiet):
+            script.watchLaunchBoxImages(0, force_polling=True, max_checks=2)
+        return cover_path, other_covers
+
+    ### Check the cover image now shows the changed LaunchBox image and no other cover image was written.
+    def assertOnlyCoverRewritten(self, cover_path: Path, other_covers: dict):
+        with Image.open(cover_path) as cover:
+            red, green, blue = cover.convert('RGB').getpixel((cover.width // 2, cover.height // 2))
+        self.assertGreater(red, 150)
+        self.assertLess(green, 80)
+        for cover, modified_time in other_covers.items():
+            self.assertEqual(cover.stat().st_mtime_ns, modified_time, f'Unchanged game rewritten: {cover.name}')
+
+    def test_polling_rewrites_cover_of_changed_image(self):
+        self.assertOnlyCoverRewritten(*self.changeImageWhileWatching())
+
+    def test_polling_rewrites_cover_with_default_overwrite_setting(self):
+        # The benchmark settings always overwrite, go back to the default (ask, and never overwrite unattended).
+        self.script.always_overwrite = False
+        self.assertOnlyCoverRewritten(*self.changeImageWhileWatching())
+
+
+if __name__ == '__main__':
+    unittest.main()